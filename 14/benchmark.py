@@ -0,0 +1,154 @@
+import copy
+import gc
+import sys
+import time
+import types
+from convert import Convert
+from dealer.dealer import Dealer
+from dealer.player import Player
+from dealer.globals import *
+
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def make_live_games(num_games, num_players, turns, base_seed=0):
+    """
+    Creates seeded games and plays each for the given number of turns, as a simulation worker holding
+    many live games would
+    :param num_games: Natural representing the number of games to create
+    :param num_players: Natural between 3 and 8 representing the number of Players in each game
+    :param turns: Natural representing the number of turns to play in each game
+    :param base_seed: Natural seed of the first game
+    :return: List of Dealer
+    """
+    dealers = []
+    for i in range(num_games):
+        dealer = Dealer.create_initial([Player(id=x + 1) for x in range(num_players)], base_seed + i)
+        for turn in range(turns):
+            if dealer.game_over():
+                break
+            dealer.run_turn()
+        dealers.append(dealer)
+    return dealers
+
+
+def footprint(roots):
+    """
+    Counts every object reachable from the given roots, and their sizes. Objects shared between roots,
+    such as interned TraitCards, are counted once. Classes, modules and functions are not counted.
+    :param roots: List of objects to walk from
+    :return: (Natural, Natural, Dictionary {String: Natural}) the object count, the bytes they occupy
+             and the object count per type name
+    """
+    seen = set([id(roots)])
+    pending = list(roots)
+    count, size, per_type = 0, 0, {}
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        count += 1
+        size += sys.getsizeof(obj)
+        type_name = type(obj).__name__
+        per_type[type_name] = per_type.get(type_name, 0) + 1
+        pending.extend(gc.get_referents(obj))
+    return (count, size, per_type)
+
+
+def memory_report(num_games=200, num_players=6, turns=2):
+    """
+    Renders the per-game object count and memory footprint of live, part-played games
+    :param num_games: Natural representing the number of live games
+    :param num_players: Natural between 3 and 8 representing the number of Players in each game
+    :param turns: Natural representing the number of turns played in each game
+    :return: String
+    """
+    dealers = make_live_games(num_games, num_players, turns)
+    (count, size, per_type) = footprint(dealers)
+    report = ["%d live games, %d players, %d turns" % (num_games, num_players, turns),
+              "objects per game: %.1f" % (float(count) / num_games),
+              "bytes per game: %.1f" % (float(size) / num_games)]
+    for type_name in sorted(per_type, key=lambda name: -per_type[name]):
+        report.append("    %s: %.1f" % (type_name, float(per_type[type_name]) / num_games))
+    return "\n".join(report)
+
+
+def list_validate_cards(dealer):
+    """
+    Validates a Dealer's cards as validate_cards used to, by removing each card from a freshly built list of the
+    full deck. Kept as the baseline for validation_report.
+    :param dealer: the Dealer to validate
+    :raise ValueError if duplicate or invalid cards exist
+    """
+    total_deck = Dealer.make_deck()
+    cards = list(dealer.deck)
+    for player in dealer.list_of_players:
+        cards += player.hand
+        for species in player.species:
+            cards += species.traits
+    for card in cards:
+        if card.food_points is not False:
+            total_deck.remove(card)
+
+
+def validation_report(num_games=200, num_players=6, turns=2, repeats=5):
+    """
+    Renders the time taken to validate the cards of live, part-played games with Dealer.validate_cards and with
+    the list-based baseline
+    :param num_games: Natural representing the number of live games
+    :param num_players: Natural between 3 and 8 representing the number of Players in each game
+    :param turns: Natural representing the number of turns played in each game
+    :param repeats: Natural+ representing the number of times each game is validated
+    :return: String
+    """
+    dealers = make_live_games(num_games, num_players, turns)
+    report = ["%d live games, %d players, %d turns" % (num_games, num_players, turns)]
+    for (name, validate) in [("counts", Dealer.validate_cards), ("list", list_validate_cards)]:
+        start_time = time.time()
+        for repeat in range(repeats):
+            for dealer in dealers:
+                validate(dealer)
+        elapsed = time.time() - start_time
+        report.append("%s: %.1f microseconds per validation" % (name, 1e6 * elapsed / (num_games * repeats)))
+    return "\n".join(report)
+
+
+def snapshot_and_restore(dealer):
+    dealer.restore(dealer.snapshot())
+
+
+def json_round_trip(dealer):
+    return Convert.json_to_dealer(dealer.convert_to_json())
+
+
+def clone_report(num_games=200, num_players=6, turns=2, repeats=5):
+    """
+    Renders the time taken to clone live, part-played games with Dealer.snapshot and restore, with Dealer.fork,
+    and with the deep copy and JSON round trip they replace
+    :param num_games: Natural representing the number of live games
+    :param num_players: Natural between 3 and 8 representing the number of Players in each game
+    :param turns: Natural representing the number of turns played in each game
+    :param repeats: Natural+ representing the number of times each game is cloned
+    :return: String
+    """
+    dealers = make_live_games(num_games, num_players, turns)
+    report = ["%d live games, %d players, %d turns" % (num_games, num_players, turns)]
+    for (name, clone) in [("snapshot", snapshot_and_restore), ("fork", Dealer.fork),
+                          ("deepcopy", copy.deepcopy), ("json", json_round_trip)]:
+        start_time = time.time()
+        for repeat in range(repeats):
+            for dealer in dealers:
+                clone(dealer)
+        elapsed = time.time() - start_time
+        report.append("%s: %.1f microseconds per clone" % (name, 1e6 * elapsed / (num_games * repeats)))
+    return "\n".join(report)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["validation"]:
+        print validation_report(*[int(arg) for arg in sys.argv[2:5]])
+    elif sys.argv[1:2] == ["clone"]:
+        print clone_report(*[int(arg) for arg in sys.argv[2:5]])
+    else:
+        print memory_report(*[int(arg) for arg in sys.argv[1:4]])
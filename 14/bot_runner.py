@@ -0,0 +1,174 @@
+import json
+import select
+import socket
+import time
+from dealer_proxy import DealerProxy
+from stream_decoder import StreamDecoder
+from tournament import STRATEGIES
+from dealer.globals import *
+
+
+class Bot(object):
+    """
+    One bot player connected to the server. Reacts to the bytes that arrive on its connection instead of
+    blocking on them, so that one BotRunner can drive many Bots at once, and times every exchange.
+    """
+    def __init__(self, name, strategy, sock, features=FEATURES):
+        """
+        Creates a Bot and signs it up with the server
+        :param name: String the Bot signs up with
+        :param strategy: String naming the strategy in STRATEGIES the Bot plays
+        :param sock: Socket connected to the server
+        :param features: List of the protocol extensions to offer at sign-up, or False for the original protocol
+        :return: a Bot object
+        """
+        self.name = name
+        self.strategy = strategy
+        self.socket = sock
+        self.decoder = StreamDecoder(sock)
+        self.dealer_proxy = DealerProxy(STRATEGIES[strategy](), sock, self.decoder)
+        self.signed_up = False
+        self.replied_at = False
+        self.messages = 0
+        self.waits = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.think_total = 0.0
+        self.error = False
+        self.socket.sendall(json.dumps([name, features] if features else name))
+
+    def fileno(self):
+        """
+        Lets the BotRunner select on this Bot as on its connection
+        :return: Int representing the file descriptor of this Bot's socket
+        """
+        return self.socket.fileno()
+
+    def receive(self):
+        """
+        :effect Handles every message completed by the bytes waiting on the connection and answers them
+        Any error, whether from the connection, the server's messages or this Bot's strategy, stops only this Bot
+        and is kept to be reported.
+        :return: True if the Bot is still playing, False if the connection closed or the Bot failed
+        """
+        try:
+            data = self.socket.recv(RECV_SIZE)
+            arrived = time.time()
+            if not data:
+                return False
+            self.decoder.feed(data)
+            while self.decoder.messages:
+                if not self.answer(self.decoder.messages.popleft(), arrived):
+                    return False
+        except Exception as error:
+            self.error = error
+            return False
+        return True
+
+    def answer(self, message, arrived):
+        """
+        :effect Handles one message from the server, sends the answer and records the time taken
+        :param message: JSON message from the server
+        :param arrived: Number representing the time.time() at which the message arrived
+        :return: True if the message was part of the protocol, else False
+        """
+        if not self.signed_up:
+            self.signed_up = message == SIGNUP_RSP or (isinstance(message, list) and message[:1] == [SIGNUP_RSP])
+            return self.signed_up
+        if self.replied_at:
+            wait = arrived - self.replied_at
+            self.waits += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            self.replied_at = False
+        reply = self.dealer_proxy.handle(message)
+        if reply is not None:
+            self.socket.sendall(json.dumps(reply))
+            self.replied_at = time.time()
+            self.think_total += self.replied_at - arrived
+            self.messages += 1
+        return True
+
+    def close(self):
+        """
+        :effect Closes this Bot's connection to the server
+        """
+        self.socket.close()
+
+    def render(self):
+        """
+        Renders the latency of this Bot's exchanges with the server: the wait from each answer to the next
+        message, and the time taken to answer, followed by the error that stopped it, if any
+        :return: String
+        """
+        line = BOT_TEMPLATE % (self.name, self.strategy, self.messages, 1000 * self.wait_total / max(1, self.waits),
+                               1000 * self.wait_max, 1000 * self.think_total / max(1, self.messages))
+        if self.error:
+            line += BOT_ERROR_TEMPLATE % (type(self.error).__name__, self.error)
+        return line
+
+
+class BotRunner(object):
+    """
+    Plays many bot players against a server from a single process, waiting on all of their connections at
+    once and answering whichever has a message
+    """
+    def __init__(self):
+        """
+        Creates a BotRunner
+        :return: a BotRunner object
+        """
+        self.bots = []
+        self.finished = []
+        self.elapsed = 0.0
+
+    def connect(self, hostname, port, strategies, features=FEATURES):
+        """
+        :effect Connects one Bot for each of the given strategies to the server and signs it up
+        :param hostname: String representing the TCP server hostname
+        :param port: Natural representing the TCP server port
+        :param strategies: List of String naming the strategy in STRATEGIES of each Bot
+        :param features: List of the protocol extensions the Bots offer, or False for the original protocol
+        """
+        for strategy in strategies:
+            sock = socket.create_connection((hostname, port))
+            self.add(Bot("bot%d" % (len(self.bots) + len(self.finished) + 1), strategy, sock, features))
+
+    def add(self, bot):
+        """
+        :effect Adds a signed-up Bot to those this BotRunner plays
+        :param bot: a Bot
+        """
+        self.bots.append(bot)
+
+    def run(self, time_out=False):
+        """
+        Plays every Bot until the server has closed all of their connections
+        :param time_out: Number of seconds after which to stop playing, or False to play until the end
+        :effect: Closes each Bot's connection as it finishes and records the wall-clock time taken
+        """
+        start_time = time.time()
+        while self.bots:
+            remaining = start_time + time_out - time.time() if time_out else None
+            if remaining is not None and remaining <= 0:
+                break
+            (readable, writable, failed) = select.select(self.bots, [], [], remaining)
+            for bot in readable:
+                if not bot.receive():
+                    bot.close()
+                    self.bots.remove(bot)
+                    self.finished.append(bot)
+        self.elapsed = time.time() - start_time
+
+    def render_report(self):
+        """
+        Renders the latency of every Bot, followed by throughput
+        :return: String
+        """
+        bots = self.finished + self.bots
+        messages = sum([bot.messages for bot in bots])
+        report = [bot.render() for bot in bots]
+        report.append(BOTS_TEMPLATE % (len(bots), len([bot for bot in bots if not bot.signed_up]),
+                                       len([bot for bot in bots if bot.error]), messages, self.elapsed,
+                                       messages / self.elapsed if self.elapsed else 0.0))
+        return "\n".join(report)
@@ -0,0 +1,84 @@
+import unittest
+import socket
+import json
+import threading
+
+from bot_runner import Bot, BotRunner
+from player_proxy import PlayerProxy
+from stream_decoder import StreamDecoder
+from convert import Convert
+from dealer.dealer import Dealer
+from dealer.player import Player
+from dealer.globals import *
+
+
+class Handler(object):
+    """
+    Stands in for the server's request handler, holding the connection to the client
+    """
+    def __init__(self, request):
+        self.request = request
+
+
+class TestBotRunner(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = BotRunner()
+        self.proxies = []
+        self.sockets = []
+        for i in range(4):
+            (server, client) = socket.socketpair()
+            self.sockets.append(server)
+            self.runner.add(Bot("bot%d" % (i + 1), DEFAULT_STRATEGY, client, FEATURES if i % 2 else False))
+            decoder = StreamDecoder(server)
+            [name, features] = Convert.json_to_signup(decoder.read(1))
+            server.sendall(json.dumps([SIGNUP_RSP, features] if features else SIGNUP_RSP))
+            self.proxies.append(PlayerProxy(i + 1, Handler(server), decoder, features=features))
+
+    def tearDown(self):
+        for server in self.sockets:
+            server.close()
+        for bot in self.runner.bots:
+            bot.close()
+
+    def test_remote_game(self):
+        bots = threading.Thread(target=self.runner.run, args=(10,))
+        bots.start()
+        dealer = Dealer.create_initial(self.proxies, 7)
+        dealer.run_game()
+        for proxy in self.proxies:
+            proxy.close()
+        bots.join(10)
+
+        local_dealer = Dealer.create_initial([Player(id=x + 1) for x in range(4)], 7)
+        local_dealer.run_game()
+        self.assertEqual(dealer.compute_scores(), local_dealer.compute_scores())
+        self.assertEqual(self.runner.bots, [])
+        self.assertEqual(len(self.runner.finished), 4)
+        self.assertTrue(all([bot.signed_up and bot.messages > 0 for bot in self.runner.finished]))
+        self.assertEqual(len(self.runner.render_report().split("\n")), 5)
+
+    def test_failing_strategy(self):
+        self.runner.bots[0].dealer_proxy.player.choose = None
+        bots = threading.Thread(target=self.runner.run, args=(10,))
+        bots.start()
+        dealer = Dealer.create_initial(self.proxies, 7)
+        dealer.run_game()
+        for proxy in self.proxies:
+            proxy.close()
+        bots.join(10)
+        failed = [bot for bot in self.runner.finished if bot.error]
+        self.assertEqual([bot.name for bot in failed], ["bot1"])
+        self.assertIsInstance(failed[0].error, TypeError)
+        self.assertIn("failed: TypeError", failed[0].render())
+        self.assertEqual(len(self.runner.finished), 4)
+        self.assertEqual([player.name for player in dealer.list_of_players], [2, 3, 4])
+
+    def test_time_out(self):
+        self.runner.run(0.1)
+        self.assertEqual(len(self.runner.bots), 4)
+        self.assertTrue(self.runner.elapsed < 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,6 @@ from dealer.species import Species
 from dealer.traitcard import TraitCard
 from dealer.action4 import Action4
 from dealer.action import *
-import time
 from dealer.feeding_choice import *
 import json
 
@@ -17,42 +16,20 @@ class Convert(object):
     def __init__(self):
         pass
 
-# ======================================  JSON Reading ==========================================
+# ======================================  Sign Up ==========================================
 
     @classmethod
-    def json_parser(cls, buffer):
-        """
-        Searches for full JSON messages and adds incomplete messages to a buffer
-        :param buffer: the previous lines of incomplete JSON messages
-        :return: a tuple of (list-of-correct_JSON_messages, current buffer)
-        """
-        decoder = json.JSONDecoder()
-        decoded_json = []
-        try:
-            while True:
-                (json_obj, end_index) = decoder.raw_decode(buffer)
-                decoded_json.append(json_obj)
-                buffer = buffer[end_index:]
-        except:
-            return (decoded_json, buffer)
-
-    @classmethod
-    def listen(cls, socket, time_out=TIMEOUT):
-        """
-        Waits for the first valid json message from the socket and returns it.
-        Returns if no message is received in the min time allowed.
-        :param time_out: Int representing time to wait before exiting, or False if no timeout
-        :return: first complete JSON message read
-        """
-        buffer = ""
-        decoded_json = []
-        start_time = time.time()
-        while not decoded_json:
-            buffer += socket.recv(1024).strip()
-            (decoded_json, buffer) = Convert.json_parser(buffer)
-            if time_out and time.time() - start_time > TIMEOUT:
-                return ""
-        return decoded_json[0]
+    def json_to_signup(cls, json_signup):
+        """
+        Converts a sign-up message to the client's name and the protocol extensions it offers
+        :param json_signup: a String name, or [String, [String, ...]] with the names of the extensions offered
+        :return: [String, List of String]
+        """
+        if isinstance(json_signup, basestring):
+            return [json_signup, []]
+        [name, features] = json_signup
+        assert(isinstance(name, basestring) and isinstance(features, list))
+        return [name, features]
 
 # ======================================  Dealer ==========================================
 
@@ -281,6 +258,64 @@ class Convert(object):
         state += [watering_hole, other_players]
         return state
 
+    @classmethod
+    def gamestate_to_delta_json(cls, old_state, new_state):
+        """
+        Converts a JSON State to the changes since an earlier JSON State for the same player and opponents
+        :param old_state: the JSON State the client last answered
+        :param new_state: the current JSON State
+        :return: [FEED_DELTA, Natural, BoardsDelta, LOC, Natural+, [BoardsDelta, ...]], where a BoardsDelta is
+                 [Natural, [[Natural, Species+], ...]]: the new number of species and those that changed, by index
+        """
+        [food_bag, json_species, json_hand, watering_hole, jboards] = new_state
+        boards_deltas = [cls.boards_to_delta_json(old_boards, boards)
+                         for (old_boards, boards) in zip(old_state[4], jboards)]
+        return [FEED_DELTA, food_bag, cls.boards_to_delta_json(old_state[1], json_species), json_hand,
+                watering_hole, boards_deltas]
+
+    @classmethod
+    def apply_gamestate_delta(cls, old_state, jdelta):
+        """
+        Rebuilds a JSON State from an earlier JSON State and the changes since
+        :param old_state: the JSON State last answered
+        :param jdelta: the changes as given by gamestate_to_delta_json
+        :return: the current JSON State
+        """
+        [tag, food_bag, species_delta, json_hand, watering_hole, boards_deltas] = jdelta
+        assert(len(boards_deltas) == len(old_state[4]))
+        jboards = [cls.apply_boards_delta(old_boards, delta)
+                   for (old_boards, delta) in zip(old_state[4], boards_deltas)]
+        return [food_bag, cls.apply_boards_delta(old_state[1], species_delta), json_hand, watering_hole, jboards]
+
+    @classmethod
+    def boards_to_delta_json(cls, old_boards, boards):
+        """
+        Converts a JSON Boards to the species that changed since an earlier JSON Boards of the same player
+        :param old_boards: the earlier JSON Boards
+        :param boards: the current JSON Boards
+        :return: [Natural, [[Natural, Species+], ...]] with the number of species and the changed ones by index
+        """
+        changed = [[i, boards[i]] for i in range(len(boards)) if i >= len(old_boards) or boards[i] != old_boards[i]]
+        return [len(boards), changed]
+
+    @classmethod
+    def apply_boards_delta(cls, old_boards, delta):
+        """
+        Rebuilds a JSON Boards from an earlier JSON Boards and the species that changed since
+        :param old_boards: the earlier JSON Boards
+        :param delta: [Natural, [[Natural, Species+], ...]] as given by boards_to_delta_json
+        :return: the current JSON Boards
+        """
+        [length, changed] = delta
+        boards = old_boards[:length]
+        for (i, json_species) in changed:
+            if i == len(boards):
+                boards.append(json_species)
+            else:
+                boards[i] = json_species
+        assert(len(boards) == length)
+        return boards
+
 # ======================================  Species ==========================================
 
     @classmethod
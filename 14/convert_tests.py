@@ -61,6 +61,20 @@ class TestConvert(unittest.TestCase):
 
 
 
+    def test_json_to_signup(self):
+        self.assertEqual(Convert.json_to_signup("jake"), ["jake", []])
+        self.assertEqual(Convert.json_to_signup(["jake", [PIPELINE]]), ["jake", [PIPELINE]])
+        self.assertRaises(AssertionError, Convert.json_to_signup, [1, [PIPELINE]])
+        self.assertRaises(ValueError, Convert.json_to_signup, ["jake"])
+
+    def test_gamestate_delta(self):
+        new_state = [3, [self.jSpecies_2], [], 8, [[self.jSpecies_3], [self.jSpecies_1, self.jSpecies_2]]]
+        old_state = [2, [self.jSpecies_1], [], 10, [[self.jSpecies_3, self.jSpecies_4], [self.jSpecies_1]]]
+        delta = Convert.gamestate_to_delta_json(old_state, new_state)
+        self.assertEqual(delta, [FEED_DELTA, 3, [1, [[0, self.jSpecies_2]]], [], 8,
+                                 [[1, []], [2, [[1, self.jSpecies_2]]]]])
+        self.assertEqual(Convert.apply_gamestate_delta(old_state, delta), new_state)
+
     def test_json_to_trait(self):
         self.assertEqual(Convert.json_to_trait(self.jt_1).convert_to_json(), self.jt_1)
         self.assertNotEqual(Convert.json_to_trait(self.jt_1).convert_to_json(), self.jt_2)
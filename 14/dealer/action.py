@@ -1,11 +1,36 @@
 class Action(object):
     """
     Represents a player action which includes information on what the player wishes to do with each card
-    such as submitting to the watering whole, growing species attributes, creating new species, or replacing traits
+    such as submitting to the watering whole, growing species attributes, creating new species, or replacing traits.
+    Actions are immutable, so they can be hashed and compared by their fields.
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
+    def __setattr__(self, name, value):
+        """
+        Keeps this Action immutable
+        :raise AttributeError whenever an attribute is set
+        """
+        raise AttributeError("Actions are immutable")
+
+    def __reduce__(self):
+        """
+        Lets this Action be pickled although it cannot be changed after it is created
+        :return: (class, arguments) to create an equal Action
+        """
+        return (type(self), tuple([getattr(self, name) for name in self.__slots__]))
+
+    def __ne__(self, other):
+        """
+        Compare attributes for testing.
+        :param other: The other object we are comparing
+        :return: True if not equal, else False
+        """
+        return not self.__eq__(other)
+
     def apply(self, dealer, player):
         """
         Updates the Dealer configuration according to the Action for this PlayerState
@@ -33,6 +58,8 @@ class FoodCardAction(Action):
     """
     Represents an action of submitting a TraitCard to be used as food on the watering hole.
     """
+    __slots__ = ('trade_card_index',)
+
     def __init__(self, trade_card_index):
         """
         Creates a FoodCardAction
@@ -40,11 +67,18 @@ class FoodCardAction(Action):
         :return: FoodCardAction
         """
         super(FoodCardAction, self).__init__()
-        self.trade_card_index = trade_card_index
+        object.__setattr__(self, 'trade_card_index', trade_card_index)
 
     def __eq__(self, other):
-        return all([isinstance(other, FoodCardAction),
-                    self.trade_card_index == other.trade_card_index])
+        return self is other or (isinstance(other, FoodCardAction) and
+                                 self.trade_card_index == other.trade_card_index)
+
+    def __hash__(self):
+        """
+        Hashes this Action by its fields, consistently with __eq__
+        :return: Int
+        """
+        return hash(self.trade_card_index)
 
     def apply(self, dealer, player):
         """
@@ -75,6 +109,8 @@ class GrowAction(Action):
     """
     Represents an action of growing the population of a species in the players hand.
     """
+    __slots__ = ('attribute', 'species_board_index', 'trade_card_index')
+
     def __init__(self, attribute, species_board_index, trade_card_index):
         """
         Creates a GrowAction
@@ -87,15 +123,22 @@ class GrowAction(Action):
         :return: GrowAction
         """
         super(GrowAction, self).__init__()
-        self.attribute = attribute
-        self.species_board_index = species_board_index
-        self.trade_card_index = trade_card_index
+        object.__setattr__(self, 'attribute', attribute)
+        object.__setattr__(self, 'species_board_index', species_board_index)
+        object.__setattr__(self, 'trade_card_index', trade_card_index)
 
     def __eq__(self, other):
-        return all([isinstance(other, GrowAction),
-                    self.attribute == other.attribute,
-                    self.species_board_index == other.species_board_index,
-                    self.trade_card_index == other.trade_card_index])
+        return self is other or (isinstance(other, GrowAction) and
+                                 self.trade_card_index == other.trade_card_index and
+                                 self.species_board_index == other.species_board_index and
+                                 self.attribute == other.attribute)
+
+    def __hash__(self):
+        """
+        Hashes this Action by its fields, consistently with __eq__
+        :return: Int
+        """
+        return hash((self.attribute, self.species_board_index, self.trade_card_index))
 
     def apply(self, dealer, player):
         """
@@ -126,22 +169,31 @@ class AddSpeciesAction(Action):
     """
     Represents an action of adding a new Species to the PlayerState's hand.
     """
+    __slots__ = ('trade_card_index', 'add_card_list')
+
     def __init__(self, trade_card_index, add_card_list):
         """
         Creates an AddSpeciesAction
         :param trade_card_index: Nat representing the index of the Trait Card in the players hand to discard.
-        :param add_card_list: List of Nat representing the indicies of Trait Cards in the players hand to add to the
-                              new species. This list can be up to length of 3.
+        :param add_card_list: List or Tuple of Nat representing the indicies of Trait Cards in the players hand to
+                              add to the new species. This list can be up to length of 3. It is kept as a Tuple.
         :return: AddSpeciesAction
         """
         super(AddSpeciesAction, self).__init__()
-        self.trade_card_index = trade_card_index
-        self.add_card_list = add_card_list
+        object.__setattr__(self, 'trade_card_index', trade_card_index)
+        object.__setattr__(self, 'add_card_list', tuple(add_card_list))
 
     def __eq__(self, other):
-        return all([isinstance(other, AddSpeciesAction),
-                    self.add_card_list == other.add_card_list,
-                    self.trade_card_index == other.trade_card_index])
+        return self is other or (isinstance(other, AddSpeciesAction) and
+                                 self.trade_card_index == other.trade_card_index and
+                                 self.add_card_list == other.add_card_list)
+
+    def __hash__(self):
+        """
+        Hashes this Action by its fields, consistently with __eq__
+        :return: Int
+        """
+        return hash((self.trade_card_index, self.add_card_list))
 
     def apply(self, dealer, player):
         """
@@ -168,13 +220,15 @@ class AddSpeciesAction(Action):
         Convert this AddSpeciesAction into its respective JSON representation
         :return: BT as specified in http://www.ccs.neu.edu/home/matthias/4500-s16/r_remote.html
         """
-        return [self.trade_card_index] + self.add_card_list
+        return [self.trade_card_index] + list(self.add_card_list)
 
 
 class ReplaceTraitAction(Action):
     """
     Represents an action of replacing a TraitCard on one of the PlayerState's Species
     """
+    __slots__ = ('species_board_index', 'card_to_replace_index', 'replacement_card_index')
+
     def __init__(self, species_board_index, card_to_replace_index, replacement_card_index):
         """
         Creates a ReplaceTraitAction
@@ -184,15 +238,22 @@ class ReplaceTraitAction(Action):
         :return: A ReplaceTraitAction
         """
         super(ReplaceTraitAction, self).__init__()
-        self.species_board_index = species_board_index
-        self.card_to_replace_index = card_to_replace_index
-        self.replacement_card_index = replacement_card_index
+        object.__setattr__(self, 'species_board_index', species_board_index)
+        object.__setattr__(self, 'card_to_replace_index', card_to_replace_index)
+        object.__setattr__(self, 'replacement_card_index', replacement_card_index)
 
     def __eq__(self, other):
-        return all([isinstance(other, ReplaceTraitAction),
-                    self.species_board_index == other.species_board_index,
-                    self.card_to_replace_index == other.card_to_replace_index,
-                    self.replacement_card_index == other.replacement_card_index])
+        return self is other or (isinstance(other, ReplaceTraitAction) and
+                                 self.replacement_card_index == other.replacement_card_index and
+                                 self.species_board_index == other.species_board_index and
+                                 self.card_to_replace_index == other.card_to_replace_index)
+
+    def __hash__(self):
+        """
+        Hashes this Action by its fields, consistently with __eq__
+        :return: Int
+        """
+        return hash((self.species_board_index, self.card_to_replace_index, self.replacement_card_index))
 
     def apply(self, dealer, player):
         """
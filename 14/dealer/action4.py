@@ -1,30 +1,62 @@
 class Action4(object):
     """
-    Represents a players actions for a turn.
+    Represents a players actions for a turn. Action4s are immutable, with their actions held in tuples, so they
+    can be hashed and compared by their actions.
     """
+    __slots__ = ('food_card', 'grow_pop', 'grow_body', 'add_species', 'replace_trait')
+
     def __init__(self, food_card, grow_pop=False, grow_body=False, add_species=False, replace_trait=False):
         """
         Creates an Action4
         :param food_card: FoodCardAction
-        :param grow_pop: List of GrowAction with a population attribute
-        :param grow_body: List of GrowAction with a body attribute
-        :param add_species: List of AddSpeciesActions with a population attribute
-        :param replace_trait: List of ReplaceTraitActions
+        :param grow_pop: List or Tuple of GrowAction with a population attribute
+        :param grow_body: List or Tuple of GrowAction with a body attribute
+        :param add_species: List or Tuple of AddSpeciesActions with a population attribute
+        :param replace_trait: List or Tuple of ReplaceTraitActions
         :return: Action4
         """
-        self.food_card = food_card
-        self.grow_pop = grow_pop if grow_pop else []
-        self.grow_body = grow_body if grow_body else []
-        self.add_species = add_species if add_species else []
-        self.replace_trait = replace_trait if replace_trait else []
+        object.__setattr__(self, 'food_card', food_card)
+        object.__setattr__(self, 'grow_pop', tuple(grow_pop) if grow_pop else ())
+        object.__setattr__(self, 'grow_body', tuple(grow_body) if grow_body else ())
+        object.__setattr__(self, 'add_species', tuple(add_species) if add_species else ())
+        object.__setattr__(self, 'replace_trait', tuple(replace_trait) if replace_trait else ())
+
+    def __setattr__(self, name, value):
+        """
+        Keeps this Action4 immutable
+        :raise AttributeError whenever an attribute is set
+        """
+        raise AttributeError("Action4s are immutable")
+
+    def __reduce__(self):
+        """
+        Lets this Action4 be pickled although it cannot be changed after it is created
+        :return: (class, arguments) to create an equal Action4
+        """
+        return (Action4, (self.food_card, self.grow_pop, self.grow_body, self.add_species, self.replace_trait))
 
     def __eq__(self, other):
-        return all([isinstance(other, Action4),
-                    self.food_card == other.food_card,
-                    self.grow_pop == other.grow_pop,
-                    self.grow_body == other.grow_body,
-                    self.add_species == other.add_species,
-                    self.replace_trait == other.replace_trait])
+        return self is other or (isinstance(other, Action4) and
+                                 self.food_card == other.food_card and
+                                 self.grow_pop == other.grow_pop and
+                                 self.grow_body == other.grow_body and
+                                 self.add_species == other.add_species and
+                                 self.replace_trait == other.replace_trait)
+
+    def __ne__(self, other):
+        """
+        Compare attributes for testing.
+        :param other: The other object we are comparing
+        :return: True if not equal, else False
+        """
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        """
+        Hashes this Action4 by its actions, consistently with __eq__
+        :return: Int
+        """
+        return hash((self.food_card, self.grow_pop, self.grow_body, self.add_species, self.replace_trait))
 
     def apply_all(self, dealer, player):
         """
@@ -44,7 +76,7 @@ class Action4(object):
         Returns a list of all the actions in this action4 in the order they should be executed
         :return: List of Action
         """
-        return [self.food_card] + self.add_species + self.grow_pop + self.grow_body + self.replace_trait
+        return list((self.food_card,) + self.add_species + self.grow_pop + self.grow_body + self.replace_trait)
 
     def validate_hand(self, player):
         """
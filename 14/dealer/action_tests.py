@@ -1,5 +1,6 @@
 import unittest
 import copy
+import pickle
 from action import *
 from action4 import Action4
 from traitcard import TraitCard
@@ -129,5 +130,38 @@ class TestActions(unittest.TestCase):
                           'Species 0: [[population, 3->4]], '
                           '[watering_hole, 14->17]')
 
+    def test_hash(self):
+        actions = [self.food_card_action1, self.grow_action_pop, self.add_species_action1,
+                   self.replace_trait_action1, self.action4_2]
+        copies = [FoodCardAction(0), GrowAction(POPULATION, 0, 0), AddSpeciesAction(0, [1]),
+                  ReplaceTraitAction(0, 0, 0), Action4(FoodCardAction(1), grow_pop=[GrowAction(POPULATION, 0, 0)])]
+        self.assertEqual(actions, copies)
+        self.assertEqual([hash(action) for action in actions], [hash(action) for action in copies])
+        self.assertEqual(set(actions), set(copies))
+        self.assertNotIn(GrowAction(BODY, 0, 0), set(actions))
+        self.assertNotIn(self.action4_1, set(actions))
+        self.assertNotEqual(self.add_species_action1, self.add_species_action2)
+        feedings = [NoFeeding(), HerbivoreFeeding(1), FatFeeding(1, 2), CarnivoreFeeding(0, 1, 2)]
+        self.assertEqual(set(feedings), set([NoFeeding(), HerbivoreFeeding(1), FatFeeding(1, 2),
+                                             CarnivoreFeeding(0, 1, 2)]))
+        self.assertNotIn(HerbivoreFeeding(2), set(feedings))
+        self.assertNotEqual(HerbivoreFeeding(1), FatFeeding(1, 0))
+
+    def test_immutable(self):
+        self.assertRaises(AttributeError, setattr, self.food_card_action1, 'trade_card_index', 2)
+        self.assertRaises(AttributeError, setattr, self.action4_1, 'food_card', self.food_card_action2)
+        self.assertRaises(AttributeError, setattr, HerbivoreFeeding(1), 'species_index', 2)
+        self.assertEqual(self.food_card_action1, FoodCardAction(0))
+        grow_pop, add_card_list = [GrowAction(POPULATION, 0, 0)], [1]
+        action4, add_species_action = Action4(FoodCardAction(1), grow_pop=grow_pop), AddSpeciesAction(0, add_card_list)
+        grow_pop.append(GrowAction(BODY, 0, 0))
+        add_card_list.append(2)
+        self.assertEqual([action4, add_species_action], [self.action4_2, self.add_species_action1])
+        self.assertEqual(add_species_action.convert_to_json(), [0, 1])
+        self.assertEqual(action4.get_all_actions(), [FoodCardAction(1), GrowAction(POPULATION, 0, 0)])
+        for choice in [self.action4_2, self.add_species_action1, NoFeeding(), CarnivoreFeeding(0, 1, 2)]:
+            self.assertEqual(copy.deepcopy(choice), choice)
+            self.assertEqual(pickle.loads(pickle.dumps(choice, pickle.HIGHEST_PROTOCOL)), choice)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
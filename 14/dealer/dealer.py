@@ -1,7 +1,12 @@
 import gui
+import sys
+from random import Random
 from globals import *
+from deck import Deck
+from public_player import PublicPlayer
 from player_state import PlayerState
 from species import Species
+from snapshot import Snapshot
 from traitcard import TraitCard
 
 
@@ -9,18 +14,32 @@ class Dealer(object):
     """
     Represents the Dealer in a game of Evolution.
     """
+    card_counts = {}
 
-    def __init__(self, list_of_players, watering_hole, deck):
+    def __init__(self, list_of_players, watering_hole, deck, seed=False, validation=FULL_VALIDATION):
         """
         Creates a Dealer
-        :param list_of_players: list of PlayerStates for each player involved in the game
+        :param list_of_players: list of PlayerStates for each player involved in the game, in seating order
         :param watering_hole: Natural representing the amount of food available at the watering hole
-        :param deck: list of TraitCards held by the dealer
+        :param deck: Deck, or list of TraitCards in draw order, held by the dealer
+        :param seed: Natural seeding this Dealer's random number generator, or False to choose one at random
+        :param validation: How thoroughly to validate the game after each Player's actions are applied:
+                           FULL_VALIDATION checks every player and card, INCREMENTAL_VALIDATION checks only the
+                           acting player and this Dealer's own attributes, SAMPLED_VALIDATION does the same for
+                           every VALIDATION_SAMPLE-th action, and NO_VALIDATION skips the checks
         :return: a Dealer object
         """
         self.list_of_players = list_of_players
+        self.current = 0
+        self.feeders = set()
         self.watering_hole = watering_hole
-        self.deck = deck
+        self.deck = deck if isinstance(deck, Deck) else Deck(deck)
+        self.seed = seed if seed is not False else Random().randint(0, sys.maxint)
+        self.rng = Random(self.seed)
+        self.public_views = {}
+        self.player_views = {}
+        self.validation = validation
+        self.actions_applied = 0
 
     def equal_attributes(self, other):
         """
@@ -29,8 +48,10 @@ class Dealer(object):
         :return: True if all attributes are the same, else False
         """
         players_equal = isinstance(other, Dealer) and len(self.list_of_players) == len(other.list_of_players)
-        for i in range(len(self.list_of_players)):
-            players_equal = players_equal and self.list_of_players[i].equal_attributes(other.list_of_players[i])
+        if players_equal:
+            players, other_players = self.players_in_order(), other.players_in_order()
+            for i in range(len(players)):
+                players_equal = players_equal and players[i].equal_attributes(other_players[i])
         return all([players_equal,
                     self.watering_hole == other.watering_hole,
                     self.deck == other.deck])
@@ -39,14 +60,19 @@ class Dealer(object):
 # ======================================  Utility Methods ===========================================
 
     @classmethod
-    def create_initial(cls, loxp):
+    def create_initial(cls, loxp, seed=False, validation=FULL_VALIDATION):
         """
         Creates an initial Dealer object with PlayerStates for each of the given external Players
-        and a complete, shuffled deck.
+        and a complete, shuffled deck. Games created with the same seed and Players are identical.
         :param loxp: List of Player objects representing external players
+        :param seed: Natural seeding the Dealer's random number generator, or False to choose one at random
+        :param validation: the Dealer's validation mode, as for __init__
         :return: Dealer object ready to begin a game.
         """
-        return Dealer(list_of_players=cls.make_playerstates(loxp), watering_hole=0, deck=cls.make_deck())
+        dealer = Dealer(list_of_players=cls.make_playerstates(loxp), watering_hole=0,
+                        deck=Deck(cls.make_deck()), seed=seed, validation=validation)
+        dealer.shuffle_deck()
+        return dealer
 
     @classmethod
     def make_playerstates(cls, loxp):
@@ -73,6 +99,24 @@ class Dealer(object):
         deck = sorted(deck, key=lambda card: (card.trait, card.food_points))
         return deck
 
+    @classmethod
+    def make_card_counts(cls):
+        """
+        Counts the copies of each TraitCard in a full deck. The count is made once, and each call gets its own copy.
+        :return: Dictionary {TraitCard: Natural}
+        """
+        if not cls.card_counts:
+            for card in cls.make_deck():
+                cls.card_counts[card] = cls.card_counts.get(card, 0) + 1
+        return dict(cls.card_counts)
+
+    def shuffle_deck(self):
+        """
+        Shuffles the deck using this Dealer's random number generator
+        :effect: Reorders the deck
+        """
+        self.deck.shuffle(self.rng)
+
     def deal_cards(self, player, amount):
         """
         Deals the given amount of TraitCards from the deck to the given player
@@ -80,16 +124,61 @@ class Dealer(object):
         :param player: the PlayerState of the player being dealt cards
         :param amount: Natural specifying how many cards to deal
         """
-        while amount and self.deck:
-            player.hand.append(self.deck.pop(0))
-            amount -= 1
+        player.hand = player.hand + self.deck.draw(amount)
 
     def remove_cheaters(self, cheater_ids):
         """
-        Removes all cheating players from the game
+        Removes all cheating players from the game. If the current player is removed, the next remaining
+        player in seating order becomes the current player.
         :param cheater_ids: List of Natural+ representing IDs of cheating players
         """
+        if not cheater_ids:
+            return
+        current_player = False
+        for player in self.players_in_order():
+            if player.name not in cheater_ids:
+                current_player = player
+                break
         self.list_of_players = [player for player in self.list_of_players if player.name not in cheater_ids]
+        self.current = self.list_of_players.index(current_player) if current_player else 0
+        self.feeders.difference_update(cheater_ids)
+
+    def remove_current_player(self):
+        """
+        Removes the current player from the game
+        :effect: The next player in seating order becomes the current player
+        """
+        player = self.list_of_players[self.current]
+        self.list_of_players = self.list_of_players[:self.current] + self.list_of_players[self.current + 1:]
+        self.feeders.discard(player.name)
+        if self.current >= len(self.list_of_players):
+            self.current = 0
+
+    def current_player(self):
+        """
+        Gives the player whose turn it is, or who is feeding during the feeding cycle
+        :return: PlayerState
+        """
+        return self.list_of_players[self.current]
+
+    def players_in_order(self):
+        """
+        Gives this Dealer's players in turn order, starting with the current player
+        :return: List of PlayerState
+        """
+        return self.list_of_players[self.current:] + self.list_of_players[:self.current]
+
+    def other_player(self, index):
+        """
+        Gives one of the players other than the current player, counting in turn order from the player
+        after the current player
+        :param index: Natural index of the player among the other players
+        :return: PlayerState
+        :raise IndexError if there is no such player
+        """
+        if not 0 <= index < len(self.list_of_players) - 1:
+            raise IndexError("no such player")
+        return self.list_of_players[(self.current + index + 1) % len(self.list_of_players)]
 
 # ======================================  Run Game Methods ==========================================
 
@@ -116,8 +205,7 @@ class Dealer(object):
         """
         Executes a complete Evolution turn and sets up the Player order for the next turn.
         """
-        next_player_id = (self.list_of_players[1].name if len(self.list_of_players) > 1
-                          else self.list_of_players[0].name)
+        next_player_id = self.list_of_players[(self.current + 1) % len(self.list_of_players)].name
         self.step1()
         action4_list = self.step2n3()
         if action4_list:
@@ -130,7 +218,7 @@ class Dealer(object):
         Ends a turn in the game by updating species populations, removing extinct species, and dealing
         cards to PlayerStates with extinct species
         """
-        for player in self.list_of_players:
+        for player in self.players_in_order():
             extinction_card_amount = player.end_turn()
             self.deal_cards(player, extinction_card_amount)
 
@@ -153,6 +241,19 @@ class Dealer(object):
         player_scores = [player.get_score() for player in self.list_of_players]
         return sorted(player_scores, key=lambda player_score: (-player_score[1], player_score[0]))
 
+    def leaderboard(self):
+        """
+        Ranks the Players still in the game by their current score. Scores are kept up to date by each
+        PlayerState, so this may be polled at any point in a game, e.g. by a spectator display.
+        Tied Players share a rank.
+        :return: List of (Natural, Natural, Natural) representing (rank, Player ID, score) tuples in rank order
+        """
+        leaderboard = []
+        for (player_id, score) in self.compute_scores():
+            rank = (leaderboard[-1][0] if leaderboard and leaderboard[-1][2] == score else len(leaderboard) + 1)
+            leaderboard.append((rank, player_id, score))
+        return leaderboard
+
     @classmethod
     def render_scoreboard(cls, player_scores):
         """
@@ -175,7 +276,7 @@ class Dealer(object):
         a species board (if needed) and additional cards to play the turn.
         :effect: Updates internal PlayerStates with additional TraitCards and possible Species
         """
-        for player in self.list_of_players:
+        for player in self.players_in_order():
             self.start(player)
 
     def start(self, player):
@@ -196,22 +297,28 @@ class Dealer(object):
         :param player: the PlayerState being dealt to
         :return: List of TraitCard
         """
-        amount = player.deal_amount()
-        cards_to_deal = self.deck[:amount]
-        self.deck = self.deck[amount:]
-        return cards_to_deal
+        return self.deck.draw(player.deal_amount())
 
 # ======================================  Step 2/3 Methods ==========================================
 
     def step2n3(self):
         """
-        Gathers requests from each external Player of how they wish to use the cards in their hands
+        Gathers requests from each external Player of how they wish to use the cards in their hands. Every
+        remote Player is asked before any answer is awaited, so the players choose at the same time and the
+        step takes as long as the slowest of them rather than the sum of all.
         :return: List of Action4 corresponding to the current PlayerState order
         """
         cheater_ids = []
         action4_list = []
         all_players = self.public_players(False)
-        for player in self.list_of_players:
+        for player in self.players_in_order():
+            try:
+                player.request_choice(all_players)
+            except:
+                cheater_ids.append(player.name)
+        for player in self.players_in_order():
+            if player.name in cheater_ids:
+                continue
             try:
                 action4_list.append(player.choose(all_players))
             except:
@@ -241,12 +348,13 @@ class Dealer(object):
         :effect: Updates all PlayerStates based on the Actions they choose
         """
         cheater_ids = []
+        players = self.players_in_order()
         for i in range(len(action4_list)):
             try:
-                player = self.list_of_players[i]
+                player = players[i]
                 action4_list[i].validate_hand(player)
                 action4_list[i].apply_all(self, player)
-                self.validate_attributes()
+                self.validate_action(player)
             except:
                 cheater_ids.append(player.name)
         self.remove_cheaters(cheater_ids)
@@ -280,7 +388,7 @@ class Dealer(object):
         :effect Feeds all Species with the given trait
         :param trait: The trait that we are feeding
         """
-        for player in self.list_of_players:
+        for player in self.players_in_order():
             self.watering_hole = player.feed_trait(self.watering_hole, trait)
 
 # -----------------------------------   Feed Cycle Methods --------------------------------------
@@ -289,11 +397,14 @@ class Dealer(object):
         """
         Executes a feeding cycle until the watering hole runs out or no Players can still feed
         :effect: Updates PlayerStates based on auto-feedings or the Player's FeedingChoices.
-                 Reorders players to the original feeding order.
+                 Returns the turn to the first feeding player. Releases the public views used during the cycle.
         """
-        first_player_id = self.list_of_players[0].name
-        while self.watering_hole > MIN_WATERING_HOLE and any([player.active for player in self.list_of_players]):
+        first_player_id = self.current_player().name
+        self.feeders = set(player.name for player in self.list_of_players if player.active)
+        while self.watering_hole > MIN_WATERING_HOLE and self.feeders:
+            self.next_feeder()
             self.feed1()
+        self.public_views, self.player_views = {}, {}
         if not self.list_of_players:
             return
         self.order_players(first_player_id)
@@ -301,42 +412,117 @@ class Dealer(object):
     def feed1(self):
         """
         This Dealer handles one step in the feeding cycle by modifying its configuration according to
-        an auto-feeding or the first player's FeedingChoice.
+        an auto-feeding or the current player's FeedingChoice, then passes the turn to the next player.
         """
-        player = self.list_of_players[0]
+        player = self.current_player()
         if player.active:
             other_players = self.public_players(feeding_player=player)
             try:
                 feeding_choice = player.next_feeding(self.watering_hole, other_players)
                 feeding_choice.handle_feeding(self, player)
             except:
-                self.list_of_players.pop(0)
+                self.remove_current_player()
                 return
-        self.list_of_players.append(self.list_of_players.pop(0))
+        if not player.active:
+            self.feeders.discard(player.name)
+        self.current = (self.current + 1) % len(self.list_of_players)
+
+    def next_feeder(self):
+        """
+        :effect Passes the turn on in seating order until it reaches a player who can still feed
+        """
+        while self.current_player().name not in self.feeders:
+            self.current = (self.current + 1) % len(self.list_of_players)
 
     def public_players(self, feeding_player):
         """
-        Creates a copy of this Dealer's list of players, excluding the specified feeding player, so that
+        Gives read-only views of this Dealer's list of players, excluding the specified feeding player, so that
         the feeding player may choose which player to attack without having access to their private fields.
-        :param feeding_player: The PlayerState of the player feeding
-        :return: a list of public representations of PlayerStates
-        """
-        return [PlayerState(name=player.name, food_bag=False, hand=False, species=player.species)
-                for player in self.list_of_players
-                if player != feeding_player]
+        Views share the players' species boards, and each list of views is reused whenever the same players
+        recur in the same order, as they do every time the feeding cycle comes round, until the cycle ends.
+        The lists are keyed on the players themselves, so removing a player never reuses a stale list.
+        :param feeding_player: The PlayerState of the player feeding, or False to view all players
+        :return: a list of PublicPlayers
+        """
+        players = [player for player in self.players_in_order() if player is not feeding_player]
+        order = tuple(players)
+        views = self.public_views.get(order)
+        if views is None:
+            views = [self.public_view(player) for player in players]
+            self.public_views[order] = views
+        return views
+
+    def public_view(self, player):
+        """
+        Gives the read-only view of the given player, creating it the first time it is asked for
+        :param player: a PlayerState in this Dealer's list of players
+        :return: PublicPlayer viewing the given PlayerState
+        """
+        view = self.player_views.get(player)
+        if view is None:
+            view = PublicPlayer(player)
+            self.player_views[player] = view
+        return view
 
     def order_players(self, first_player_id):
         """
-        :effect Reorders the PlayerStates based on the given first_player_id. If that Player has been
-                removed due to cheating, will reorder based on the next Player in the order
-        :param first_player_id: The name of the PlayerState that should be first in the list
+        :effect Makes the Player with the given first_player_id the current player. If that Player has been
+                removed due to cheating, the Player with the next highest ID takes the turn, wrapping round
+                to the lowest ID
+        :param first_player_id: The name of the PlayerState that should be first in the turn order
         """
         if not self.list_of_players:
             return
-        if first_player_id not in [player.name for player in self.list_of_players]:
-            return self.order_players(first_player_id + 1 % LOP_MAX)
-        while self.list_of_players[0].name is not first_player_id:
-            self.list_of_players.append(self.list_of_players.pop(0))
+        names = [player.name for player in self.list_of_players]
+        if first_player_id not in names:
+            first_player_id = min(names, key=lambda name: (name < first_player_id, name))
+        self.current = names.index(first_player_id)
+
+# ======================================   Snapshot Methods ===========================================
+
+    def snapshot(self):
+        """
+        Records the state of this game, so that moves can be tried out and taken back, e.g. by a look-ahead
+        strategy. The snapshot is an eager copy: every list the game can change, from the list of players and
+        the deck down to each hand, species board and list of traits, is copied when it is taken, and copied
+        again when it is restored. Only the TraitCards, which are immutable, and the external players are not
+        copied.
+        :return: Snapshot
+        """
+        return Snapshot(list(self.list_of_players), [player.snapshot() for player in self.list_of_players], self.current,
+                        frozenset(self.feeders), self.watering_hole, self.deck.snapshot(), self.rng.getstate(),
+                        self.actions_applied)
+
+    def restore(self, snapshot):
+        """
+        :effect Puts this game back in the state recorded, including any players removed since. Players and
+                species keep their identity, so the views and caches of them stay valid.
+        :param snapshot: Snapshot taken of this Dealer
+        """
+        self.list_of_players = list(snapshot.list_of_players)
+        for i in range(len(self.list_of_players)):
+            self.list_of_players[i].restore(snapshot.players[i])
+        self.current = snapshot.current
+        self.feeders = set(snapshot.feeders)
+        self.watering_hole = snapshot.watering_hole
+        self.deck.restore(snapshot.deck)
+        self.rng.setstate(snapshot.rng_state)
+        self.actions_applied = snapshot.actions_applied
+
+    def fork(self):
+        """
+        Makes an independent copy of this game, which can be played on while this one is kept, e.g. to show
+        the changes a step makes. The copy has its own players, species, hands and traits, and the same external
+        players and deck.
+        :return: Dealer
+        """
+        dealer = Dealer([player.fork() for player in self.list_of_players], self.watering_hole, self.deck.fork(),
+                        self.seed, self.validation)
+        dealer.current = self.current
+        dealer.feeders = set(self.feeders)
+        dealer.rng.setstate(self.rng.getstate())
+        dealer.actions_applied = self.actions_applied
+        return dealer
 
 # ======================================   Conversion Methods ===========================================
 
@@ -347,18 +533,19 @@ class Dealer(object):
                  http://www.ccs.neu.edu/home/matthias/4500-s16/8.html
         """
         self.validate_attributes()
-        json_players = [player.convert_to_player_json() for player in self.list_of_players]
-        json_deck = [trait_card.convert_to_json() for trait_card in self.deck]
+        json_players = [player.convert_to_player_json() for player in self.players_in_order()]
+        json_deck = self.deck.convert_to_json()
         return [json_players, self.watering_hole, json_deck]
 
 # ======================================   Validation Methods ===========================================
 
     def validate_cards(self):
         """
-        Validates that all cards known by this dealer are valid possibilities and unique
+        Validates that all cards known by this dealer are valid possibilities and unique, in one pass over the
+        cards that takes each from a count of the full deck
         :raise: ValueError if duplicate or invalid cards exist
         """
-        total_deck = Dealer.make_deck()
+        total_deck = Dealer.make_card_counts()
         TraitCard.validate_all_unique(self.deck, total_deck)
         PlayerState.validate_all_cards(self.list_of_players, total_deck)
 
@@ -367,12 +554,37 @@ class Dealer(object):
         Validates the attributes of this Dealer
         :raise AssertionError if any attributes are out of bounds
         """
-        assert(isinstance(self.list_of_players, list) and LOP_MAX >= len(self.list_of_players) >= LOP_MIN)
+        self.validate_table()
         PlayerState.validate_all_attributes(self.list_of_players)
-        assert(isinstance(self.watering_hole, int) and self.watering_hole >= MIN_WATERING_HOLE)
-        assert(isinstance(self.deck, list) and LOC_MAX >= len(self.deck))
         TraitCard.validate_all_attributes(self.deck)
 
+    def validate_table(self):
+        """
+        Validates this Dealer's own attributes, without looking inside the players or the cards in the deck
+        :raise AssertionError if any attributes are out of bounds
+        """
+        assert(isinstance(self.list_of_players, list) and LOP_MAX >= len(self.list_of_players) >= LOP_MIN)
+        assert(isinstance(self.watering_hole, int) and self.watering_hole >= MIN_WATERING_HOLE)
+        assert(isinstance(self.deck, Deck) and LOC_MAX >= len(self.deck))
+
+    def validate_action(self, player):
+        """
+        Validates the game after the given player's Action4 has been applied, as thoroughly as this Dealer's
+        validation mode asks. Applying an Action4 changes only its player and the watering hole, and the
+        cards in the deck never change, so checking the acting player and this Dealer's own attributes covers
+        every change the Dealer itself makes. It does not re-check the other players: if an external player
+        changed another player's board while choosing, only FULL_VALIDATION finds it.
+        :param player: the PlayerState whose Action4 was just applied
+        :raise AssertionError if any attributes are out of bounds
+        """
+        self.actions_applied += 1
+        if self.validation == FULL_VALIDATION:
+            self.validate_attributes()
+        elif self.validation == INCREMENTAL_VALIDATION or (self.validation == SAMPLED_VALIDATION and
+                                                           self.actions_applied % VALIDATION_SAMPLE == 0):
+            self.validate_table()
+            player.validate_attributes()
+
     def show_changes(self, dealer2):
         """
         Shows a string representation of the differences between this Dealer and the given Dealer.
@@ -382,8 +594,8 @@ class Dealer(object):
         changes = []
         old_players = self.players_to_dict()
         new_players = dealer2.players_to_dict()
-        for i in range(len(self.list_of_players)):
-            name = self.list_of_players[i].name
+        for player in self.players_in_order():
+            name = player.name
             old_player = old_players.get(name)
             new_player = new_players.get(name)
             if not old_player.equal_attributes(new_player):
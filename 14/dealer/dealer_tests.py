@@ -6,12 +6,36 @@ from traitcard import TraitCard
 from player_state import PlayerState
 from globals import *
 from dealer import Dealer
+from deck import Deck
 from action import *
 from action4 import Action4
 from feeding_choice import *
 import copy
 
 
+class RemotePlayer(Player):
+    """
+    A Player that, like a PlayerProxy, is asked to choose before its answer is collected, and logs each call
+    """
+    def __init__(self, id, log, action4, fail_request=False, fail_choose=False):
+        Player.__init__(self, id=id)
+        self.log = log
+        self.action4 = action4
+        self.fail_request = fail_request
+        self.fail_choose = fail_choose
+
+    def request_choice(self, left_players, right_players):
+        self.log.append(("request", self.id, len(left_players), len(right_players)))
+        if self.fail_request:
+            raise IOError("connection cut")
+
+    def choose(self, left_players, right_players):
+        self.log.append(("choose", self.id))
+        if self.fail_choose:
+            raise IOError("no answer")
+        return self.action4
+
+
 class TestDealer(unittest.TestCase):
 
     def setUp(self):
@@ -62,8 +86,16 @@ class TestDealer(unittest.TestCase):
         self.assertEqual(len(deck), LOC_MAX)
         self.assertEqual(len(deck), len(set(deck)))
 
+    def test_create_initial_seed(self):
+        dealer1 = Dealer.create_initial([Player(id=x + 1) for x in range(4)], seed=7)
+        dealer2 = Dealer.create_initial([Player(id=x + 1) for x in range(4)], seed=7)
+        self.assertEqual(dealer1.seed, 7)
+        self.assertEqual(dealer1.deck, dealer2.deck)
+        self.assertNotEqual(dealer1.deck, Dealer.make_deck())
+        self.assertEqual(dealer1.run_game(), dealer2.run_game())
+
     def test_deal_cards(self):
-        self.dealer1.deck = Dealer.make_deck()
+        self.dealer1.deck = Deck(Dealer.make_deck())
         self.assertEqual([len(self.dealer1.deck), len(self.player1.hand)], [LOC_MAX, 2])
         self.dealer1.deal_cards(self.player1, 10)
         self.assertEqual([len(self.dealer1.deck), len(self.player1.hand)], [LOC_MAX - 10, 12])
@@ -72,6 +104,109 @@ class TestDealer(unittest.TestCase):
         public_players = self.dealer1.public_players(self.player1)
         self.assertTrue(public_players[0].equal_attributes(self.public_player2))
         self.assertTrue(public_players[1].equal_attributes(self.public_player3))
+        self.assertIs(self.dealer1.public_players(self.player1), public_players)
+        self.assertIs(public_players[0].species, self.player2.species)
+        self.assertEqual(len(self.dealer1.public_players(False)), 3)
+        self.dealer1.current = 1
+        self.dealer1.remove_current_player()
+        self.dealer1.current = 0
+        public_players = self.dealer1.public_players(self.player1)
+        self.assertEqual(len(public_players), 1)
+        self.assertTrue(public_players[0].views(self.player3))
+
+    def test_leaderboard(self):
+        dealer = Dealer.create_initial([Player(id=x + 1) for x in range(4)], seed=3)
+        while not dealer.game_over():
+            dealer.run_turn()
+            for player in dealer.list_of_players:
+                totals = (player.total_population, player.trait_count)
+                player.sync_totals()
+                self.assertEqual((player.total_population, player.trait_count), totals)
+        self.assertEqual([(player_id, score) for (rank, player_id, score) in dealer.leaderboard()],
+                         dealer.compute_scores())
+        self.player1.ext_player.id, self.player2.ext_player.id, self.player3.ext_player.id = (1, 2, 3)
+        self.player1.food_bag = 11
+        self.assertEqual(self.dealer1.leaderboard(), [(1, 1, 20), (2, 2, 19), (2, 3, 19)])
+        self.player1.food_bag = 0
+        self.assertEqual(self.dealer1.leaderboard(), [(1, 2, 19), (1, 3, 19), (3, 1, 9)])
+
+    def test_player_order(self):
+        self.dealer1.order_players(2)
+        self.assertEqual([player.name for player in self.dealer1.players_in_order()], [2, 3, 1])
+        self.assertIs(self.dealer1.other_player(1), self.player1)
+        self.assertRaises(IndexError, self.dealer1.other_player, 2)
+        self.dealer1.remove_cheaters([2])
+        self.assertEqual([player.name for player in self.dealer1.players_in_order()], [3, 1])
+        self.dealer1.order_players(4)
+        self.assertIs(self.dealer1.current_player(), self.player1)
+        self.dealer1.order_players(2)
+        self.assertIs(self.dealer1.current_player(), self.player3)
+
+    def test_next_feeder(self):
+        self.dealer1.feeders = set([1, 3])
+        self.dealer1.order_players(2)
+        self.dealer1.next_feeder()
+        self.assertIs(self.dealer1.current_player(), self.player3)
+        self.dealer1.remove_current_player()
+        self.assertIs(self.dealer1.current_player(), self.player1)
+        self.assertEqual(self.dealer1.feeders, set([1]))
+
+    def test_step2n3(self):
+        log = []
+        self.player1.ext_player = RemotePlayer(1, log, self.action4_1)
+        self.player2.ext_player = RemotePlayer(2, log, self.action4_2)
+        self.player3.ext_player = RemotePlayer(3, log, self.action4_3)
+        self.dealer1.order_players(2)
+        self.assertEqual(self.dealer1.step2n3(), [self.action4_2, self.action4_3, self.action4_1])
+        self.assertEqual(log, [("request", 2, 0, 2), ("request", 3, 1, 1), ("request", 1, 2, 0),
+                               ("choose", 2), ("choose", 3), ("choose", 1)])
+
+    def test_step2n3_cheaters(self):
+        log = []
+        self.player1.ext_player = RemotePlayer(1, log, self.action4_1, fail_request=True)
+        self.player2.ext_player = RemotePlayer(2, log, self.action4_2, fail_choose=True)
+        self.player3.ext_player = RemotePlayer(3, log, self.action4_3)
+        self.assertEqual(self.dealer1.step2n3(), [self.action4_3])
+        self.assertEqual(log, [("request", 1, 0, 2), ("request", 2, 1, 1), ("request", 3, 2, 0),
+                               ("choose", 2), ("choose", 3)])
+        self.assertEqual(self.dealer1.players_in_order(), [self.player3])
+
+    def test_validate_action(self):
+        self.player2.species[0].population = MAX_POP + 1
+        self.assertRaises(AssertionError, self.dealer1.validate_action, self.player1)
+        for validation in [INCREMENTAL_VALIDATION, SAMPLED_VALIDATION, NO_VALIDATION]:
+            self.dealer1.validation = validation
+            self.dealer1.validate_action(self.player1)
+        self.dealer1.validation = INCREMENTAL_VALIDATION
+        self.assertRaises(AssertionError, self.dealer1.validate_action, self.player2)
+        self.dealer1.watering_hole = -1
+        self.assertRaises(AssertionError, self.dealer1.validate_action, self.player1)
+
+    def test_sampled_validation(self):
+        self.player1.species[0].population = MAX_POP + 1
+        self.dealer1.validation = SAMPLED_VALIDATION
+        failures = 0
+        for i in range(2 * VALIDATION_SAMPLE):
+            try:
+                self.dealer1.validate_action(self.player1)
+            except AssertionError:
+                failures += 1
+        self.assertEqual(failures, 2)
+        self.dealer1.validation = NO_VALIDATION
+        self.dealer1.validate_action(self.player1)
+
+    def test_validate_cards(self):
+        dealer = Dealer.create_initial([Player(id=x + 1) for x in range(4)], 1)
+        dealer.run_turn()
+        dealer.validate_cards()
+        self.assertEqual(len(Dealer.make_card_counts()), LOC_MAX)
+        card = dealer.list_of_players[0].hand[0]
+        dealer.list_of_players[1].hand.append(card)
+        self.assertRaises(ValueError, dealer.validate_cards)
+        dealer.list_of_players[1].hand[-1] = TraitCard(CARNIVORE, 20)
+        self.assertRaises(ValueError, dealer.validate_cards)
+        dealer.list_of_players[1].hand.pop()
+        dealer.validate_cards()
 
     def test_cheater(self):
         dealer = Dealer.create_initial([Player(), Player(), Player(), Cheater(), Player()])
@@ -177,7 +312,7 @@ class TestDealer(unittest.TestCase):
         # Double Extinction
         self.species2.population = 1
         self.species7.population = 1
-        self.dealer1.deck = [self.foraging, self.scavenger, self.cooperation]
+        self.dealer1.deck = Deck([self.foraging, self.scavenger, self.cooperation])
         old_dealer = copy.deepcopy(self.dealer1)
         attack_choice.handle_attack_situation(self.species2, self.species7, self.player1, self.player3, self.dealer1)
         self.assertEquals(old_dealer.show_changes(self.dealer1),
@@ -218,6 +353,57 @@ class TestDealer(unittest.TestCase):
                           'Player 1: Species 0: [[food, 0->1]], Species 1: [[food, 2->3]], '
                           '[watering_hole, 10->8]')
 
+    def test_snapshot(self):
+        old_dealer = copy.deepcopy(self.dealer1)
+        snapshot = self.dealer1.snapshot()
+        self.assertIsNot(snapshot.players[0][1], self.player1.hand)
+        self.dealer1.step4(self.action4_list)
+        self.dealer1.remove_current_player()
+        self.assertFalse(old_dealer.equal_attributes(self.dealer1))
+        self.dealer1.restore(snapshot)
+        self.assertTrue(old_dealer.equal_attributes(self.dealer1))
+        self.assertEqual(old_dealer.show_changes(self.dealer1), '')
+        self.assertEqual(self.player1.species, [self.species1, self.species2])
+        self.assertEqual(self.player1.total_population, 7)
+
+        self.player1.hand.append(self.scavenger)
+        self.player1.species.append(self.species7)
+        self.species1.traits.append(self.horns)
+        self.dealer1.list_of_players.pop()
+        self.dealer1.restore(snapshot)
+        self.assertEqual(old_dealer.show_changes(self.dealer1), '')
+        self.player1.hand.append(self.scavenger)
+        self.dealer1.restore(snapshot)
+        self.assertTrue(old_dealer.equal_attributes(self.dealer1))
+
+        dealer = Dealer.create_initial([Player(id=x + 1) for x in range(4)], seed=7)
+        dealer.run_turn()
+        snapshot = dealer.snapshot()
+        scoreboard = dealer.run_game()
+        dealer.restore(snapshot)
+        self.assertEqual(dealer.run_game(), scoreboard)
+
+    def test_fork(self):
+        old_dealer = self.dealer1.fork()
+        self.assertIsNot(old_dealer.list_of_players[0].hand, self.player1.hand)
+        self.assertIsNot(old_dealer.list_of_players[0].species[0], self.species1)
+        old_dealer.list_of_players[0].hand.append(self.scavenger)
+        old_dealer.list_of_players[0].species[0].traits.append(self.horns)
+        self.assertNotIn(self.scavenger, self.player1.hand)
+        self.assertNotIn(self.horns, self.species1.traits)
+        old_dealer = self.dealer1.fork()
+        self.dealer1.step4(self.action4_list)
+        self.assertEqual(old_dealer.show_changes(self.dealer1),
+                         'Player 1: removed cards: [horns, 0], [foraging, 2], '
+                         'Species 0: [[population, 1->2], [food, 0->2]], '
+                         'Species 1: [[food, 2->4]], '
+                         'Player 2: removed cards: [carnivore, 3], [fat-tissue, 2], '
+                         'Species 0: [[fat-tissue, 0->1]], '
+                         'Species 1: [[traits: [0, [burrowing, 2]->[fat-tissue, 2]]], [fat-tissue, False->5]], '
+                         'Player 3: removed cards: [burrowing, 2], '
+                         'Species 0: [[fat-tissue, 0->7]], '
+                         '[watering_hole, 10->0]')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,120 @@
+class Deck(object):
+    """
+    Represents the Dealer's deck of TraitCards. Cards are drawn by advancing a cursor over a fixed list,
+    so drawing never shifts or copies the cards left in the deck.
+    """
+    def __init__(self, cards=False):
+        """
+        Creates a Deck
+        :param cards: List of TraitCard in draw order, the first card being the top of the deck
+        :return: a Deck object
+        """
+        self.cards = cards if cards else []
+        self.top = 0
+
+    def __len__(self):
+        """
+        Gives the number of cards left to draw from this Deck
+        :return: Natural
+        """
+        return len(self.cards) - self.top
+
+    def __iter__(self):
+        """
+        Iterates over the cards left in this Deck, from the top
+        :return: iterator of TraitCard
+        """
+        for i in xrange(self.top, len(self.cards)):
+            yield self.cards[i]
+
+    def __getitem__(self, index):
+        """
+        Gives a card left in this Deck
+        :param index: Natural position of the card counting from the top of this Deck
+        :return: TraitCard
+        :raise IndexError if fewer cards are left
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("deck index out of range")
+        return self.cards[self.top + index]
+
+    def __eq__(self, other):
+        """
+        Compares the cards left in this Deck with those left in another Deck, or with a list of cards
+        :param other: Deck or List of TraitCard
+        :return: True if they hold the same cards in the same order, else False
+        """
+        if isinstance(other, Deck):
+            return len(self) == len(other) and all(card == other_card for (card, other_card) in zip(self, other))
+        return isinstance(other, list) and self == Deck(other)
+
+    def __ne__(self, other):
+        """
+        :param other: Deck or List of TraitCard
+        :return: True if this Deck and the other do not hold the same cards in the same order, else False
+        """
+        return not self.__eq__(other)
+
+    def remaining(self):
+        """
+        Gives the number of cards left to draw from this Deck
+        :return: Natural
+        """
+        return len(self)
+
+    def draw(self, amount=1):
+        """
+        Draws the given amount of cards from the top of this Deck, stopping short if it runs out
+        :param amount: Natural specifying how many cards to draw
+        :return: List of TraitCard in draw order
+        """
+        end = min(self.top + amount, len(self.cards))
+        drawn = self.cards[self.top:end]
+        self.top = end
+        return drawn
+
+    def shuffle(self, rng):
+        """
+        Shuffles the cards left in this Deck
+        :param rng: the Random used to shuffle
+        :effect: Reorders the remaining cards and discards those already drawn
+        """
+        self.cards = self.cards[self.top:]
+        self.top = 0
+        rng.shuffle(self.cards)
+
+# ====================================  Snapshot Methods ==========================================
+
+    def snapshot(self):
+        """
+        Records the cards of this Deck and how many have been drawn, in a copy of the list of cards
+        :return: Tuple to give to restore
+        """
+        return (list(self.cards), self.top)
+
+    def restore(self, record):
+        """
+        :effect Puts back the cards of this Deck as recorded, undoing any draws since
+        :param record: Tuple given by snapshot
+        """
+        (cards, self.top) = record
+        self.cards = list(cards)
+
+    def fork(self):
+        """
+        Makes a Deck holding a copy of the cards left in this one
+        :return: Deck
+        """
+        deck = Deck()
+        deck.restore(self.snapshot())
+        return deck
+
+# ====================================  Conversion Methods ==========================================
+
+    def convert_to_json(self):
+        """
+        Converts the cards left in this Deck into a list of JSON SpeciesCards
+        :return: List of JSON SpeciesCard as specified by the data definition at
+                 http://www.ccs.neu.edu/home/matthias/4500-s16/8.html
+        """
+        return [trait_card.convert_to_json() for trait_card in self]
@@ -0,0 +1,65 @@
+import unittest
+import copy
+from random import Random
+from deck import Deck
+from traitcard import TraitCard
+from globals import *
+
+
+class TestDeck(unittest.TestCase):
+
+    def setUp(self):
+        self.carnivore = TraitCard(CARNIVORE, 3)
+        self.burrowing = TraitCard(BURROWING, 2)
+        self.fattissue = TraitCard(FATTISSUE, 2)
+        self.foraging = TraitCard(FORAGING, 2)
+        self.deck = Deck([self.carnivore, self.burrowing, self.fattissue, self.foraging])
+
+    def test_draw(self):
+        self.assertEqual(self.deck.draw(), [self.carnivore])
+        self.assertEqual(self.deck.draw(2), [self.burrowing, self.fattissue])
+        self.assertEqual(self.deck.remaining(), 1)
+        self.assertEqual(self.deck.draw(5), [self.foraging])
+        self.assertEqual(self.deck.draw(5), [])
+        self.assertEqual(len(self.deck), 0)
+
+    def test_sequence(self):
+        self.deck.draw()
+        self.assertEqual(list(self.deck), [self.burrowing, self.fattissue, self.foraging])
+        self.assertEqual(self.deck[0], self.burrowing)
+        self.assertRaises(IndexError, self.deck.__getitem__, 3)
+        self.assertTrue(self.fattissue in self.deck)
+        self.assertFalse(self.carnivore in self.deck)
+        self.assertEqual(self.deck, [self.burrowing, self.fattissue, self.foraging])
+        self.assertNotEqual(self.deck, Deck([self.burrowing, self.fattissue]))
+
+    def test_shuffle(self):
+        self.deck.draw()
+        other_deck = copy.deepcopy(self.deck)
+        self.deck.shuffle(Random(3))
+        other_deck.shuffle(Random(3))
+        self.assertEqual(self.deck, other_deck)
+        self.assertEqual(sorted(self.deck, key=lambda card: card.trait),
+                         [self.burrowing, self.fattissue, self.foraging])
+
+    def test_convert_to_json(self):
+        self.deck.draw(2)
+        self.assertEqual(self.deck.convert_to_json(), [[2, FATTISSUE], [2, FORAGING]])
+
+    def test_snapshot(self):
+        self.deck.draw()
+        record = self.deck.snapshot()
+        other_deck = self.deck.fork()
+        self.deck.draw(2)
+        self.deck.shuffle(Random(3))
+        self.assertEqual(list(other_deck), [self.burrowing, self.fattissue, self.foraging])
+        self.deck.restore(record)
+        self.assertEqual(self.deck, other_deck)
+        self.assertIsNot(self.deck.cards, other_deck.cards)
+        self.deck.cards.reverse()
+        self.deck.restore(record)
+        self.assertEqual(self.deck, other_deck)
+
+
+if __name__ == '__main__':
+    unittest.main()
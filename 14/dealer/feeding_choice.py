@@ -9,10 +9,35 @@ class FeedingChoice(object):
     - HerbivoreFeeding
     - FatFeeding
     - CarnivoreFeeding
+    FeedingChoices are immutable, so they can be hashed and compared by their fields.
     """
+    __slots__ = ()
+
     def __init__(self):
         pass
 
+    def __setattr__(self, name, value):
+        """
+        Keeps this FeedingChoice immutable
+        :raise AttributeError whenever an attribute is set
+        """
+        raise AttributeError("FeedingChoices are immutable")
+
+    def __reduce__(self):
+        """
+        Lets this FeedingChoice be pickled although it cannot be changed after it is created
+        :return: (class, arguments) to create an equal FeedingChoice
+        """
+        return (type(self), tuple([getattr(self, name) for name in self.__slots__]))
+
+    def __ne__(self, other):
+        """
+        Compare attributes for testing.
+        :param other: The other object we are comparing
+        :return: True if not equal, else False
+        """
+        return not self.__eq__(other)
+
     def handle_feeding(self, dealer, feeding_player):
         """
         Updates the Dealer configuration according to the feeding Player's choice
@@ -34,6 +59,7 @@ class NoFeeding(FeedingChoice):
     """
     Represents the Player choosing to abstain from feeding for the rest of ths round
     """
+    __slots__ = ()
 
     def __eq__(self, other):
         """
@@ -43,13 +69,12 @@ class NoFeeding(FeedingChoice):
         """
         return isinstance(other, NoFeeding)
 
-    def __ne__(self, other):
+    def __hash__(self):
         """
-        Compare attributes for testing.
-        :param other: The other object we are comparing
-        :return: True if not equal, else False
+        Hashes this FeedingChoice by its fields, consistently with __eq__
+        :return: Int
         """
-        return not self.__eq__(other)
+        return hash(NoFeeding)
 
     def handle_feeding(self, dealer, feeding_player):
         """
@@ -71,6 +96,7 @@ class HerbivoreFeeding(FeedingChoice):
     """
     Represents the Player choosing to feed a single herbivore Species
     """
+    __slots__ = ('species_index',)
 
     def __init__(self, species_index):
         """
@@ -79,7 +105,7 @@ class HerbivoreFeeding(FeedingChoice):
         :return: a HerbivoreFeeding object
         """
         super(HerbivoreFeeding, self).__init__()
-        self.species_index = species_index
+        object.__setattr__(self, 'species_index', species_index)
 
     def __eq__(self, other):
         """
@@ -87,17 +113,15 @@ class HerbivoreFeeding(FeedingChoice):
         :param other: The other object we are comparing
         :return: True if equal, else False
         """
-        if isinstance(other, HerbivoreFeeding):
-            return self.species_index == other.species_index
-        return False
+        return self is other or (isinstance(other, HerbivoreFeeding) and
+                                 self.species_index == other.species_index)
 
-    def __ne__(self, other):
+    def __hash__(self):
         """
-        Compare attributes for testing.
-        :param other: The other object we are comparing
-        :return: True if not equal, else False
+        Hashes this FeedingChoice by its fields, consistently with __eq__
+        :return: Int
         """
-        return not self.__eq__(other)
+        return hash((HerbivoreFeeding, self.species_index))
 
     def handle_feeding(self, dealer, feeding_player):
         """
@@ -122,6 +146,8 @@ class FatFeeding(FeedingChoice):
     """
     Represents the Player choosing to feed a fat-tissue Species
     """
+    __slots__ = ('species_index', 'fat_request')
+
     def __init__(self, species_index, fat_request):
         """
         Creates a FatFeeding
@@ -130,8 +156,8 @@ class FatFeeding(FeedingChoice):
         :return: a FatFeeding object
         """
         super(FatFeeding, self).__init__()
-        self.species_index = species_index
-        self.fat_request = fat_request
+        object.__setattr__(self, 'species_index', species_index)
+        object.__setattr__(self, 'fat_request', fat_request)
 
     def __eq__(self, other):
         """
@@ -139,18 +165,16 @@ class FatFeeding(FeedingChoice):
         :param other: The other object we are comparing
         :return: True if equal, else False
         """
-        if isinstance(other, FatFeeding):
-            return all([self.species_index == other.species_index,
-                        self.fat_request == other.fat_request])
-        return False
+        return self is other or (isinstance(other, FatFeeding) and
+                                 self.species_index == other.species_index and
+                                 self.fat_request == other.fat_request)
 
-    def __ne__(self, other):
+    def __hash__(self):
         """
-        Compare attributes for testing.
-        :param other: The other object we are comparing
-        :return: True if not equal, else False
+        Hashes this FeedingChoice by its fields, consistently with __eq__
+        :return: Int
         """
-        return not self.__eq__(other)
+        return hash((FatFeeding, self.species_index, self.fat_request))
 
     def handle_feeding(self, dealer, feeding_player):
         """
@@ -178,6 +202,7 @@ class CarnivoreFeeding(FeedingChoice):
     """
     Represents the Player choosing to feed a carnivore Species
     """
+    __slots__ = ('attacker_index', 'defending_player_index', 'defender_index')
 
     def __init__(self, attacker_index, defending_player_index, defender_index):
         """
@@ -188,9 +213,9 @@ class CarnivoreFeeding(FeedingChoice):
         :return: a CarnivoreFeeding object
         """
         super(CarnivoreFeeding, self).__init__()
-        self.attacker_index = attacker_index
-        self.defending_player_index = defending_player_index
-        self.defender_index = defender_index
+        object.__setattr__(self, 'attacker_index', attacker_index)
+        object.__setattr__(self, 'defending_player_index', defending_player_index)
+        object.__setattr__(self, 'defender_index', defender_index)
 
     def __eq__(self, other):
         """
@@ -198,19 +223,17 @@ class CarnivoreFeeding(FeedingChoice):
         :param other: The other object we are comparing
         :return: True if equal, else False
         """
-        if isinstance(other, CarnivoreFeeding):
-            return all([self.attacker_index == other.attacker_index,
-                        self.defending_player_index == other.defending_player_index,
-                        self.defender_index == other.defender_index])
-        return False
+        return self is other or (isinstance(other, CarnivoreFeeding) and
+                                 self.attacker_index == other.attacker_index and
+                                 self.defending_player_index == other.defending_player_index and
+                                 self.defender_index == other.defender_index)
 
-    def __ne__(self, other):
+    def __hash__(self):
         """
-        Compare attributes for testing.
-        :param other: The other object we are comparing
-        :return: True if not equal, else False
+        Hashes this FeedingChoice by its fields, consistently with __eq__
+        :return: Int
         """
-        return not self.__eq__(other)
+        return hash((CarnivoreFeeding, self.attacker_index, self.defending_player_index, self.defender_index))
 
     def handle_feeding(self, dealer, feeding_player):
         """
@@ -220,7 +243,7 @@ class CarnivoreFeeding(FeedingChoice):
         :param feeding_player: the PlayerState of the Player choosing how to feed
         """
         attacker = feeding_player.species[self.attacker_index]
-        defending_player = dealer.list_of_players[self.defending_player_index + 1 % len(dealer.list_of_players)]
+        defending_player = dealer.other_player(self.defending_player_index)
         defender = defending_player.species[self.defender_index]
         assert(attacker in feeding_player.get_hungry_species(carnivores=True) and
                defender.is_attackable(attacker, defending_player.get_left_neighbor(defender),
@@ -241,7 +264,7 @@ class CarnivoreFeeding(FeedingChoice):
         :param dealer: Dealer running this game
         """
         self.handle_attacked_species(defender, defending_player, dealer)
-        if HORNS in defender.trait_names():
+        if defender.has_trait(HORNS):
             self.handle_attacked_species(attacker, feeding_player, dealer)
 
     def handle_attacked_species(self, species, player, dealer):
@@ -250,7 +273,7 @@ class CarnivoreFeeding(FeedingChoice):
         :param species: a Species harmed in an attack
         :param player: the PlayerState of the player owning the given Species
         """
-        species.reduce_population()
+        player.reduce_population(species)
         self.handle_extinction(species, player, dealer)
 
     def handle_extinction(self, species, player, dealer):
@@ -260,7 +283,7 @@ class CarnivoreFeeding(FeedingChoice):
         :param player: the PlayerState of the player owning the given Species
         """
         if species.population < MIN_POP:
-            player.species.remove(species)
+            player.remove_species(species)
             dealer.deal_cards(player, EXTINCTION_CARD_AMOUNT)
 
     def convert_to_json(self):
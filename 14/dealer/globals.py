@@ -18,6 +18,7 @@ WARNINGCALL = "warning-call"
 
 TRAITS_LIST = [CARNIVORE, AMBUSH, BURROWING, CLIMBING, COOPERATION, FATTISSUE, FERTILE, FORAGING,
                HARDSHELL, HERDING, HORNS, LONGNECK, PACKHUNTING, SCAVENGER, SYMBIOSIS,  WARNINGCALL]
+TRAIT_BITS = dict((TRAITS_LIST[i], 1 << i) for i in range(len(TRAITS_LIST)))
 
 CARN_FOOD_MIN = -8
 CARN_FOOD_MAX = 8
@@ -51,6 +52,7 @@ CARN_FEED_LENGTH = 3
 EXTINCTION_CARD_AMOUNT = 2
 DEAL_AMOUNT = 3
 SCORE_TEMPLATE = "%d player id: %s score: %d"
+SEED_TEMPLATE = "seed: %d"
 
 ### JSON messages
 ## Length
@@ -83,13 +85,57 @@ GROW_BODY_AMOUNT = 1
 CHANGE_TEMPLATE = "[%s, %s->%s]"
 CARD_TEMPLATE = "[%s, %d]"
 
+### Validation
+FULL_VALIDATION = "full"
+INCREMENTAL_VALIDATION = "incremental"
+SAMPLED_VALIDATION = "sampled"
+NO_VALIDATION = "off"
+VALIDATION_SAMPLE = 8
+
 ### Server / Client
 PROXY_ID = 1
 TIMEOUT = 3
+RECV_SIZE = 4096
+SCALAR_GRACE = 0.01
+NEWLINE_FRAMING = "newline"
+LENGTH_FRAMING = "length"
 PORT = 9998
 HOSTNAME = 'localhost'
 SIGNUP_TIME = 60
+GAME_TIME = 900
+TABLE_TEMPLATE = "table %d:\n%s"
 SIGNUP_MSG = "sign-up"
 SIGNUP_RSP = "ok"
 CHOOSE_LEN = 4
+ALL_PLAYERS_LEN = 2
 FEED_LEN = 5
+PIPELINE = "pipeline"
+DELTA = "delta"
+FEATURES = [PIPELINE, DELTA]
+START_CHOOSE = "start-choose"
+FEED_DELTA = "feed-delta"
+CHOOSE = "choose"
+FEED = "feed"
+LATENCY_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+METRICS_GAMES = 100
+STATS_INTERVAL = 5
+STATS_ERROR_TEMPLATE = "could not dump stats to %s:\n%s"
+
+### Tournament
+DEFAULT_STRATEGY = "greedy"
+TASKS_PER_WORKER = 4
+RATE_TEMPLATE = "%d player id: %s strategy: %s win-rate: %.3f mean score: %.2f"
+THROUGHPUT_TEMPLATE = "%d games (%d failed) in %.2fs: %.1f games/second on %d workers"
+FAILURE_TEMPLATE = "Game with seed %d failed:\n%s"
+
+### Look-ahead
+LOOKAHEAD_STRATEGY = "lookahead"
+LOOKAHEAD_BUDGET = TIMEOUT / 3.0
+LOOKAHEAD_ROLLOUTS = 8
+ROLLOUT_EPSILON = 0.1
+POOL_SHARE = 0.8
+
+### Bots
+BOT_TEMPLATE = "bot: %s strategy: %s messages: %d mean wait: %.1fms max wait: %.1fms mean think: %.1fms"
+BOT_ERROR_TEMPLATE = " failed: %s: %s"
+BOTS_TEMPLATE = "%d bots (%d not signed up, %d failed) answered %d messages in %.2fs: %.1f messages/second"
@@ -1,5 +1,3 @@
-from Tkinter import *
-
 species_template = "        [%d, %d, %d, %s, %s]"
 card_template = "[%d, %s]"
 player_template = """Player %d:
@@ -16,27 +14,29 @@ dealer_template = """Dealer Configuration:
 
 def display(text):
     """
-    Displays the given string of text in a GUI display window
+    Displays the given string of text in a GUI display window.
+    Tkinter is imported here so that headless games never load it.
     :param text: String of text to be displayed
     """
-    root = Tk()
+    import Tkinter as tk
+    root = tk.Tk()
     set_geometry(root, text)
 
-    xscroll = Scrollbar(root, orient=HORIZONTAL)
-    xscroll.pack(side=BOTTOM, fill=X)
-    yscroll = Scrollbar(root)
-    yscroll.pack(side=RIGHT, fill=Y)
+    xscroll = tk.Scrollbar(root, orient=tk.HORIZONTAL)
+    xscroll.pack(side=tk.BOTTOM, fill=tk.X)
+    yscroll = tk.Scrollbar(root)
+    yscroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-    text_window = Text(root, wrap=NONE,
-                       xscrollcommand=xscroll.set,
-                       yscrollcommand=yscroll.set)
+    text_window = tk.Text(root, wrap=tk.NONE,
+                          xscrollcommand=xscroll.set,
+                          yscrollcommand=yscroll.set)
     text_window.pack(expand=True)
 
     xscroll.config(command=text_window.xview)
     yscroll.config(command=text_window.yview)
 
-    text_window.insert(END, text)
-    mainloop()
+    text_window.insert(tk.END, text)
+    tk.mainloop()
 
 
 def set_geometry(root, text):
@@ -61,7 +61,7 @@ def render_dealer(dealer):
     :return: String representing the dealer
     """
     return dealer_template % (dealer.watering_hole, render_traitcards(dealer.deck),
-                              render_players(dealer.list_of_players))
+                              render_players(dealer.players_in_order()))
 
 
 def render_players(list_of_players):
@@ -0,0 +1,354 @@
+import sys
+import time
+from multiprocessing import Pool, TimeoutError
+from random import Random
+from globals import *
+from feeding_choice import *
+from action import *
+from action4 import Action4
+from player import Player
+from player_state import PlayerState
+from dealer import Dealer
+from deck import Deck
+
+
+def play_rollouts(task):
+    """
+    Plays rollouts of each choice, one round of them per seed, until the rounds are done or the deadline
+    passes. Every choice in a round is played with the same seed, so they meet the same luck. Module level
+    so that pool workers can receive it.
+    :param task: (Simulation, List of Action4 or FeedingChoice, List of Natural, Number) the simulation, the
+                 choices to play, the seed of each round and the time.time() by which to stop
+    :return: (List of Number, List of Natural) the total margin and the number of rollouts of each choice
+    """
+    (simulation, choices, seeds, deadline) = task
+    totals, counts = [0.0] * len(choices), [0] * len(choices)
+    for seed in seeds:
+        for i in range(len(choices)):
+            if time.time() > deadline:
+                return (totals, counts)
+            totals[i] += simulation.rollout(choices[i], Random(seed))
+            counts[i] += 1
+    return (totals, counts)
+
+
+class LookaheadPlayer(Player):
+    """
+    A Player that searches for its choices instead of following a fixed rule. It tries each candidate Action4
+    or FeedingChoice in randomized rollouts of the rest of the turn, played by the Dealer on a copy of the
+    boards it can see, and picks the one that leaves it furthest ahead of the best other player. The greedy
+    Player's choice is always a candidate. Each decision stops searching when its time budget is spent.
+    """
+    def __init__(self, id=0, player_state=False, budget=LOOKAHEAD_BUDGET, rollouts=LOOKAHEAD_ROLLOUTS,
+                 workers=False, seed=False):
+        """
+        Creates a LookaheadPlayer
+        :param id: Natural+ identifying the player
+        :param player_state: the PlayerState of this player
+        :param budget: Number of seconds each decision may take
+        :param rollouts: Natural+ representing the most rollouts of each candidate
+        :param workers: Natural+ representing the number of worker processes to play rollouts on, or False to
+                        play them in this process
+        :param seed: Natural seeding the rollouts, or False to seed them with the id
+        :return: a LookaheadPlayer object
+        """
+        super(LookaheadPlayer, self).__init__(id, player_state)
+        self.budget = budget
+        self.rollouts = rollouts
+        self.workers = workers
+        self.rng = Random(seed if seed is not False else id)
+        self.watering_hole = MIN_WATERING_HOLE
+        self.pool = False
+
+    def start(self, watering_hole, state):
+        """
+        :effect Keeps the given state and the food at the watering hole for choosing this turn's actions
+        :param watering_hole: Natural representing the current food at the watering hole
+        :param state: the PlayerState of this player
+        """
+        self.watering_hole = watering_hole
+        self.player_state = state
+
+    def choose(self, left_players, right_players):
+        """
+        Determines the actions this player wants to perform for this turn by trying the candidates out
+        :param left_players: the players to the left of this player.
+        :param right_players: the players to the right of this player.
+        :return: Action4 for the actions they want to perform
+        """
+        greedy = super(LookaheadPlayer, self).choose(left_players, right_players)
+        simulation = Simulation(self.player_state, left_players + right_players, self.watering_hole,
+                                len(left_players))
+        return self.search(simulation, [greedy] + self.candidate_action4s())
+
+    def next_feeding(self, updated_player, food_available, list_of_players):
+        """
+        Determines this player's next FeedingChoice by trying the candidates out
+        :param updated_player: the PlayerState that needs to be updated for this player.
+        :param food_available: the amount of food on the watering hole board
+        :param list_of_players: the PlayerStates of other players in the game
+        :return: FeedingChoice for the next species to feed
+        """
+        greedy = super(LookaheadPlayer, self).next_feeding(updated_player, food_available, list_of_players)
+        simulation = Simulation(updated_player, list_of_players, food_available, 0)
+        candidates = self.feeding_choices(updated_player, food_available, list_of_players)
+        return self.search(simulation, ([greedy] if greedy else []) + candidates)
+
+    def close(self):
+        """
+        :effect Stops the worker processes, if any have been started
+        """
+        if self.pool:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = False
+
+# ======================================  Candidate Methods ==========================================
+
+    def candidate_action4s(self):
+        """
+        Proposes Action4s for this player's hand: each card as the food card, with the rest of the hand either
+        kept, spent growing the population or body of one species, or spent on a new species with one of the
+        cards as its trait and the others growing its population
+        :return: List of Action4
+        """
+        hand, species_count = self.player_state.hand, len(self.player_state.species)
+        candidates = []
+        for food in range(len(hand)):
+            rest = [i for i in range(len(hand)) if i != food]
+            food_card = FoodCardAction(food)
+            candidates.append(Action4(food_card))
+            for species_index in range(species_count):
+                candidates.append(Action4(food_card, grow_pop=[GrowAction(POPULATION, species_index, i)
+                                                               for i in rest]))
+                candidates.append(Action4(food_card, grow_body=[GrowAction(BODY, species_index, i)
+                                                                for i in rest]))
+            for trait in rest:
+                others = [i for i in rest if i != trait]
+                if others:
+                    candidates.append(Action4(food_card, grow_pop=[GrowAction(POPULATION, species_count, i)
+                                                                   for i in others[1:]],
+                                              add_species=[AddSpeciesAction(others[0], [trait])]))
+        return candidates
+
+    @classmethod
+    def feeding_choices(cls, player_state, food_available, list_of_players):
+        """
+        Gives every feeding the given player may choose: filling each needy fat-tissue species, feeding each
+        hungry herbivore, each attack of each hungry carnivore on another player's species, and not feeding
+        :param player_state: the PlayerState of the feeding player
+        :param food_available: the amount of food on the watering hole board
+        :param list_of_players: the PlayerStates of other players in the game
+        :return: List of FeedingChoice
+        """
+        choices = [FatFeeding(player_state.species_index(species),
+                              min(species.body - species.fat_storage, food_available))
+                   for species in player_state.get_needy_fats()]
+        choices += [HerbivoreFeeding(player_state.species_index(species))
+                    for species in player_state.get_hungry_species(carnivores=False)]
+        for carnivore in player_state.get_hungry_species(carnivores=True):
+            for (player_index, defender_index, defender) in carnivore.all_attackable_targets(list_of_players):
+                if list_of_players[player_index] is not player_state:
+                    choices.append(CarnivoreFeeding(player_state.species_index(carnivore), player_index,
+                                                    defender_index))
+        return choices + [NoFeeding()]
+
+# ======================================  Search Methods ==========================================
+
+    def search(self, simulation, candidates):
+        """
+        Picks the candidate with the best mean margin over its rollouts. Candidates the Dealer would reject
+        are left out, and so are repeats. Ties go to the earlier candidate.
+        :param simulation: Simulation of the rest of the turn from this player's point of view
+        :param candidates: List of Action4 or FeedingChoice, the greedy choice first if there is one
+        :return: the best candidate, or the first if none can be played
+        """
+        deadline = time.time() + self.budget
+        choices, seen = [], set()
+        for candidate in candidates:
+            if candidate not in seen and simulation.is_valid(candidate):
+                choices.append(candidate)
+            seen.add(candidate)
+        if len(choices) < 2:
+            return choices[0] if choices else candidates[0]
+        seeds = [self.rng.randint(0, sys.maxint) for i in range(self.rollouts)]
+        if self.workers:
+            (totals, counts) = self.pool_rollouts(simulation, choices, seeds, deadline)
+        else:
+            (totals, counts) = play_rollouts((simulation, choices, seeds, deadline))
+        best = max(range(len(choices)), key=lambda i: (counts[i] > 0, totals[i] / max(1, counts[i]), -i))
+        return choices[best]
+
+    def pool_rollouts(self, simulation, choices, seeds, deadline):
+        """
+        Plays the rollouts on the worker processes, dealing the choices round them. Workers stop early enough
+        to send back their results within the budget; a worker that is late is left out.
+        :param simulation: Simulation of the rest of the turn from this player's point of view
+        :param choices: List of Action4 or FeedingChoice to play
+        :param seeds: List of Natural seeding each round of rollouts
+        :param deadline: Number representing the time.time() by which the decision must be made
+        :return: (List of Number, List of Natural) the total margin and the number of rollouts of each choice
+        """
+        if not self.pool:
+            self.pool = Pool(self.workers)
+        work_deadline = time.time() + POOL_SHARE * (deadline - time.time())
+        results = [self.pool.apply_async(play_rollouts, ((simulation, choices[k::self.workers], seeds,
+                                                          work_deadline),))
+                   for k in range(self.workers)]
+        totals, counts = [0.0] * len(choices), [0] * len(choices)
+        for k in range(len(results)):
+            try:
+                (worker_totals, worker_counts) = results[k].get(max(0.0, deadline - time.time()))
+            except TimeoutError:
+                continue
+            for j in range(len(worker_totals)):
+                totals[k + j * self.workers] = worker_totals[j]
+                counts[k + j * self.workers] = worker_counts[j]
+        return (totals, counts)
+
+
+class RolloutPlayer(Player):
+    """
+    The Player that plays every seat in a rollout: the greedy Player, except that it now and then feeds at
+    random, so that rollouts cover more than the one line of play
+    """
+    def __init__(self, id=0, epsilon=ROLLOUT_EPSILON):
+        """
+        Creates a RolloutPlayer
+        :param id: Natural+ identifying the player
+        :param epsilon: Number between 0 and 1 representing the chance of feeding at random
+        :return: a RolloutPlayer object
+        """
+        super(RolloutPlayer, self).__init__(id)
+        self.epsilon = epsilon
+        self.rng = Random(id)
+
+    def next_feeding(self, updated_player, food_available, list_of_players):
+        """
+        Determines a players next FeedingChoice, greedily or now and then at random
+        :param updated_player: the PlayerState that needs to be updated for this player.
+        :param food_available: the amount of food on the watering hole board
+        :param list_of_players: the PlayerStates of other players in the game
+        :return: FeedingChoice for the next species to feed
+        """
+        if self.rng.random() < self.epsilon:
+            self.player_state = updated_player
+            return self.rng.choice(LookaheadPlayer.feeding_choices(updated_player, food_available, list_of_players))
+        feeding = super(RolloutPlayer, self).next_feeding(updated_player, food_available, list_of_players)
+        return feeding if feeding else NoFeeding()
+
+
+class Simulation(object):
+    """
+    The rest of a turn as one player sees it: a Dealer holding a copy of that player's state and of the other
+    players' boards, with the cards the player has not seen as the deck. Each rollout restores the Dealer to
+    a snapshot, so the copy is made once per decision. A pickled Simulation carries that snapshot with the
+    Dealer, and is restored to it when unpickled, so pickling leaves the Simulation as it is.
+    """
+    def __init__(self, player_state, other_players, watering_hole, position):
+        """
+        Creates a Simulation
+        :param player_state: the PlayerState of the deciding player
+        :param other_players: the other players, in seating order from the player after the deciding player
+                              if it feeds, or from the first player this turn if it chooses actions
+        :param watering_hole: Natural representing the food at the watering hole
+        :param position: Natural index of the deciding player's seat, counting from the first of other_players
+        :return: a Simulation object
+        """
+        self.name = player_state.name
+        self.position = position
+        player = player_state.fork()
+        player.ext_player = RolloutPlayer(player.name)
+        players = [PlayerState(other.name, MIN_FOOD_BAG, [], [species.fork() for species in other.species],
+                               True, RolloutPlayer(other.name)) for other in other_players]
+        players.insert(position, player)
+        self.unseen = self.unseen_cards(players)
+        self.dealer = Dealer(players, watering_hole, Deck(list(self.unseen)), 0, NO_VALIDATION)
+        self.base = self.dealer.snapshot()
+        self.base_scores = self.scores()
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.dealer.restore(self.base)
+
+    @classmethod
+    def unseen_cards(cls, players):
+        """
+        Gives the cards of a full deck that are not in the given hands or on the given boards. Every card in
+        the deck is different, so a card seen anywhere is not in the deck.
+        :param players: List of PlayerState
+        :return: List of TraitCard in deck order
+        """
+        seen = set()
+        for player in players:
+            seen.update(player.hand)
+            for species in player.species:
+                seen.update(species.traits)
+        return [card for card in Dealer.make_deck() if card not in seen]
+
+    def is_valid(self, choice):
+        """
+        Determines if the Dealer would accept the given choice from the deciding player
+        :param choice: Action4 or FeedingChoice
+        :return: True if the choice can be played, else False
+        """
+        self.dealer.restore(self.base)
+        player = self.dealer.list_of_players[self.position]
+        try:
+            if isinstance(choice, Action4):
+                choice.validate_hand(player)
+                choice.apply_all(self.dealer, player)
+                player.validate_attributes()
+            else:
+                choice.handle_feeding(self.dealer, player)
+        except Exception:
+            return False
+        return True
+
+    def rollout(self, choice, rng):
+        """
+        Plays the rest of the turn after the deciding player makes the given choice. When choosing actions,
+        each other player puts a random unseen card on the watering hole and nothing else; every player then
+        feeds as a RolloutPlayer.
+        :param choice: Action4 or FeedingChoice of the deciding player
+        :param rng: the Random this rollout draws from
+        :return: Number representing the deciding player's margin, as given by margin
+        """
+        self.dealer.restore(self.base)
+        for player in self.dealer.list_of_players:
+            player.ext_player.rng = rng
+        if isinstance(choice, Action4):
+            action4_list = []
+            for player in self.dealer.list_of_players:
+                if player.name == self.name:
+                    action4_list.append(choice)
+                else:
+                    player.hand = [rng.choice(self.unseen)]
+                    action4_list.append(Action4(FoodCardAction(0)))
+            self.dealer.step4(action4_list)
+        else:
+            choice.handle_feeding(self.dealer, self.dealer.current_player())
+            self.dealer.current = 1 % len(self.dealer.list_of_players)
+            self.dealer.feeding()
+        self.dealer.end_turn()
+        return self.margin()
+
+    def scores(self):
+        """
+        Gives the score of each player still in the simulated game. The other players' food bags are not known,
+        so they are counted from MIN_FOOD_BAG.
+        :return: Dictionary {Natural: Natural} mapping player name to score
+        """
+        return dict((player.name, player.food_bag + player.total_population + player.trait_count)
+                    for player in self.dealer.list_of_players)
+
+    def margin(self):
+        """
+        Gives how much more the deciding player's score gained since the decision than the score of the other
+        player who gained most. Only gains are compared, as the other players' food bags are not known.
+        :return: Number, negative if another player gained more
+        """
+        scores = self.scores()
+        gains = dict((name, scores[name] - self.base_scores[name]) for name in scores)
+        gain = gains.pop(self.name, -self.base_scores[self.name])
+        return gain - max(gains.values()) if gains else gain
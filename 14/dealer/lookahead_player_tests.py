@@ -0,0 +1,93 @@
+import unittest
+import pickle
+from species import Species
+from traitcard import TraitCard
+from player import Player
+from player_state import PlayerState
+from dealer import Dealer
+from lookahead_player import LookaheadPlayer, Simulation
+from random import Random
+from globals import *
+from feeding_choice import *
+
+
+class TestLookaheadPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.carnivore = Species(3, 0, 4, [TraitCard(CARNIVORE, 2)])
+        self.herbivore = Species(2, 0, 2, [TraitCard(FORAGING, 1)])
+        self.fatty = Species(2, 0, 3, [TraitCard(FATTISSUE, 0)], 0)
+        self.lookahead = LookaheadPlayer(1, rollouts=4)
+        self.player_1 = PlayerState(1, 2, [TraitCard(HORNS, 3), TraitCard(CLIMBING, -1)],
+                                    [self.carnivore, self.herbivore, self.fatty], ext_player=self.lookahead)
+        self.player_2 = PlayerState(2, 0, [], [Species(2, 0, 1), Species(4, 1, 1, [TraitCard(HORNS, 0)])],
+                                    ext_player=Player(2))
+        self.player_3 = PlayerState(3, 0, [], [Species(1, 0, 5, [TraitCard(CLIMBING, 0)])], ext_player=Player(3))
+        self.others = [self.player_2, self.player_3]
+
+    def test_feeding_choices(self):
+        self.assertEqual(LookaheadPlayer.feeding_choices(self.player_1, 2, self.others),
+                         [FatFeeding(2, 2), HerbivoreFeeding(1), HerbivoreFeeding(2), CarnivoreFeeding(0, 0, 0),
+                          CarnivoreFeeding(0, 0, 1), NoFeeding()])
+
+    def test_next_feeding(self):
+        before = self.player_1.snapshot()
+        feeding = self.lookahead.next_feeding(self.player_1, 5, self.others)
+        self.assertIn(feeding, LookaheadPlayer.feeding_choices(self.player_1, 5, self.others))
+        self.assertEqual(self.player_1.snapshot(), before)
+        self.assertEqual([species.food for species in self.player_2.species], [0, 1])
+
+    def test_budget(self):
+        greedy = Player(1).next_feeding(self.player_1, 5, self.others)
+        self.assertEqual(LookaheadPlayer(1, budget=0).next_feeding(self.player_1, 5, self.others), greedy)
+
+    def test_choose(self):
+        self.player_1.hand += [TraitCard(AMBUSH, 1), TraitCard(SCAVENGER, 2)]
+        self.lookahead.start(4, self.player_1)
+        action4 = self.lookahead.choose([self.player_3], [self.player_2])
+        simulation = Simulation(self.player_1, self.others, 4, 0)
+        self.assertTrue(simulation.is_valid(action4))
+        self.assertEqual(len(self.player_1.hand), 4)
+
+    def test_pool(self):
+        pooled = LookaheadPlayer(1, rollouts=4, workers=2)
+        try:
+            self.assertEqual(pooled.next_feeding(self.player_1, 5, self.others),
+                             self.lookahead.next_feeding(self.player_1, 5, self.others))
+        finally:
+            pooled.close()
+
+    def test_search(self):
+        fatty = Species(1, 1, 3, [TraitCard(FATTISSUE, 0)], 0)
+        herbivore = Species(2, 1, 1, [TraitCard(FORAGING, 1)])
+        player = PlayerState(1, 0, [], [fatty, herbivore], ext_player=self.lookahead)
+        self.assertEqual(Player(1).next_feeding(player, 1, self.others), FatFeeding(0, 1))
+        self.assertEqual(self.lookahead.next_feeding(player, 1, self.others), HerbivoreFeeding(1))
+        simulation = Simulation(player, self.others, 1, 0)
+        margins = [simulation.rollout(choice, Random(0)) for choice in [FatFeeding(0, 1), HerbivoreFeeding(1)]]
+        self.assertEqual(margins[1] - margins[0], 2)
+
+    def test_pickle(self):
+        simulation = Simulation(self.player_1, self.others, 5, 0)
+        margin = simulation.rollout(NoFeeding(), Random(0))
+        played = simulation.dealer.fork()
+        copy = pickle.loads(pickle.dumps(simulation, pickle.HIGHEST_PROTOCOL))
+        self.assertTrue(simulation.dealer.equal_attributes(played))
+        self.assertTrue(copy.dealer.equal_attributes(Simulation(self.player_1, self.others, 5, 0).dealer))
+        self.assertEqual(copy.rollout(NoFeeding(), Random(0)), margin)
+
+    def test_unseen_cards(self):
+        unseen = Simulation.unseen_cards([self.player_1] + self.others)
+        self.assertEqual(len(unseen), LOC_MAX - 7)
+        self.assertNotIn(TraitCard(HORNS, 3), unseen)
+        self.assertNotIn(TraitCard(CARNIVORE, 2), unseen)
+
+    def test_game(self):
+        dealer = Dealer.create_initial([LookaheadPlayer(1, rollouts=2), Player(2), Player(3)], 5,
+                                       INCREMENTAL_VALIDATION)
+        dealer.run_game()
+        self.assertIn(1, [player.name for player in dealer.list_of_players])
+
+
+if __name__ == '__main__':
+    unittest.main()
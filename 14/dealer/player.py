@@ -74,7 +74,7 @@ class Player(object):
         fatty = self.largest_fatty_need(fat_tissue_species)
         food_needed = fatty.body - fatty.fat_storage
         food_requested = (food_needed if food_needed < food_available else food_available)
-        return FatFeeding(self.player_state.species.index(fatty), food_requested)
+        return FatFeeding(self.player_state.species_index(fatty), food_requested)
 
     def feed_herbivores(self, hungry_herbivores):
         """
@@ -83,7 +83,7 @@ class Player(object):
         :return: the Species to feed
         """
         herbivore = self.sort_by_size(hungry_herbivores)[0]
-        return HerbivoreFeeding(self.player_state.species.index(herbivore))
+        return HerbivoreFeeding(self.player_state.species_index(herbivore))
 
     def feed_carnivore(self, hungry_carnivores, list_of_players):
         """
@@ -97,26 +97,35 @@ class Player(object):
         """
         sorted_carnivores = self.sort_by_size(hungry_carnivores)
         for carnivore in sorted_carnivores:
-            targets = carnivore.all_attackable_species(list_of_players)
+            targets = [target for target in carnivore.all_attackable_targets(list_of_players)
+                       if list_of_players[target[0]] is not self.player_state]
             if targets:
-                return self.attack_largest(carnivore, targets, list_of_players)
+                return self.attack_largest(carnivore, targets)
 
-    def attack_largest(self, attacker, targets, list_of_player):
+    def attack_largest(self, attacker, targets):
         """
         Return a CarnivoreFeeding by attacking the largest species in the targets.
         :param attacker: The attacking species
-        :param targets: The target species the attacker can attack
-        :param list_of_player: The game's list of players
-        :return:
+        :param targets: List of (Nat, Nat, Species) representing the index of the defending player, the index of
+                        the defending Species and the Species for each target the attacker can attack
+        :return: CarnivoreFeeding
         """
-        target = self.sort_by_size(targets)[0]
-        target_player = next(other_player for other_player in list_of_player if target in other_player.species and
-                             other_player is not self.player_state)
-        return CarnivoreFeeding(self.player_state.species.index(attacker),
-                                list_of_player.index(target_player),
-                                target_player.species.index(target))
-
+        largest = self.size_order([target[2] for target in targets])[0]
+        (def_player_index, defender_index, defender) = targets[largest]
+        return CarnivoreFeeding(self.player_state.species_index(attacker), def_player_index, defender_index)
 
+    @classmethod
+    def size_order(cls, list_of_species):
+        """
+        Returns the indices of the Species objects ordered largest to smallest according to the order specified.
+        Ties are broken in favor of the Species that comes first in the list.
+        :param list_of_species: a list of Species objects
+        :return: a list of Nat representing indices into the list of Species
+        """
+        return sorted(range(len(list_of_species)),
+                      key=lambda i: (list_of_species[i].population, list_of_species[i].food,
+                                     list_of_species[i].body, -i),
+                      reverse=True)
 
     @classmethod
     def sort_by_size(cls, list_of_species):
@@ -125,10 +134,7 @@ class Player(object):
         :param list_of_species: a list of Species objects
         :return: a list of Species objects ordered by size
         """
-        return sorted(list_of_species,
-                      key=lambda species: (species.population, species.food,
-                                           species.body, -list_of_species.index(species)),
-                      reverse=True)
+        return [list_of_species[i] for i in cls.size_order(list_of_species)]
 
     @classmethod
     def largest_fatty_need(cls, list_of_species):
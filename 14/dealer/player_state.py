@@ -13,6 +13,9 @@ class PlayerState(object):
     the dealer only sends the minimum amount of data needed for the player to make
     choices
     """
+    __slots__ = ('name', 'food_bag', 'hand', 'species', 'active', 'ext_player', 'positions', 'total_population',
+                 'trait_count')
+
     def __init__(self, name=1, food_bag=0, hand=False, species=False, active=True, ext_player=False):
         """
         Creates a PlayerState
@@ -30,6 +33,8 @@ class PlayerState(object):
         self.species = species if species else []
         self.active = active
         self.ext_player = ext_player
+        self.positions = {}
+        self.sync_totals()
 
     def equal_attributes(self, other):
         """
@@ -54,10 +59,24 @@ class PlayerState(object):
             - (3) number of trait cards associated with these species.
         :return: Nat representing this players score
         """
-        score = self.food_bag
-        for spec in self.species:
-            score += spec.population + len(spec.traits)
-        return (self.ext_player.id, score)
+        return (self.ext_player.id, self.food_bag + self.total_population + self.trait_count)
+
+    def sync_totals(self):
+        """
+        :effect Recomputes the running totals of population and trait cards over this player's species, which
+                this PlayerState's methods otherwise keep up to date. Call after changing species directly.
+        """
+        self.total_population = sum([species.population for species in self.species])
+        self.trait_count = sum([len(species.traits) for species in self.species])
+
+    def count_species(self, species, sign=1):
+        """
+        :effect Adds the given species' population and trait cards to the running totals of this player
+        :param species: Species joining this player's board
+        :param sign: -1 to remove the species from the totals instead
+        """
+        self.total_population += sign * species.population
+        self.trait_count += sign * len(species.traits)
 
 # ======================================  Step 1 Methods ============================================
 
@@ -70,8 +89,9 @@ class PlayerState(object):
         :param new_cards: the appropriate number of cards to add to the had
         """
         if new_species:
-            self.species.append(new_species)
-        self.hand += new_cards
+            self.species = self.species + [new_species]
+            self.count_species(new_species)
+        self.hand = self.hand + new_cards
         state_copy = self
         self.ext_player.start(watering_hole, state_copy)
 
@@ -91,18 +111,30 @@ class PlayerState(object):
         :param public_players: A list of all the players without their hand or food_bag.
         :return: the ext_players Action4 for this turn
         """
-        left_players = []
-        right_players = []
-        list_length = len(public_players)
-        for i in range(0, list_length):
-            if public_players[i].name is self.name:
-                if i + 1 != list_length:
-                    right_players = public_players[i + 1:]
-                if i != 0:
-                    left_players = public_players[:i]
-
+        (left_players, right_players) = self.split_players(public_players)
         return self.ext_player.choose(left_players, right_players)
 
+    def request_choice(self, public_players):
+        """
+        :effect Sends the choose request to this player_state's external player without waiting for the answer,
+                if the external player can answer later. choose then collects the answer.
+        :param public_players: A list of all the players without their hand or food_bag.
+        """
+        if hasattr(self.ext_player, 'request_choice'):
+            (left_players, right_players) = self.split_players(public_players)
+            self.ext_player.request_choice(left_players, right_players)
+
+    def split_players(self, public_players):
+        """
+        Splits the public players into those to the left and those to the right of this player_state
+        :param public_players: A list of all the players without their hand or food_bag.
+        :return: (List, List) of the players to the left and to the right
+        """
+        for i in range(len(public_players)):
+            if public_players[i].name == self.name:
+                return (public_players[:i], public_players[i + 1:])
+        return ([], [])
+
 # ======================================  Step 4 Methods ============================================
 
     def next_feeding(self, watering_hole, other_players):
@@ -137,10 +169,10 @@ class PlayerState(object):
             return NoFeeding()
         elif len(fatties) == 1 and not (herbivores or carnivores):
             fatty = fatties[0]
-            return FatFeeding(self.species.index(fatty),
+            return FatFeeding(self.species_index(fatty),
                               min(fatty.body - fatty.fat_storage, watering_hole))
         elif len(herbivores) == 1 and not (carnivores or fatties):
-            return HerbivoreFeeding(self.species.index(herbivores[0]))
+            return HerbivoreFeeding(self.species_index(herbivores[0]))
         elif len(carnivores) == 1 and not (fatties or herbivores):
             return self.carnivore_auto_feeding(carnivores[0], other_players)
         return False
@@ -152,14 +184,12 @@ class PlayerState(object):
         :param other_players: List of PlayerStates for other, attackable Players
         :return: a FeedingChoice if Carnivore an auto-feed, else False
         """
-        targets = carnivore.all_attackable_species(other_players)
+        targets = carnivore.all_attackable_targets(other_players)
         if not targets:
             return NoFeeding()
         elif len(targets) == 1:
-            def_player = next(player for player in other_players if targets[0] in player.species)
-            return CarnivoreFeeding(self.species.index(carnivore),
-                                    other_players.index(def_player),
-                                    def_player.species.index(targets[0]))
+            (def_player_index, defender_index, defender) = targets[0]
+            return CarnivoreFeeding(self.species_index(carnivore), def_player_index, defender_index)
         return False
 
     def get_attackable_species(self, attacker):
@@ -168,13 +198,22 @@ class PlayerState(object):
         :param attacker: the attacking species
         :return: List of Species objects attackable by the given attacker
         """
-        attackable_species = []
-        for defender in self.species:
-            if attacker == defender:
+        return [defender for (defender_index, defender) in self.get_attackable_targets(attacker)]
+
+    def get_attackable_targets(self, attacker):
+        """
+        Find all species belonging to this player that are attackable by the given carnivore species, with their
+        positions on this player's board, in a single pass over the board
+        :param attacker: the attacking species
+        :return: List of (Nat, Species) representing the index and Species of each attackable species
+        """
+        attackable_targets = []
+        for (index, defender, left_neighbor, right_neighbor) in self.species_with_neighbors():
+            if attacker is defender:
                 continue
-            if defender.is_attackable(attacker, self.get_left_neighbor(defender), self.get_right_neighbor(defender)):
-                attackable_species.append(defender)
-        return attackable_species
+            if defender.is_attackable(attacker, left_neighbor, right_neighbor):
+                attackable_targets.append((index, defender))
+        return attackable_targets
 
     def end_turn(self):
         """
@@ -182,7 +221,9 @@ class PlayerState(object):
         :return: Natural representing amount of cards to be dealt due to extinct species
         """
         for species in self.species:
+            population = species.population
             self.food_bag += species.consolidate_food()
+            self.total_population += species.population - population
         return self.remove_extinct()
 
     def remove_extinct(self):
@@ -194,9 +235,11 @@ class PlayerState(object):
         for species in self.species:
             if species.population == 0:
                 card_amount += EXTINCTION_CARD_AMOUNT
+                self.count_species(species, -1)
             else:
                 survivors.append(species)
         self.species = survivors
+        self.positions = {}
         return card_amount
 
     def move_fat(self):
@@ -211,7 +254,9 @@ class PlayerState(object):
         :effect Adds population to all fertile Species in this player
         """
         for species in self.species:
+            population = species.population
             species.modify_if_fertile()
+            self.total_population += species.population - population
 
     def feed_trait(self, watering_hole, trait):
         """
@@ -253,13 +298,60 @@ class PlayerState(object):
 
 # ======================================  Species Methods ============================================
 
+    def species_index(self, species):
+        """
+        Gets the index of the given Species in the list of species for this player. Positions are cached
+        and the cache is rebuilt in one pass whenever the board has changed underneath it.
+        :param species: Species on this player's board
+        :return: Nat representing the index of the given Species
+        :raise ValueError if the given Species is not on this player's board
+        """
+        index = self.positions.get(id(species))
+        if index is None or index >= len(self.species) or self.species[index] is not species:
+            self.positions = dict((id(self.species[i]), i) for i in range(len(self.species)))
+            index = self.positions.get(id(species))
+            if index is None:
+                raise ValueError("Species is not on this player's board")
+        return index
+
+    def species_with_neighbors(self):
+        """
+        Enumerates the species of this player together with their neighbors in a single pass
+        :return: generator of (Nat, Species, Species, Species) representing the index, the Species, and its left
+                 and right neighbors (False if the Species has no neighbor on that side)
+        """
+        last_index = len(self.species) - 1
+        for i in range(len(self.species)):
+            yield (i, self.species[i],
+                   self.species[i - 1] if i > 0 else False,
+                   self.species[i + 1] if i < last_index else False)
+
+    def remove_species(self, species):
+        """
+        :effect Removes the given Species from this player's board
+        :param species: Species on this player's board
+        """
+        index = self.species_index(species)
+        self.species = self.species[:index] + self.species[index + 1:]
+        self.count_species(species, -1)
+        self.positions = {}
+
+    def reduce_population(self, species):
+        """
+        :effect Reduces the population of the given Species after a carnivore attack
+        :param species: Species on this player's board
+        """
+        population = species.population
+        species.reduce_population()
+        self.total_population += species.population - population
+
     def get_left_neighbor(self, species):
         """
         Gets the left neighbor of the given Species in the list of species for this player
         :param species: Species of which to find neighbor
         :return: The Species to the left of the given Species
         """
-        species_index = self.species.index(species)
+        species_index = self.species_index(species)
         return False if species_index == 0 else self.species[species_index - 1]
 
     def get_right_neighbor(self, species):
@@ -268,7 +360,7 @@ class PlayerState(object):
         :param species: Species of which to find neighbor
         :return: The Species to the right of the given Species
         """
-        species_index = self.species.index(species)
+        species_index = self.species_index(species)
         return False if species_index == len(self.species) - 1 else self.species[species_index + 1]
 
     def get_hungry_species(self, carnivores=False):
@@ -301,6 +393,7 @@ class PlayerState(object):
         species_to_grow = self.species[grow_action.species_board_index]
         if grow_action.attribute == POPULATION:
             species_to_grow.population += GROW_POP_AMOUNT
+            self.total_population += GROW_POP_AMOUNT
         elif grow_action.attribute == BODY:
             species_to_grow.body += GROW_BODY_AMOUNT
 
@@ -311,7 +404,8 @@ class PlayerState(object):
                               new species.
         """
         trait_list = [self.hand[i] for i in add_card_list]
-        self.species.append(Species(traits=trait_list))
+        self.species = self.species + [Species(traits=trait_list)]
+        self.count_species(self.species[-1])
 
     def replace_trait(self, replace_action):
         """
@@ -328,9 +422,42 @@ class PlayerState(object):
         :param remove_card_list: List of Nat representing the indicies of the Trait Cards to remove in
                                  this Player State's Hand.
         """
-        for i in remove_card_list:
-            self.hand[i] = False
-        self.hand = [card for card in self.hand if card]
+        removed = set(remove_card_list)
+        self.hand = [self.hand[i] for i in range(len(self.hand)) if i not in removed]
+
+# ====================================  Snapshot Methods ==========================================
+
+    def snapshot(self):
+        """
+        Records the attributes of this PlayerState that change during a game, and those of its species. The hand
+        and the list of species are copied, since the external player is given this PlayerState and may change
+        them in place.
+        :return: Tuple to give to restore
+        """
+        return (self.food_bag, list(self.hand), list(self.species), [species.snapshot() for species in self.species],
+                self.active, self.total_population, self.trait_count)
+
+    def restore(self, record):
+        """
+        :effect Sets the attributes of this PlayerState and its species back to those recorded. The species
+                recorded are put back on the board, so a Species keeps its identity across a restore.
+        :param record: Tuple given by snapshot
+        """
+        (self.food_bag, hand, species, species_records, self.active, self.total_population,
+         self.trait_count) = record
+        self.hand = list(hand)
+        self.species = list(species)
+        for i in range(len(self.species)):
+            self.species[i].restore(species_records[i])
+
+    def fork(self):
+        """
+        Makes a PlayerState with the attributes of this one, a copy of its hand and of each of its species, sharing
+        its external player
+        :return: PlayerState
+        """
+        return PlayerState(self.name, self.food_bag, list(self.hand), [species.fork() for species in self.species],
+                           self.active, self.ext_player)
 
 # ====================================  Conversion Methods ==========================================
 
@@ -374,7 +501,7 @@ class PlayerState(object):
         """
         Validates the TraitCards of all PlayerStates in the given list
         :param list_of_players: a list of PlayerState objects to be validated
-        :param total_deck: a list of TraitCards representing all valid card possibilities
+        :param total_deck: Dictionary {TraitCard: Natural} counting the copies of each possible card not yet seen
         :raise ValueError if duplicate cards or invalid cards exist on any player
         """
         for player in list_of_players:
@@ -384,7 +511,7 @@ class PlayerState(object):
         """
         Validates that the TraitCards in this PlayerState's hand and on its Species boards are all possible
         and unique
-        :param total_deck: a list of TraitCards representing all valid card possibilities
+        :param total_deck: Dictionary {TraitCard: Natural} counting the copies of each possible card not yet seen
         :raise ValueError if duplicate or invalid cards exist on this player
         """
         TraitCard.validate_all_unique(self.hand, total_deck)
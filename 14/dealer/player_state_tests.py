@@ -66,6 +66,34 @@ class TestPlayer(unittest.TestCase):
                          'removed cards: [carnivore, 3], [foraging, 2], [cooperation, 1]')
         return
 
+    def test_running_totals(self):
+        self.assertEqual((self.player_1.total_population, self.player_1.trait_count), (11, 0))
+        self.player_1.add_species([0])
+        self.player_1.grow_attribute(GrowAction("population", 0, 0))
+        self.player_1.remove_species(self.species_5)
+        self.player_1.reduce_population(self.species_4)
+        self.assertEqual((self.player_1.total_population, self.player_1.trait_count), (9, 1))
+        self.player_1.end_turn()
+        totals = (self.player_1.total_population, self.player_1.trait_count)
+        self.player_1.sync_totals()
+        self.assertEqual((self.player_1.total_population, self.player_1.trait_count), totals)
+
+    def test_species_index(self):
+        self.assertEqual(self.player_1.species_index(self.species_6), 2)
+        self.player_1.species.insert(0, self.species_7)
+        self.assertEqual(self.player_1.species_index(self.species_6), 3)
+        self.player_1.remove_species(self.species_4)
+        self.assertEqual([self.player_1.species_index(self.species_7), self.player_1.species_index(self.species_6)],
+                         [0, 2])
+        self.assertRaises(ValueError, self.player_1.species_index, self.species_4)
+
+    def test_species_with_neighbors(self):
+        self.assertEqual(list(self.player_1.species_with_neighbors()),
+                         [(0, self.species_4, False, self.species_5),
+                          (1, self.species_5, self.species_4, self.species_6),
+                          (2, self.species_6, self.species_5, False)])
+        self.assertEqual(list(self.player_2.species_with_neighbors()), [(0, self.species_1, False, False)])
+
     def test_show_changes(self):
         self.assertEquals(self.player_1.show_changes(self.player_2), 'new cards: [fat-tissue, 4], '
                                                                      'Species 0: [[food, 3->4], [body, 3->4]], '
@@ -0,0 +1,88 @@
+class PublicPlayer(object):
+    """
+    Represents a read-only, public view of another Player's PlayerState, as shown to a Player choosing
+    actions or feedings. Hides the hand and food bag, and shares the underlying species board rather than
+    copying it, so the view always reflects the current board.
+    The view guards local strategies against accidents only, not against cheating: it reads through the viewed
+    PlayerState, which stays reachable as _player_state, hand included, and its Species are the live ones on
+    the board. It keeps the PlayerState rather than a copy of the public fields because the PlayerState replaces
+    its species list whenever one is added or removed. Remote players only ever see the JSON the view converts to.
+    """
+    __slots__ = ('_player_state',)
+    food_bag = False
+    active = True
+
+    def __init__(self, player_state):
+        """
+        Creates a PublicPlayer
+        :param player_state: the PlayerState being viewed
+        :return: a PublicPlayer object
+        """
+        object.__setattr__(self, '_player_state', player_state)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PublicPlayers are read-only")
+
+    def __reduce__(self):
+        return (PublicPlayer, (self._player_state,))
+
+    @property
+    def name(self):
+        return self._player_state.name
+
+    @property
+    def species(self):
+        return self._player_state.species
+
+    @property
+    def hand(self):
+        return []
+
+    def views(self, player_state):
+        """
+        Determines if this PublicPlayer is a view of the given PlayerState
+        :param player_state: a PlayerState
+        :return: True if this PublicPlayer views the given PlayerState, else False
+        """
+        return self._player_state is player_state
+
+    def equal_attributes(self, other):
+        """
+        Determine if this PublicPlayer and the given public player have the same attributes for testing purposes.
+        :param other: the PublicPlayer, or PlayerState without hand or food bag, to compare this PublicPlayer to
+        :return: True if all attributes are equal, else False
+        """
+        species_equal = len(self.species) == len(other.species)
+        for i in range(len(self.species)):
+            species_equal = species_equal and self.species[i].equal_attributes(other.species[i])
+        return all([self.name == other.name,
+                    self.food_bag == other.food_bag,
+                    self.hand == other.hand,
+                    self.active == other.active,
+                    species_equal])
+
+    def get_attackable_targets(self, attacker):
+        """
+        Find all species on the viewed board that the given carnivore can attack, with their positions
+        :param attacker: the attacking Species
+        :return: List of (Nat, Species) representing the index and Species of each attackable species
+        """
+        return self._player_state.get_attackable_targets(attacker)
+
+    def get_attackable_species(self, attacker):
+        """
+        Find all species on the viewed board that the given carnivore can attack
+        :param attacker: the attacking Species
+        :return: List of Species
+        """
+        return self._player_state.get_attackable_species(attacker)
+
+# ====================================  Conversion Methods ==========================================
+
+    def convert_to_boards_json(self):
+        """
+        Converts the viewed board to a JSON Boards
+        :return: a JSON Boards as specified in
+                http://www.ccs.neu.edu/home/matthias/4500-s16/r_remote.html
+        """
+        return self._player_state.convert_to_boards_json()
@@ -0,0 +1,43 @@
+import unittest
+from traitcard import TraitCard
+from species import Species
+from player_state import PlayerState
+from public_player import PublicPlayer
+from globals import *
+
+
+class TestPublicPlayer(unittest.TestCase):
+
+    def setUp(self):
+        self.carnivore = TraitCard(CARNIVORE, 3)
+        self.attacker = Species(4, 0, 4, [self.carnivore])
+        self.species_1 = Species(3, 1, 2)
+        self.species_2 = Species(2, 1, 5)
+        self.species_3 = Species(2, 1, 5, [TraitCard(CLIMBING)])
+        self.player = PlayerState(name=2, food_bag=5, hand=[self.carnivore], species=[self.species_1])
+        self.public_player = PublicPlayer(self.player)
+
+    def test_hidden(self):
+        self.assertEqual(self.public_player.name, 2)
+        self.assertFalse(self.public_player.food_bag)
+        self.assertEqual(self.public_player.hand, [])
+        self.assertTrue(self.public_player.equal_attributes(PlayerState(2, False, False, [Species(3, 1, 2)])))
+        self.assertFalse(self.public_player.equal_attributes(self.player))
+
+    def test_read_only(self):
+        self.assertRaises(AttributeError, setattr, self.public_player, 'food_bag', 3)
+        self.assertRaises(AttributeError, setattr, self.public_player, 'species', [])
+        self.public_player.hand.append(self.carnivore)
+        self.assertEqual(self.public_player.hand, [])
+
+    def test_shared_board(self):
+        self.assertIs(self.public_player.species, self.player.species)
+        self.player.species.append(self.species_2)
+        self.player.species.append(self.species_3)
+        self.assertTrue(self.public_player.views(self.player))
+        self.assertEqual(self.public_player.get_attackable_species(self.attacker), [self.species_1, self.species_2])
+        self.assertEqual(self.public_player.convert_to_boards_json(), self.player.convert_to_boards_json())
+
+
+if __name__ == '__main__':
+    unittest.main()
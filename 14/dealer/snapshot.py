@@ -0,0 +1,38 @@
+class Snapshot(object):
+    """
+    Represents the state of a Dealer's game at one moment, as recorded by Dealer.snapshot to be given back to
+    Dealer.restore. A Snapshot holds its own copies of the lists of the game it records, taken eagerly when it is
+    recorded, so that changing a hand, a species board, a list of traits or the deck in place after the snapshot
+    is taken is undone by restoring it. Only the immutable TraitCards are not copied.
+    """
+    __slots__ = ('list_of_players', 'players', 'current', 'feeders', 'watering_hole', 'deck', 'rng_state',
+                 'actions_applied')
+
+    def __init__(self, list_of_players, players, current, feeders, watering_hole, deck, rng_state,
+                 actions_applied):
+        """
+        Creates a Snapshot
+        :param list_of_players: the Dealer's list of PlayerStates, in seating order
+        :param players: List of the records given by PlayerState.snapshot, one for each PlayerState
+        :param current: Natural index of the current player
+        :param feeders: frozenset of the names of the players still feeding
+        :param watering_hole: Natural representing the food at the watering hole
+        :param deck: the record given by Deck.snapshot
+        :param rng_state: the state of the Dealer's random number generator
+        :param actions_applied: Natural counting the Action4s the Dealer has applied
+        :return: a Snapshot object
+        """
+        object.__setattr__(self, 'list_of_players', list_of_players)
+        object.__setattr__(self, 'players', players)
+        object.__setattr__(self, 'current', current)
+        object.__setattr__(self, 'feeders', feeders)
+        object.__setattr__(self, 'watering_hole', watering_hole)
+        object.__setattr__(self, 'deck', deck)
+        object.__setattr__(self, 'rng_state', rng_state)
+        object.__setattr__(self, 'actions_applied', actions_applied)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Snapshots are immutable")
+
+    def __reduce__(self):
+        return (Snapshot, tuple([getattr(self, name) for name in self.__slots__]))
@@ -3,10 +3,63 @@ from globals import *
 from traitcard import TraitCard
 
 
+class TraitList(list):
+    """
+    The TraitCards of a Species. Keeps the bitmask and names of its traits in step with its cards however
+    the list is changed, so that a Species answers has_trait correctly even after its traits are changed
+    in place.
+    """
+    __slots__ = ('mask', 'names')
+
+    def __init__(self, cards=()):
+        """
+        Creates a TraitList
+        :param cards: List of TraitCard
+        :return: a TraitList object
+        """
+        list.__init__(self, cards)
+        self.sync()
+
+    def __reduce__(self):
+        return (TraitList, (list(self),))
+
+    def sync(self):
+        """
+        :effect Recomputes the bitmask and names of the traits from the TraitCards in this list
+        """
+        self.mask = 0
+        for trait_card in self:
+            self.mask |= TRAIT_BITS.get(trait_card.trait, 0)
+        self.names = [trait_card.trait for trait_card in self]
+
+
+def synced(name):
+    """
+    Wraps the list method of the given name so that a TraitList recomputes its bitmask and names after it
+    :param name: String naming a method of list that changes the list
+    :return: the wrapping method
+    """
+    method = getattr(list, name)
+
+    def change(self, *args):
+        result = method(self, *args)
+        self.sync()
+        return result
+    change.__name__ = name
+    change.__doc__ = method.__doc__
+    return change
+
+for name in ['append', 'extend', 'insert', 'remove', 'pop', 'sort', 'reverse', '__setitem__', '__delitem__',
+             '__setslice__', '__delslice__', '__iadd__', '__imul__']:
+    setattr(TraitList, name, synced(name))
+
+
 class Species(object):
     """
     A data representation of a Species in the Evolution game
     """
+    __slots__ = ('population', 'food', 'body', '_traits', 'fat_storage')
+
     def __init__(self, population=1, food=0, body=0, traits=False, fat_storage=False):
         """
         Creates a Species
@@ -25,7 +78,32 @@ class Species(object):
         if fat_storage:
             self.fat_storage = fat_storage
         else:
-            self.fat_storage = (0 if FATTISSUE in self.trait_names() else False)
+            self.fat_storage = (0 if self.has_trait(FATTISSUE) else False)
+
+    @property
+    def traits(self):
+        """
+        The TraitCards of this species, as a TraitList, which keeps the trait bitmask in step however it is
+        changed
+        :return: TraitList
+        """
+        return self._traits
+
+    @traits.setter
+    def traits(self, traits):
+        """
+        :effect Puts the given TraitCards on this species in place of its traits
+        :param traits: List of TraitCard
+        """
+        self._traits = TraitList(traits)
+
+    @property
+    def trait_mask(self):
+        """
+        The bitmask of this species' traits, with the bits given by TRAIT_BITS
+        :return: Natural
+        """
+        return self._traits.mask
 
     def equal_attributes(self, other):
         """
@@ -46,10 +124,20 @@ class Species(object):
         :param list_of_players: List of PlayerState representing eligible targets for an attack
         :return: List of Species objects attackable by this carnivore Species
         """
-        attackable_species = []
-        for player in list_of_players:
-            attackable_species += player.get_attackable_species(self)
-        return attackable_species
+        return [defender for (player_index, defender_index, defender) in self.all_attackable_targets(list_of_players)]
+
+    def all_attackable_targets(self, list_of_players):
+        """
+        Find all species attackable by this carnivore species in the given list of players, with their positions
+        :param list_of_players: List of PlayerState representing eligible targets for an attack
+        :return: List of (Nat, Nat, Species) representing the index of the defending player in the given list,
+                 the index of the defending Species on that player's board, and the defending Species
+        """
+        attackable_targets = []
+        for player_index in range(len(list_of_players)):
+            for (defender_index, defender) in list_of_players[player_index].get_attackable_targets(self):
+                attackable_targets.append((player_index, defender_index, defender))
+        return attackable_targets
 
     def is_attackable(self, attacker, left_neighbor=False, right_neighbor=False):
         """
@@ -75,7 +163,7 @@ class Species(object):
         Gives the names of the TraitCard(s) of this species
         :return: List of Strings representing trait names
         """
-        return [trait_card.trait for trait_card in self.traits]
+        return list(self._traits.names)
 
     def is_hungry(self):
         """
@@ -109,7 +197,15 @@ class Species(object):
         :param traitcard_index: Nat representing index of TraitCard to replace
         :param replacement_card: TraitCard to put on this Species
         """
-        self.traits[traitcard_index] = replacement_card
+        self._traits = TraitList(self._traits[:traitcard_index] + [replacement_card] +
+                                 self._traits[traitcard_index + 1:])
+
+    def add_trait(self, trait_card):
+        """
+        :effect Adds the given TraitCard to the end of this Species's traits
+        :param trait_card: TraitCard to put on this Species
+        """
+        self._traits = TraitList(self._traits + [trait_card])
 
     def move_fat(self):
         """
@@ -132,7 +228,7 @@ class Species(object):
         :param trait the trait we are looking for in this species' traits
         :return True if this species has the given trait
         """
-        return trait in self.trait_names()
+        return bool(self._traits.mask & TRAIT_BITS.get(trait, 0))
 
     def feed(self, watering_hole):
         """
@@ -145,6 +241,33 @@ class Species(object):
         self.food += FEED_QUANTITY
         return watering_hole - FEED_QUANTITY
 
+# ====================================  Snapshot Methods ==========================================
+
+    def snapshot(self):
+        """
+        Records the attributes of this Species. The list of traits is copied, so changing it in place afterwards
+        does not change the record.
+        :return: Tuple to give to restore
+        """
+        return (self.population, self.food, self.body, list(self._traits), self.fat_storage)
+
+    def restore(self, record):
+        """
+        :effect Sets the attributes of this Species back to those recorded
+        :param record: Tuple given by snapshot
+        """
+        (self.population, self.food, self.body, traits, self.fat_storage) = record
+        self._traits = TraitList(traits)
+
+    def fork(self):
+        """
+        Makes a Species with the attributes of this one and a copy of its list of traits
+        :return: Species
+        """
+        species = Species.__new__(Species)
+        species.restore(self.snapshot())
+        return species
+
 # ====================================  Conversion Methods ==========================================
 
     def convert_to_json(self):
@@ -168,7 +291,7 @@ class Species(object):
         """
         Validates the TraitCards of all Species in the given list.
         :param list_of_species: a list of Species objects to be validated
-        :param total_deck: a list of TraitCards representing all valid card possibilities
+        :param total_deck: Dictionary {TraitCard: Natural} counting the copies of each possible card not yet seen
         :raise ValueError if invalid TraitCards exist on any Species
         """
         for species in list_of_species:
@@ -177,7 +300,7 @@ class Species(object):
     def validate_cards(self, total_deck):
         """
         Validates this species by checking that each of its TraitCards is unique and possible
-        :param total_deck: a list of TraitCards representing all valid card possibilities
+        :param total_deck: Dictionary {TraitCard: Natural} counting the copies of each possible card not yet seen
         :raise ValueError if invalid cards exist on any species
         """
         TraitCard.validate_all_unique(self.traits, total_deck)
@@ -201,7 +324,7 @@ class Species(object):
         assert(isinstance(self.food, int) and MAX_FOOD >= self.food >= MIN_FOOD)
         assert(isinstance(self.body, int) and MAX_BODY >= self.body >= MIN_BODY)
         assert(all([isinstance(self.traits, list), MAX_TRAITS >= len(self.traits),
-                    len(self.trait_names()) == len(set(self.trait_names()))]))
+                    len(self._traits.names) == len(set(self._traits.names))]))
         TraitCard.validate_all_attributes(self.traits)
         if self.fat_storage is not False:
             assert(isinstance(self.body, int) and self.body >= self.fat_storage >= MIN_FATFOOD)
@@ -1,4 +1,5 @@
 import unittest
+import copy
 from player_state import PlayerState
 from species import Species
 from traitcard import TraitCard
@@ -37,6 +38,29 @@ class TestSpecies(unittest.TestCase):
         self.assertEqual(self.defender.trait_names(), [])
         self.assertEqual(self.attacker.trait_names(), [CARNIVORE])
 
+    def test_has_trait(self):
+        self.assertTrue(self.attacker.has_trait(CARNIVORE))
+        self.assertFalse(self.defender.has_trait(CARNIVORE))
+        self.attacker.add_trait(TraitCard(HORNS))
+        self.assertEqual([self.attacker.has_trait(CARNIVORE), self.attacker.has_trait(HORNS)], [True, True])
+        self.attacker.replace_trait(0, TraitCard(FATTISSUE))
+        self.assertEqual([self.attacker.has_trait(CARNIVORE), self.attacker.has_trait(FATTISSUE)], [False, True])
+        self.assertEqual(self.attacker.trait_names(), [FATTISSUE, HORNS])
+        self.attacker.traits = []
+        self.assertFalse(self.attacker.has_trait(FATTISSUE))
+        self.assertEqual(self.attacker.trait_mask, 0)
+
+    def test_traits_in_place(self):
+        self.attacker.traits.append(TraitCard(HORNS))
+        self.attacker.traits[0] = TraitCard(AMBUSH)
+        self.assertEqual([self.attacker.has_trait(CARNIVORE), self.attacker.has_trait(AMBUSH),
+                          self.attacker.has_trait(HORNS)], [False, True, True])
+        del self.attacker.traits[1]
+        self.attacker.traits.extend([TraitCard(CLIMBING)])
+        self.assertEqual(self.attacker.trait_names(), [AMBUSH, CLIMBING])
+        self.assertTrue(copy.deepcopy(self.attacker).has_trait(CLIMBING))
+        self.assertFalse(self.attacker.has_trait("unknown"))
+
     def test_attackable(self):
         self.assertTrue(self.defender.is_attackable(self.attacker))
 
@@ -107,6 +131,24 @@ class TestSpecies(unittest.TestCase):
         self.assertEquals(self.species_2.show_changes(self.species_3),
                           '[[population, 4->1], [food, 4->0], [body, 4->3]]')
 
+    def test_snapshot(self):
+        self.species_1.traits = [TraitCard(CLIMBING)]
+        record = self.species_1.snapshot()
+        fork = self.species_1.fork()
+        self.species_1.add_trait(TraitCard(CARNIVORE))
+        self.species_1.replace_trait(0, TraitCard(HERDING))
+        self.species_1.reduce_population()
+        self.assertIsNot(fork.traits, record[3])
+        self.assertEqual(fork.traits, [TraitCard(CLIMBING)])
+        self.assertTrue(self.species_1.has_trait(CARNIVORE))
+        self.species_1.restore(record)
+        self.assertTrue(self.species_1.equal_attributes(fork))
+        self.assertFalse(self.species_1.has_trait(CARNIVORE))
+        self.assertEqual(self.species_1.trait_names(), [CLIMBING])
+        self.species_1.traits.append(TraitCard(CARNIVORE))
+        self.species_1.restore(record)
+        self.assertEqual(self.species_1.traits, [TraitCard(CLIMBING)])
+
 
 
 if __name__ == '__main__':
@@ -3,24 +3,74 @@ from globals import *
 
 class TraitCard(object):
     """
-    Represents a TraitCard of the Evolution game
+    Represents a TraitCard of the Evolution game. TraitCards are immutable, and every valid card is
+    interned: creating the same card twice gives back the same object. Interned cards are known to be
+    valid, so validating them costs nothing.
     """
-    def __init__(self, trait, food_points=False):
+    __slots__ = ('trait', 'food_points', 'valid')
+    interned = {}
+
+    def __new__(cls, trait, food_points=False):
         """
-        Craates a TraitCard
+        Craates a TraitCard, or gives the interned TraitCard with the same trait and food points
         :param trait: String representing the name of the TraitCard
         :param food_points: Integer representing the food points of the TraitCard
         :return: a TraitCard object
         """
-        self.trait = trait
-        self.food_points = food_points
+        try:
+            return cls.interned[(trait, type(food_points), food_points)]
+        except (KeyError, TypeError):
+            trait_card = super(TraitCard, cls).__new__(cls)
+            object.__setattr__(trait_card, 'trait', trait)
+            object.__setattr__(trait_card, 'food_points', food_points)
+            object.__setattr__(trait_card, 'valid', False)
+            return trait_card
+
+    @classmethod
+    def intern_all(cls):
+        """
+        :effect Interns every valid TraitCard: each trait with every food value in its range, and
+                each trait without food points as it appears on a Species
+        """
+        for trait in TRAITS_LIST:
+            food_range = (CARN_FOOD_MAX if trait == CARNIVORE else HERB_FOOD_MAX)
+            for food_points in [False] + range(-food_range, food_range + 1):
+                trait_card = TraitCard(trait, food_points)
+                object.__setattr__(trait_card, 'valid', True)
+                cls.interned[(trait, type(food_points), food_points)] = trait_card
+
+    def __setattr__(self, name, value):
+        """
+        Keeps this TraitCard immutable
+        :raise AttributeError whenever an attribute is set
+        """
+        raise AttributeError("TraitCards are immutable")
+
+    def __reduce__(self):
+        """
+        Lets this TraitCard be pickled, giving back the interned card when it is unpickled
+        :return: (class, arguments) to create an equal TraitCard
+        """
+        return (TraitCard, (self.trait, self.food_points))
 
     def __eq__(self, other):
-        return all([isinstance(other, TraitCard),
-                    self.trait == other.trait,
-                    self.food_points == other.food_points])
+        return self is other or (isinstance(other, TraitCard) and
+                                 self.trait == other.trait and
+                                 self.food_points == other.food_points)
+
+    def __hash__(self):
+        """
+        Hashes this TraitCard by its fields, consistently with __eq__
+        :return: Int
+        """
+        return hash((self.trait, self.food_points))
 
     def __ne__(self, other):
+        """
+        Compare attributes for testing.
+        :param other: The other object we are comparing
+        :return: True if not equal, else False
+        """
         return not self.__eq__(other)
 
     def convert_to_json(self):
@@ -38,7 +88,7 @@ class TraitCard(object):
         """
         Validates the uniqueness of all TraitCards in the given list.
         :param list_of_traitcard: a list of TraitCard objects to be validated
-        :param total_deck: a list of TraitCards representing all valid card possibilities
+        :param total_deck: Dictionary {TraitCard: Natural} counting the copies of each possible card not yet seen
         :raise ValueError if duplicate cards exist
         """
         for card in list_of_traitcard:
@@ -46,12 +96,16 @@ class TraitCard(object):
 
     def validate_unique(self, total_deck):
         """
-        Validates this TraitCard by checking that it exists in the given deck of possible cards
-        :param total_deck: a list of TraitCards representing all valid card possibilities
+        Validates this TraitCard by checking that a copy of it remains in the given count of possible cards,
+        and takes that copy from the count
+        :param total_deck: Dictionary {TraitCard: Natural} counting the copies of each possible card not yet seen
         :raise ValueError if card is not valid / a duplicate
         """
         if self.food_points is not False:
-            total_deck.remove(self)
+            copies = total_deck.get(self, 0)
+            if not copies:
+                raise ValueError("invalid or duplicate card: " + CARD_TEMPLATE % (self.trait, self.food_points))
+            total_deck[self] = copies - 1
 
     @classmethod
     def validate_all_attributes(cls, list_of_traitcard):
@@ -68,6 +122,8 @@ class TraitCard(object):
         Validates the attributes of this TraitCard
         :raise AssertionError if attributes are out of game bounds
         """
+        if self.valid:
+            return
         assert(isinstance(self.trait, basestring) and self.trait in TRAITS_LIST)
         if self.food_points is not False:
             assert(isinstance(self.food_points, int) and
@@ -94,12 +150,14 @@ class TraitCard(object):
         :return: String of attribute changes, or "" if unchanged.
         """
         if len(traitcards_before) < len(traitcards_after):
+            before = set(traitcards_before)
             new_cards = [CARD_TEMPLATE % (card.trait, card.food_points) for card in traitcards_after
-                         if card not in traitcards_before]
+                         if card not in before]
             return "new cards: %s" % ", ".join(new_cards)
         elif len(traitcards_before) > len(traitcards_after):
+            after = set(traitcards_after)
             removed_cards = [CARD_TEMPLATE % (card.trait, card.food_points) for card in traitcards_before
-                             if card not in traitcards_after]
+                             if card not in after]
             return "removed cards: %s" % ", ".join(removed_cards)
         else:
             changed_cards = []
@@ -108,4 +166,7 @@ class TraitCard(object):
                 if before != after:
                     changed_cards.append(CHANGE_TEMPLATE % (str(i), CARD_TEMPLATE % (before.trait, before.food_points),
                                                             CARD_TEMPLATE % (after.trait, after.food_points)))
-            return ", ".join(changed_cards) if changed_cards else ""
\ No newline at end of file
+            return ", ".join(changed_cards) if changed_cards else ""
+
+
+TraitCard.intern_all()
@@ -0,0 +1,48 @@
+import unittest
+import copy
+import pickle
+from traitcard import TraitCard
+from globals import *
+
+
+class TestTraitCard(unittest.TestCase):
+
+    def setUp(self):
+        self.carnivore = TraitCard(CARNIVORE, 3)
+        self.carnivore_trait = TraitCard(CARNIVORE)
+
+    def test_interned(self):
+        self.assertIs(TraitCard(CARNIVORE, 3), self.carnivore)
+        self.assertIs(TraitCard(CARNIVORE), self.carnivore_trait)
+        self.assertIsNot(TraitCard(CARNIVORE, 0), self.carnivore_trait)
+        self.assertIs(copy.deepcopy(self.carnivore), self.carnivore)
+        self.assertIs(pickle.loads(pickle.dumps(self.carnivore, pickle.HIGHEST_PROTOCOL)), self.carnivore)
+        self.assertEqual(len(TraitCard.interned), LOC_MAX + len(TRAITS_LIST))
+
+    def test_invalid_not_interned(self):
+        invalid = TraitCard(CARNIVORE, 20)
+        self.assertIsNot(TraitCard(CARNIVORE, 20), invalid)
+        self.assertEqual(TraitCard(CARNIVORE, 20), invalid)
+        self.assertRaises(AssertionError, invalid.validate_attributes)
+        self.assertEqual(TraitCard(CARNIVORE, [1]).food_points, [1])
+        self.assertFalse(invalid.valid)
+        self.assertTrue(all([card.valid for card in TraitCard.interned.values()]))
+
+    def test_immutable(self):
+        self.assertRaises(AttributeError, setattr, self.carnivore, 'food_points', 4)
+        self.assertRaises(AttributeError, setattr, self.carnivore, 'color', 'red')
+        self.assertEqual(self.carnivore.food_points, 3)
+
+    def test_hash(self):
+        invalid = TraitCard(CARNIVORE, 20)
+        self.assertEqual(hash(TraitCard(CARNIVORE, 20)), hash(invalid))
+        self.assertIn(TraitCard(CARNIVORE, 20), set([invalid, self.carnivore]))
+        self.assertNotIn(TraitCard(CARNIVORE, 4), set([invalid, self.carnivore]))
+        self.assertEqual(TraitCard.show_all_changes([self.carnivore], [self.carnivore, invalid]),
+                         "new cards: [carnivore, 20]")
+        self.assertEqual(TraitCard.show_all_changes([invalid, self.carnivore], [self.carnivore]),
+                         "removed cards: [carnivore, 20]")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 from convert import *
+from stream_decoder import StreamDecoder
 from time import *
 
 
@@ -7,66 +8,118 @@ class DealerProxy(object):
     Filters JSON messages from the server to the client
     Uses external Player to generate responses and sends them back to server
     """
-    def __init__(self, player, socket):
+    def __init__(self, player, socket, decoder=False):
         """
         Creates a DealerProxy
         :param player: Player object representing an external player strategy
         :param socket: Socket on which to listen to and send messages
+        :param decoder: StreamDecoder already reading the socket, or False to start one
         :return: DealerProxy object
         """
         self.player = player
         self.socket = socket
+        self.decoder = decoder if decoder else StreamDecoder(socket)
+        self.feed_state = False
+        self.handlers = {CHOOSE_LEN: self.start,
+                         ALL_PLAYERS_LEN: self.choose,
+                         FEED_LEN: self.feed,
+                         START_CHOOSE: self.start_choose,
+                         FEED_DELTA: self.feed_delta}
 
     def wait_for_start(self):
         """
-        Waits for the start message with the initial watering hole and player state
+        Waits for the start message with the initial watering hole and player state, then plays every game the
+        server runs on this connection
         """
-        response = Convert.listen(self.socket, False)
-        self.start(response)
+        self.run()
+
+    def run(self):
+        """
+        Handles each message from the server in turn and sends back the answer, if the message needs one, until
+        the server closes the connection or sends a message that is not part of the protocol. Waits as long as it
+        takes, since the server decides when this player's next turn comes.
+        """
+        message = self.decoder.read(False)
+        while message:
+            if self.message_type(message) not in self.handlers:
+                return
+            reply = self.handle(message)
+            if reply is not None:
+                self.socket.sendall(json.dumps(reply))
+            message = self.decoder.read(False)
+
+    def handle(self, message):
+        """
+        Passes one message from the server to its handler
+        :param message: JSON message from the server
+        :return: JSON answer to send back, or None if the server expects no answer
+        :raise KeyError if the message is not part of the protocol
+        """
+        return self.handlers[self.message_type(message)](message)
+
+    @classmethod
+    def message_type(cls, message):
+        """
+        Determines which step of the game a message from the server is for
+        If the message is tagged -> its tag, START_CHOOSE or FEED_DELTA
+        If the message is a list of length 4 -> Start
+        If the message is a list of length 2 -> Choose
+        If the message is a list of length 5 -> Feed
+        :param message: JSON message from the server
+        :return: String tag or Natural length identifying the message's handler
+        """
+        if isinstance(message, list) and message:
+            return message[0] if isinstance(message[0], basestring) else len(message)
+        return False
 
     def start(self, json_state):
         """
-        Gives the external player their state, then waits for the choice json of all the players and calls choose.
+        Gives the external player their state. The choice json of all the players follows in the next message.
         :param json_state: JSON State representing watering hole and PlayerState attributes
+        :return: None, since the server expects no answer
         """
         [watering_hole, player_state] = Convert.json_to_wh_state(json_state)
         self.player.start(watering_hole, player_state)
-        json_all_players = Convert.listen(self.socket, False)
-        self.choose(json_all_players)
+
+    def start_choose(self, json_start_choose):
+        """
+        Gives the external player their state and calls choose with the choice json that came in the same message,
+        as a server that pipelines sends them
+        :param json_start_choose: JSON [START_CHOOSE, State, [LOB, LOB]]
+        :return: JSON Action4 representing the player's choices
+        """
+        [tag, json_state, json_all_players] = json_start_choose
+        self.start(json_state)
+        return self.choose(json_all_players)
 
     def choose(self, json_all_players):
         """
         Converts the json_all_players to two lists of PlayerStates. Then asks the player to chose with the
-        information. Converts the Action4 results to json. Sends it. Waits for the next step.
+        information. Converts the Action4 results to json.
         :param json_all_players: JSON [LOB, LOB]
+        :return: JSON Action4 representing the player's choices
         """
         left_players = Convert.json_to_choice_lop(json_all_players[0])
         right_players = Convert.json_to_choice_lop(json_all_players[1])
         action4 = self.player.choose(left_players, right_players)
-        json_action4 = action4.convert_to_json()
-        self.socket.sendall(json.dumps(json_action4))
-        self.wait_for_next_step()
+        return action4.convert_to_json()
 
     def feed(self, json_state):
         """
         Converts the given game state to a list of the information needed to feed. Calls feed on the player with the
-        information. Converts the FeedingChoice result into json and sends it. Waits for the next step.
+        information. Converts the FeedingChoice result into json.
         :param json_state: JSON GameState
+        :return: JSON FeedingChoice representing the player's feeding
         """
+        self.feed_state = json_state
         [updated_player, watering_hole, all_players] = Convert.json_to_gamestate(json_state)
         feeding = self.player.next_feeding(updated_player, watering_hole, all_players)
-        json_feeding = feeding.convert_to_json()
-        self.socket.sendall(json.dumps(json_feeding))
-        self.wait_for_next_step()
+        return feeding.convert_to_json()
 
-    def wait_for_next_step(self):
+    def feed_delta(self, json_delta):
         """
-        Waits for the response and then checks where in the game we are.
-        If the response is a list of length 4 -> Choose
-        If the response is a list of length 5 -> Feed
+        Rebuilds the game state from the changes since the last feeding and feeds from it
+        :param json_delta: JSON [FEED_DELTA, ...] as given by Convert.gamestate_to_delta_json
+        :return: JSON FeedingChoice representing the player's feeding
         """
-        response = Convert.listen(self.socket)
-        if len(response) == CHOOSE_LEN:
-            return self.start(response)
-        elif len(response) == FEED_LEN:
-            return self.feed(response)
+        return self.feed(Convert.apply_gamestate_delta(self.feed_state, json_delta))
@@ -0,0 +1,141 @@
+import threading
+import time
+from dealer.dealer import Dealer
+from dealer.globals import *
+
+
+class Lobby(object):
+    """
+    Seats signed-up players at tables of LOP_MIN to LOP_MAX players as they arrive, and plays a game of
+    Evolution at each table on its own thread, so that many games run at once
+    """
+    def __init__(self, wait_time=SIGNUP_TIME, game_time=GAME_TIME, report=False, metrics=False):
+        """
+        Creates a Lobby
+        :param wait_time: Number of seconds the longest-waiting player waits for a full table before a table of
+                          at least LOP_MIN players is started
+        :param game_time: Number of seconds a game may run before its players' connections are cut
+        :param report: Function called with the table number and result of each game as it finishes, or False
+        :param metrics: ServerMetrics following the players of every game, or False
+        :return: a Lobby object
+        """
+        self.wait_time = wait_time
+        self.game_time = game_time
+        self.report = report
+        self.metrics = metrics
+        self.condition = threading.Condition()
+        self.queue = []
+        self.tables = 0
+        self.results = []
+        self.closed = False
+
+    def join(self, proxy):
+        """
+        Adds a signed-up player to the queue for the next table
+        :param proxy: the external player, which must support close() if its game can time out
+        :return: Event set once the player's game has finished or the Lobby has closed
+        """
+        finished = threading.Event()
+        with self.condition:
+            if self.closed:
+                finished.set()
+            else:
+                self.queue.append((proxy, time.time(), finished))
+                self.condition.notify()
+        return finished
+
+    def serve(self):
+        """
+        Starts a game whenever enough players are waiting, sleeping in between, until the Lobby is closed
+        """
+        with self.condition:
+            while not self.closed:
+                table = self.next_table()
+                if table:
+                    self.start_game(table)
+                else:
+                    self.condition.wait(self.time_to_next_table())
+
+    def close(self):
+        """
+        :effect Stops seating players and releases those still waiting. Games in progress run to completion.
+        """
+        with self.condition:
+            self.closed = True
+            for (proxy, signup_time, finished) in self.queue:
+                finished.set()
+            self.queue = []
+            self.condition.notify_all()
+
+    def next_table(self):
+        """
+        Takes the players for the next table off the queue, if a table can be started now. Must be called
+        holding the condition.
+        :return: List of (Player, Number, Event) representing the seated players, or False
+        """
+        waiting = len(self.queue)
+        if waiting >= LOP_MAX or (waiting >= LOP_MIN and time.time() - self.queue[0][1] >= self.wait_time):
+            table, self.queue = self.queue[:LOP_MAX], self.queue[LOP_MAX:]
+            return table
+        return False
+
+    def time_to_next_table(self):
+        """
+        Gives how long the queue can sleep before a short table is due. Must be called holding the condition.
+        :return: Number of seconds, or None if no table can start until more players join
+        """
+        if len(self.queue) < LOP_MIN:
+            return None
+        return max(0, self.queue[0][1] + self.wait_time - time.time())
+
+    def start_game(self, table):
+        """
+        :effect Plays a game with the given players on a new thread
+        :param table: List of (Player, Number, Event) representing the seated players
+        """
+        self.tables += 1
+        game = threading.Thread(target=self.play, args=(self.tables, table))
+        game.daemon = True
+        game.start()
+
+    def play(self, table_number, table):
+        """
+        Plays a complete game at the given table. Cuts every connection at the table once the game time runs
+        out, so that the remaining players are removed as cheaters and the game ends.
+        :param table_number: Natural+ numbering the table
+        :param table: List of (Player, Number, Event) representing the seated players
+        :effect: Records the game's scoreboard, or False if the game failed, and releases its players. Marks the
+                 players removed from the game in the metrics.
+        """
+        proxies = [proxy for (proxy, signup_time, finished) in table]
+        timer = threading.Timer(self.game_time, self.abort, [proxies])
+        timer.daemon = True
+        timer.start()
+        if self.metrics:
+            self.metrics.start_game(table_number, proxies)
+        dealer = False
+        try:
+            dealer = Dealer.create_initial(proxies, validation=INCREMENTAL_VALIDATION)
+            result = dealer.run_game()
+        except Exception:
+            result = False
+        timer.cancel()
+        timer.join()
+        if self.metrics:
+            self.metrics.end_game(table_number, [player.ext_player for player in dealer.list_of_players]
+                                  if dealer else [])
+        with self.condition:
+            self.results.append((table_number, result))
+        for (proxy, signup_time, finished) in table:
+            finished.set()
+        if self.report:
+            self.report(table_number, result)
+
+    @classmethod
+    def abort(cls, proxies):
+        """
+        :effect Cuts the connection of each of the given players
+        :param proxies: List of external players supporting close()
+        """
+        for proxy in proxies:
+            proxy.close()
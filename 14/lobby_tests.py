@@ -0,0 +1,78 @@
+import unittest
+import threading
+import time
+
+from lobby import Lobby
+from proxy_metrics import ServerMetrics
+from dealer.player import Player
+from dealer.globals import *
+
+
+class StalledPlayer(Player):
+    """
+    A Player that never answers choose until its connection is cut
+    """
+    def __init__(self, id):
+        Player.__init__(self, id=id)
+        self.cut = threading.Event()
+
+    def choose(self, left_players, right_players):
+        self.cut.wait(5)
+        raise IOError("connection cut")
+
+    def close(self):
+        self.cut.set()
+
+
+class TestLobby(unittest.TestCase):
+
+    def setUp(self):
+        self.lobby = Lobby(wait_time=0.2, game_time=5)
+        self.lobby_thread = threading.Thread(target=self.lobby.serve)
+        self.lobby_thread.daemon = True
+        self.lobby_thread.start()
+
+    def tearDown(self):
+        self.lobby.close()
+        self.lobby_thread.join(1)
+
+    def test_full_tables(self):
+        finished = [self.lobby.join(Player(id=x + 1)) for x in range(2 * LOP_MAX)]
+        for event in finished:
+            event.wait(5)
+            self.assertTrue(event.is_set())
+        self.assertEqual(sorted([table_number for (table_number, result) in self.lobby.results]), [1, 2])
+        self.assertFalse(False in [result for (table_number, result) in self.lobby.results])
+
+    def test_short_table(self):
+        finished = [self.lobby.join(Player(id=x + 1)) for x in range(LOP_MIN - 1)]
+        time.sleep(0.4)
+        self.assertFalse(any([event.is_set() for event in finished]))
+        finished.append(self.lobby.join(Player(id=LOP_MIN)))
+        finished[-1].wait(5)
+        self.assertTrue(all([event.is_set() for event in finished]))
+        self.assertEqual(self.lobby.tables, 1)
+
+    def test_game_time(self):
+        self.lobby.game_time = 0.2
+        players = [StalledPlayer(x + 1) for x in range(LOP_MAX)]
+        finished = [self.lobby.join(player) for player in players]
+        finished[0].wait(5)
+        self.assertTrue(all([player.cut.is_set() for player in players]))
+        self.assertEqual(self.lobby.results, [(1, "")])
+
+    def test_metrics(self):
+        self.lobby.metrics = ServerMetrics()
+        finished = [self.lobby.join(Player(id=x + 1)) for x in range(LOP_MAX)]
+        finished[0].wait(5)
+        self.assertEqual(self.lobby.metrics.convert_to_json()["games_played"], 1)
+
+    def test_close(self):
+        finished = self.lobby.join(Player(id=1))
+        self.lobby.close()
+        self.assertTrue(finished.is_set())
+        self.assertTrue(self.lobby.join(Player(id=2)).is_set())
+
+
+if __name__ == '__main__':
+    unittest.main()
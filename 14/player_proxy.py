@@ -1,4 +1,7 @@
+import socket
 from convert import *
+from stream_decoder import StreamDecoder, ReadTimeout
+from proxy_metrics import ProxyMetrics
 from time import *
 
 
@@ -7,25 +10,54 @@ class PlayerProxy(object):
     Filters JSON messages from the client to the server
     Uses Dealer to generate responses and sends them back to client
     """
-    def __init__(self, id, handler):
+    def __init__(self, id, handler, decoder=False, time_out=TIMEOUT, features=()):
         """
         Creates a PlayerProxy
         :param id: String representing the client's chosen username
         :param handler: Request Handler used to send messages to client
+        :param decoder: StreamDecoder already reading the client's connection, or False to start one
+        :param time_out: Number of seconds the client has to answer each request. A client that does not answer
+                         in time raises ReadTimeout, and the Dealer removes it as a cheater.
+        :param features: List of the protocol extensions in FEATURES agreed with the client at sign-up. With
+                         PIPELINE its state comes together with the choose request, and with DELTA each feeding
+                         request after the first carries only what changed since the client's last answer.
         :return: PlayerProxy object
         """
         self.id = id
         self.handler = handler
+        self.decoder = decoder if decoder else StreamDecoder(handler.request)
+        self.time_out = time_out
+        self.choice_pending = False
+        self.choice_sent_at = False
+        self.choice_deadline = False
+        self.pipeline = PIPELINE in features
+        self.pending_state = False
+        self.delta = DELTA in features
+        self.feed_base = False
+        self.metrics = ProxyMetrics(id)
+
+    def close(self):
+        """
+        Cuts the connection to the client, so that any exchange in progress with it fails
+        """
+        try:
+            self.handler.request.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
 
     def start(self, watering_hole, player_state):
         """
-        Sends the watering hole and player information in json to the proxy dealer
+        Sends the watering hole and player information in json to the proxy dealer. A pipelined client gets it
+        in the same message as the next choose request instead.
         :param watering_hole: Natural representing food currently at the watering hole
         :param player_state: PlayerState for the external player
         """
         json_player = player_state.convert_to_state_json()
         state = [watering_hole] + json_player
-        self.handler.request.sendall(json.dumps(state))
+        if self.pipeline:
+            self.pending_state = state
+        else:
+            self.send(state)
 
     def choose(self, left_players, right_players):
         """
@@ -35,14 +67,32 @@ class PlayerProxy(object):
         :param right_players: List of PlayerState for players to the right of the choosing player
         :return Action4 representing the players choices
         """
+        if not self.choice_pending:
+            self.request_choice(left_players, right_players)
+        self.choice_pending = False
+        return self.receive(CHOOSE, self.choice_sent_at, Convert.json_to_action4, self.choice_deadline)
+
+    def request_choice(self, left_players, right_players):
+        """
+        Sends the all_players in json to the proxy dealer without waiting for the answer, so that the Dealer can
+        ask every player before collecting their answers with choose. The client has time_out seconds from now.
+        :param left_players: List of PlayerState for players to the left of the choosing player
+        :param right_players: List of PlayerState for players to the right of the choosing player
+        """
         json_all_players = Convert.players_to_all_json(left_players, right_players)
-        self.handler.request.sendall(json.dumps(json_all_players))
-        json_action4 = Convert.listen(self.handler.request)
-        return Convert.json_to_action4(json_action4)
+        if self.pending_state:
+            message = [START_CHOOSE, self.pending_state, json_all_players]
+            self.pending_state = False
+        else:
+            message = json_all_players
+        self.choice_sent_at = self.send(message)
+        self.choice_pending = True
+        self.choice_deadline = self.choice_sent_at + self.time_out if self.time_out else False
 
     def next_feeding(self, player_state, watering_hole, all_players):
         """
-        Sends a game state JSON representation to the proxy dealer and awaits the feeding choice.
+        Sends a game state JSON representation to the proxy dealer and awaits the feeding choice. A client that
+        agreed to DELTA gets only the changes since the state it last answered, unless the opponents have changed.
         Converts the json result into a Feeding and returns it to the internal Dealer.
         :param player_state: Player_State for the external player
         :param watering_hole: Nat representing the food on the watering hole
@@ -50,6 +100,48 @@ class PlayerProxy(object):
         :return Feeding_Choice representing the players feeding choice
         """
         json_game_state = Convert.gamestate_to_json(player_state, watering_hole, all_players)
-        self.handler.request.sendall(json.dumps(json_game_state))
-        json_feeding = Convert.listen(self.handler.request)
-        return Convert.json_to_feeding_choice(json_feeding)
+        names = [player.name for player in all_players]
+        if self.feed_base and self.feed_base[0] == names:
+            message = Convert.gamestate_to_delta_json(self.feed_base[1], json_game_state)
+        else:
+            message = json_game_state
+        feeding = self.receive(FEED, self.send(message), Convert.json_to_feeding_choice)
+        if self.delta:
+            self.feed_base = (names, json_game_state)
+        return feeding
+
+# ======================================  Messages ==========================================
+
+    def send(self, message):
+        """
+        :effect Sends a JSON message to the client and counts its bytes
+        :param message: JSON value to send
+        :return: Number representing the time.time() the message was sent
+        """
+        data = json.dumps(message)
+        self.handler.request.sendall(data)
+        self.metrics.sent(len(data))
+        return time()
+
+    def receive(self, kind, sent_at, convert, deadline=False):
+        """
+        Reads and converts the client's answer to a request, recording the round-trip, or the timeout or failure
+        :param kind: String naming the request, CHOOSE or FEED
+        :param sent_at: Number representing the time.time() the request was sent
+        :param convert: Function converting the JSON answer
+        :param deadline: Number representing the time.time() by which the answer must arrive, or False to allow
+                         time_out seconds from now
+        :return: the converted answer
+        :raise ReadTimeout if the answer does not arrive in time, or any error raised reading or converting it
+        """
+        received = self.decoder.received
+        try:
+            answer = convert(self.decoder.read(self.time_out, deadline))
+        except ReadTimeout:
+            self.metrics.timed_out()
+            raise
+        except Exception:
+            self.metrics.failed()
+            raise
+        self.metrics.answered(kind, time() - sent_at, self.decoder.received - received)
+        return answer
@@ -0,0 +1,118 @@
+import unittest
+import socket
+import sys
+import json
+import threading
+
+from player_proxy import PlayerProxy
+from dealer_proxy import DealerProxy
+from stream_decoder import StreamDecoder, ReadTimeout
+from convert import Convert
+from dealer.player import Player
+from dealer.player_state import PlayerState
+from dealer.species import Species
+from dealer.traitcard import TraitCard
+from dealer.globals import *
+
+
+class Handler(object):
+    """
+    Stands in for the server's request handler, holding the connection to the client
+    """
+    def __init__(self, request):
+        self.request = request
+
+
+class TestPlayerProxy(unittest.TestCase):
+
+    def setUp(self):
+        (self.server, self.client) = socket.socketpair()
+        self.hand = [TraitCard(CARNIVORE, 3), TraitCard(BURROWING, 2), TraitCard(HORNS, 0), TraitCard(FORAGING, 1)]
+        self.player = PlayerState(1, 2, self.hand, [Species(1, 0, 2, [TraitCard(COOPERATION, 1)])])
+        self.other = PlayerState(2, False, False, [Species(3, 1, 3, [TraitCard(FATTISSUE, 2)], 0)])
+        self.client_decoder = StreamDecoder(self.client)
+
+    def tearDown(self):
+        self.server.close()
+        self.client.close()
+
+    def test_original_protocol(self):
+        proxy = PlayerProxy(1, Handler(self.server))
+        proxy.start(5, self.player)
+        proxy.request_choice([], [self.other])
+        self.assertEqual(self.client_decoder.read(1), [5] + self.player.convert_to_state_json())
+        self.assertEqual(self.client_decoder.read(1), [[], [self.other.convert_to_boards_json()]])
+
+    def test_pipeline(self):
+        proxy = PlayerProxy(1, Handler(self.server), features=[PIPELINE])
+        proxy.start(5, self.player)
+        proxy.request_choice([], [self.other])
+        self.server.shutdown(socket.SHUT_WR)
+        message = self.client_decoder.read(1)
+        self.assertEqual(message, [START_CHOOSE, [5] + self.player.convert_to_state_json(),
+                                   [[], [self.other.convert_to_boards_json()]]])
+
+        self.assertEqual(DealerProxy.message_type(message), START_CHOOSE)
+        reply = DealerProxy(Player(), self.client, self.client_decoder).start_choose(message)
+        self.client.sendall(json.dumps(reply))
+        action4 = proxy.choose([], [self.other])
+        expected = Player(player_state=self.player).choose([], [self.other])
+        self.assertEqual(action4.convert_to_json(), expected.convert_to_json())
+
+    def test_delta(self):
+        proxy = PlayerProxy(1, Handler(self.server), features=[DELTA])
+        self.client.sendall("false false false")
+        proxy.next_feeding(self.player, 5, [self.other])
+        self.other.species[0].food = 2
+        self.other.species.append(Species(1, 0, 1, []))
+        proxy.next_feeding(self.player, 4, [self.other])
+        proxy.next_feeding(self.player, 4, [self.player, self.other])
+        first = self.client_decoder.read(1)
+        self.assertEqual(first, Convert.gamestate_to_json(self.player, 5, [PlayerState(2, False, False, [
+            Species(3, 1, 3, [TraitCard(FATTISSUE, 2)], 0)])]))
+        delta = self.client_decoder.read(1)
+        self.assertEqual(delta[0], FEED_DELTA)
+        self.assertEqual(delta[2], [1, []])
+        self.assertEqual(len(delta[5][0][1]), 2)
+        self.assertEqual(Convert.apply_gamestate_delta(first, delta),
+                         Convert.gamestate_to_json(self.player, 4, [self.other]))
+        self.assertEqual(self.client_decoder.read(1),
+                         Convert.gamestate_to_json(self.player, 4, [self.player, self.other]))
+        self.assertEqual(proxy.metrics.latency[FEED].count, 3)
+        self.assertEqual(proxy.metrics.bytes_in, len("false false false"))
+        self.assertEqual(proxy.metrics.bytes_out, len(json.dumps(first) + json.dumps(delta)) +
+                         len(json.dumps(Convert.gamestate_to_json(self.player, 4, [self.player, self.other]))))
+
+    def test_timeout(self):
+        proxy = PlayerProxy(1, Handler(self.server), time_out=0.1)
+        proxy.start(5, self.player)
+        self.assertRaises(ReadTimeout, proxy.choose, [], [self.other])
+        self.client.sendall("[1, 2]")
+        self.assertRaises(ValueError, proxy.choose, [], [self.other])
+        self.assertEqual([proxy.metrics.timeouts, proxy.metrics.failures], [1, 1])
+        self.assertEqual(proxy.metrics.latency, {})
+
+    def test_long_game(self):
+        turns = 2 * sys.getrecursionlimit()
+        state = json.dumps([5] + self.player.convert_to_state_json())
+        all_players = json.dumps([[], [self.other.convert_to_boards_json()]])
+        game_state = json.dumps(Convert.gamestate_to_json(self.player, 5, [self.other]))
+        writer = threading.Thread(target=self.server.sendall, args=((state + all_players + game_state) * turns,))
+        writer.start()
+        reader = StreamDecoder(self.server)
+        replies = []
+        dealer_proxy = DealerProxy(Player(), self.client, self.client_decoder)
+        client = threading.Thread(target=dealer_proxy.run)
+        client.start()
+        for i in range(2 * turns):
+            replies.append(reader.read(5))
+        writer.join()
+        self.server.shutdown(socket.SHUT_WR)
+        client.join(5)
+        self.assertFalse(client.is_alive())
+        self.assertEqual(replies[:2], [Player(player_state=self.player).choose([], [self.other]).convert_to_json(),
+                                       0])
+
+
+if __name__ == '__main__':
+    unittest.main()
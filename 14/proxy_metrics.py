@@ -0,0 +1,191 @@
+import json
+import os
+import threading
+from dealer.globals import *
+
+
+class LatencyHistogram(object):
+    """
+    Counts round-trip latencies in fixed buckets, so that any number of them take constant space
+    """
+    def __init__(self):
+        """
+        Creates an empty LatencyHistogram
+        :return: a LatencyHistogram object
+        """
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        """
+        :effect Counts one latency in the first bucket whose bound it does not exceed
+        :param seconds: Number of seconds the round-trip took
+        """
+        milliseconds = 1000 * seconds
+        i = 0
+        while i < len(LATENCY_BUCKETS) and milliseconds > LATENCY_BUCKETS[i]:
+            i += 1
+        self.buckets[i] += 1
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+
+    def convert_to_json(self):
+        """
+        :return: JSON object with the count, mean and max in milliseconds, and the count in each bucket keyed
+                 by its upper bound in milliseconds
+        """
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["inf"]
+        return {"count": self.count,
+                "mean_ms": self.total / self.count if self.count else 0.0,
+                "max_ms": self.max,
+                "buckets": dict(zip(bounds, self.buckets))}
+
+
+class ProxyMetrics(object):
+    """
+    Records a PlayerProxy's exchanges with its client: the latency of each kind of request, the bytes sent and
+    received, and the requests that timed out or failed. The game's thread records them while the stats thread
+    converts them, so both hold this ProxyMetrics' lock.
+    """
+    def __init__(self, name):
+        """
+        Creates ProxyMetrics
+        :param name: String representing the client's username
+        :return: a ProxyMetrics object
+        """
+        self.name = name
+        self.lock = threading.Lock()
+        self.latency = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.ejected = False
+
+    def sent(self, size):
+        """
+        :effect Counts the bytes of a message sent to the client
+        :param size: Natural representing the length of the message in bytes
+        """
+        with self.lock:
+            self.bytes_out += size
+
+    def answered(self, kind, seconds, size):
+        """
+        :effect Records the round-trip of a request the client answered
+        :param kind: String naming the request, CHOOSE or FEED
+        :param seconds: Number of seconds from sending the request to reading the answer
+        :param size: Natural representing the bytes received while reading the answer
+        """
+        with self.lock:
+            if kind not in self.latency:
+                self.latency[kind] = LatencyHistogram()
+            self.latency[kind].record(seconds)
+            self.bytes_in += size
+
+    def timed_out(self):
+        """
+        :effect Counts a request the client did not answer in time
+        """
+        with self.lock:
+            self.timeouts += 1
+
+    def failed(self):
+        """
+        :effect Counts a request the client answered with something other than a valid message
+        """
+        with self.lock:
+            self.failures += 1
+
+    def mark_ejected(self):
+        """
+        :effect Records that the Dealer removed this proxy's player from its game
+        """
+        with self.lock:
+            self.ejected = True
+
+    def convert_to_json(self):
+        """
+        :return: JSON object with every metric of this proxy
+        """
+        with self.lock:
+            return {"name": self.name,
+                    "latency": dict((kind, self.latency[kind].convert_to_json()) for kind in self.latency),
+                    "bytes_out": self.bytes_out,
+                    "bytes_in": self.bytes_in,
+                    "timeouts": self.timeouts,
+                    "failures": self.failures,
+                    "ejected": self.ejected}
+
+
+class ServerMetrics(object):
+    """
+    Collects the ProxyMetrics of every game the server plays, keeping the games in progress and the most
+    recent finished ones, and dumps them as JSON for monitoring
+    """
+    def __init__(self, kept_games=METRICS_GAMES):
+        """
+        Creates ServerMetrics
+        :param kept_games: Natural representing how many finished games to keep
+        :return: a ServerMetrics object
+        """
+        self.kept_games = kept_games
+        self.lock = threading.Lock()
+        self.games = {}
+        self.finished = []
+        self.games_played = 0
+        self.ejections = 0
+
+    def start_game(self, table_number, proxies):
+        """
+        :effect Starts following the exchanges of a game's players
+        :param table_number: Natural+ numbering the table
+        :param proxies: List of the table's external players. Those without metrics, such as local Players,
+                        are left out.
+        """
+        with self.lock:
+            self.games[table_number] = [proxy for proxy in proxies if hasattr(proxy, 'metrics')]
+
+    def end_game(self, table_number, remaining):
+        """
+        :effect Marks the players of a finished game who were removed from it as ejected
+        :param table_number: Natural+ numbering the table
+        :param remaining: List of the external players still in the game when it ended
+        """
+        with self.lock:
+            proxies = self.games.pop(table_number, [])
+            for proxy in proxies:
+                if not any([player is proxy for player in remaining]):
+                    proxy.metrics.mark_ejected()
+                    self.ejections += 1
+            self.games_played += 1
+            self.finished.append((table_number, proxies))
+            self.finished = self.finished[-self.kept_games:]
+
+    def convert_to_json(self):
+        """
+        :return: JSON object with totals over every game played and the metrics of each kept game
+        """
+        with self.lock:
+            games = [(table_number, proxies, False) for (table_number, proxies) in sorted(self.games.items())]
+            games += [(table_number, proxies, True) for (table_number, proxies) in self.finished]
+            return {"games_played": self.games_played,
+                    "ejections": self.ejections,
+                    "games": [{"table": table_number,
+                               "finished": finished,
+                               "players": [proxy.metrics.convert_to_json() for proxy in proxies]}
+                              for (table_number, proxies, finished) in games]}
+
+    def dump(self, path):
+        """
+        :effect Writes these metrics to the given JSON file, replacing it in one step so that a reader never
+                sees a partial file
+        :param path: String representing the file path
+        """
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w") as stats_file:
+            json.dump(self.convert_to_json(), stats_file)
+        os.rename(temporary_path, path)
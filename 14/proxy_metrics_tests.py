@@ -0,0 +1,83 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+
+from proxy_metrics import LatencyHistogram, ProxyMetrics, ServerMetrics
+from dealer.globals import *
+
+
+class MeteredPlayer(object):
+    """
+    Stands in for a PlayerProxy, carrying only its metrics
+    """
+    def __init__(self, name):
+        self.metrics = ProxyMetrics(name)
+
+
+class TestProxyMetrics(unittest.TestCase):
+
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        for seconds in [0.0005, 0.001, 0.003, 0.003, 7]:
+            histogram.record(seconds)
+        json_histogram = histogram.convert_to_json()
+        self.assertEqual(json_histogram["count"], 5)
+        self.assertEqual(json_histogram["max_ms"], 7000)
+        self.assertEqual(json_histogram["buckets"]["1"], 2)
+        self.assertEqual(json_histogram["buckets"]["5"], 2)
+        self.assertEqual(json_histogram["buckets"]["inf"], 1)
+        self.assertEqual(sum(json_histogram["buckets"].values()), 5)
+
+    def test_proxy_metrics(self):
+        metrics = ProxyMetrics("jake")
+        metrics.sent(100)
+        metrics.answered(CHOOSE, 0.01, 40)
+        metrics.answered(FEED, 0.02, 2)
+        metrics.answered(FEED, 0.04, 2)
+        metrics.timed_out()
+        json_metrics = metrics.convert_to_json()
+        self.assertEqual([json_metrics["bytes_out"], json_metrics["bytes_in"]], [100, 44])
+        self.assertEqual(json_metrics["latency"][FEED]["count"], 2)
+        self.assertAlmostEqual(json_metrics["latency"][FEED]["mean_ms"], 30)
+        self.assertEqual([json_metrics["timeouts"], json_metrics["failures"]], [1, 0])
+        self.assertFalse(json_metrics["ejected"])
+        metrics.mark_ejected()
+        self.assertTrue(metrics.convert_to_json()["ejected"])
+
+    def test_concurrent_recording(self):
+        metrics = ProxyMetrics("jake")
+        kinds = ["kind%d" % i for i in range(5000)]
+        recorder = threading.Thread(target=lambda: [metrics.answered(kind, 0.01, 1) for kind in kinds])
+        recorder.start()
+        while recorder.is_alive():
+            metrics.convert_to_json()
+        recorder.join()
+        self.assertEqual(len(metrics.convert_to_json()["latency"]), len(kinds))
+
+    def test_server_metrics(self):
+        server_metrics = ServerMetrics(kept_games=1)
+        players = [MeteredPlayer("a"), MeteredPlayer("b"), object()]
+        server_metrics.start_game(1, players)
+        server_metrics.start_game(2, [MeteredPlayer("c")])
+        self.assertEqual(len(server_metrics.convert_to_json()["games"]), 2)
+        server_metrics.end_game(1, [players[0]])
+        self.assertEqual([players[0].metrics.ejected, players[1].metrics.ejected], [False, True])
+        server_metrics.end_game(2, [])
+
+        (handle, path) = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            server_metrics.dump(path)
+            with open(path) as stats_file:
+                stats = json.load(stats_file)
+        finally:
+            os.remove(path)
+        self.assertEqual([stats["games_played"], stats["ejections"]], [2, 2])
+        self.assertEqual([game["table"] for game in stats["games"]], [2])
+        self.assertTrue(stats["games"][0]["finished"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+import errno
+import json
+import re
+import socket
+import struct
+import time
+from collections import deque
+from dealer.globals import *
+
+NON_SPACE = re.compile(r'\S')
+TOKENS = re.compile(r'[\[\]{}"]')
+STRING_TOKENS = re.compile(r'["\\]')
+SCALAR_CHARS = re.compile(r'[-+.\w]*')
+LENGTH_HEADER = struct.Struct("!I")
+
+
+class ReadTimeout(Exception):
+    """
+    Raised when a message does not arrive within the time allowed for it
+    """
+    pass
+
+
+class StreamDecoder(object):
+    """
+    Decodes the JSON messages arriving on one connection. Bytes left over after a message are kept for the
+    next read, so messages sent back to back are never lost, and each byte received is scanned only once.
+    Messages are either concatenated JSON values, as in the remote protocol, or framed one per line or
+    behind a length prefix.
+    A number or literal at the end of the bytes received may go on in the next read, so between concatenated
+    values it is held back until a delimiter follows it, the connection closes, or nothing more arrives within
+    SCALAR_GRACE. A scalar whose pieces are sent further apart than that is still decoded as two messages; only
+    framing removes that limit.
+    """
+    def __init__(self, socket, recv_size=RECV_SIZE, framing=False):
+        """
+        Creates a StreamDecoder
+        :param socket: Socket on which messages arrive
+        :param recv_size: Natural+ representing the most bytes to receive at once
+        :param framing: NEWLINE_FRAMING, LENGTH_FRAMING, or False for concatenated JSON values
+        :return: a StreamDecoder object
+        """
+        self.socket = socket
+        self.recv_size = recv_size
+        self.framing = framing
+        self.messages = deque()
+        self.received = 0
+        self.buffer = ""
+        self.scan = 0
+        self.depth = 0
+        self.in_string = False
+
+    def read(self, time_out=TIMEOUT, deadline=False):
+        """
+        Gives the next message from the connection, waiting for it to arrive if necessary. The time allowed
+        covers the whole message, however many pieces it arrives in.
+        :param time_out: Number of seconds to wait before giving up, or False to wait until a message arrives
+        :param deadline: Number representing the time.time() by which the message must have arrived, instead
+                         of time_out. Bytes that arrived before the deadline are read even after it has passed.
+        :return: the next complete JSON message, or "" if the connection was closed
+        :raise ReadTimeout if the message does not arrive in time
+        :raise ValueError if the client sent something that is not JSON
+        """
+        if not deadline and time_out:
+            deadline = time.time() + time_out
+        while not self.messages:
+            held = self.holds_scalar()
+            wait = max(deadline - time.time(), 0.0) if deadline else None
+            if held:
+                wait = SCALAR_GRACE if wait is None else min(wait, SCALAR_GRACE)
+            self.socket.settimeout(wait)
+            try:
+                data = self.socket.recv(self.recv_size)
+            except socket.timeout:
+                data = False
+            except socket.error as error:
+                if error.errno not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    raise
+                data = False
+            finally:
+                if wait is not None:
+                    self.socket.settimeout(None)
+            if data is False:
+                if not held:
+                    raise ReadTimeout("no message in time")
+                self.flush()
+            elif not data:
+                self.flush()
+                return self.messages.popleft() if self.messages else ""
+            else:
+                self.received += len(data)
+                self.feed(data)
+        return self.messages.popleft()
+
+    def feed(self, data):
+        """
+        :effect Decodes every message completed by the given bytes and queues it to be read
+        :param data: String of bytes received from the connection
+        :raise ValueError if the bytes are not a stream of JSON messages
+        """
+        self.buffer += data
+        if self.framing == NEWLINE_FRAMING:
+            self.split_lines()
+        elif self.framing == LENGTH_FRAMING:
+            self.split_lengths()
+        else:
+            self.split_values()
+
+    def holds_scalar(self):
+        """
+        Determines if the buffer ends in a number or literal held back in case more of it arrives
+        :return: True if a scalar is held back, else False
+        """
+        return not self.framing and self.depth == 0 and not self.in_string and bool(self.buffer.strip())
+
+    def flush(self):
+        """
+        :effect Queues the scalar held back at the end of the buffer, if any, as a complete message
+        :raise ValueError if the held bytes are not a JSON value
+        """
+        if self.holds_scalar():
+            self.messages.append(json.loads(self.buffer))
+            self.buffer = ""
+            self.scan = 0
+
+    def encode(self, message):
+        """
+        Encodes a message in this decoder's framing, so that the decoder at the other end can read it
+        :param message: JSON value to send
+        :return: String of bytes
+        """
+        data = json.dumps(message)
+        if self.framing == NEWLINE_FRAMING:
+            return data + "\n"
+        elif self.framing == LENGTH_FRAMING:
+            return LENGTH_HEADER.pack(len(data)) + data
+        return data
+
+# ======================================  Framing ==========================================
+
+    def split_lines(self):
+        """
+        :effect Decodes each complete line in the buffer, keeping the last, incomplete line
+        """
+        lines = self.buffer.split("\n")
+        self.buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                self.messages.append(json.loads(line))
+
+    def split_lengths(self):
+        """
+        :effect Decodes each complete length-prefixed message in the buffer, keeping the rest
+        """
+        start = 0
+        while len(self.buffer) - start >= LENGTH_HEADER.size:
+            (length,) = LENGTH_HEADER.unpack_from(self.buffer, start)
+            end = start + LENGTH_HEADER.size + length
+            if end > len(self.buffer):
+                break
+            self.messages.append(json.loads(self.buffer[start + LENGTH_HEADER.size:end]))
+            start = end
+        self.buffer = self.buffer[start:]
+
+    def split_values(self):
+        """
+        :effect Decodes each complete JSON value in the buffer, keeping the rest. Tracks bracket depth and string
+                state between calls, so only newly received bytes are scanned. A scalar running to the end of the
+                buffer is kept, as it may go on in the next bytes.
+        """
+        buffer, start = self.buffer, 0
+        while self.scan < len(buffer):
+            if self.depth == 0 and not self.in_string:
+                match = NON_SPACE.search(buffer, self.scan)
+                if not match:
+                    self.scan = len(buffer)
+                    break
+                start = self.scan = match.start()
+                if buffer[start] not in '[{"':
+                    if SCALAR_CHARS.match(buffer, start).end() == len(buffer):
+                        break
+                    (value, end) = json.JSONDecoder().raw_decode(buffer, start)
+                    self.messages.append(value)
+                    start = self.scan = end
+                    continue
+            match = (STRING_TOKENS if self.in_string else TOKENS).search(buffer, self.scan)
+            if not match:
+                self.scan = len(buffer)
+                break
+            token, self.scan = match.group(), match.end()
+            if self.in_string:
+                if token == '\\':
+                    self.scan += 1
+                    continue
+                self.in_string = False
+            elif token == '"':
+                self.in_string = True
+                continue
+            elif token in '[{':
+                self.depth += 1
+                continue
+            else:
+                self.depth -= 1
+                if self.depth < 0:
+                    raise ValueError("unbalanced JSON: " + buffer[start:self.scan])
+            if self.depth == 0 and not self.in_string:
+                self.messages.append(json.loads(buffer[start:self.scan]))
+                start = self.scan
+        self.buffer = buffer[start:]
+        self.scan -= start
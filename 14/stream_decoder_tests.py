@@ -0,0 +1,116 @@
+import unittest
+import socket
+import time
+
+from stream_decoder import StreamDecoder, ReadTimeout
+from dealer.globals import *
+
+
+class ChunkedSocket(object):
+    """
+    A socket that delivers the given chunks of bytes one recv at a time, then reports the connection closed
+    """
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def recv(self, size):
+        return self.chunks.pop(0) if self.chunks else ""
+
+    def settimeout(self, time_out):
+        pass
+
+
+class TestStreamDecoder(unittest.TestCase):
+
+    def test_pipelined(self):
+        decoder = StreamDecoder(ChunkedSocket(['"ok"[5, [1, 2], ', '[]][[1], [2]] 3 ']))
+        self.assertEqual(decoder.read(), "ok")
+        self.assertEqual(decoder.read(), [5, [1, 2], []])
+        self.assertEqual(decoder.read(), [[1], [2]])
+        self.assertEqual(decoder.read(), 3)
+        self.assertEqual(decoder.read(), "")
+
+    def test_split_messages(self):
+        message = '[3, "a ] \\" [", {"b": [false]}]'
+        decoder = StreamDecoder(ChunkedSocket([message[i] for i in range(len(message))] + ['fal', 'se']))
+        self.assertEqual(decoder.read(), [3, 'a ] " [', {"b": [False]}])
+        self.assertEqual(decoder.read(), False)
+        self.assertEqual(decoder.buffer, "")
+
+    def test_split_scalar(self):
+        decoder = StreamDecoder(False)
+        decoder.feed('[1] 1')
+        decoder.feed('2')
+        self.assertEqual(list(decoder.messages), [[1]])
+        decoder.feed('0 fal')
+        decoder.feed('se')
+        self.assertEqual(list(decoder.messages), [[1], 120])
+        decoder.flush()
+        self.assertEqual(list(decoder.messages), [[1], 120, False])
+        decoder = StreamDecoder(ChunkedSocket(['1', '2']))
+        self.assertEqual(decoder.read(), 12)
+        self.assertEqual(decoder.read(), "")
+
+    def test_scalar_grace(self):
+        (server, client) = socket.socketpair()
+        try:
+            decoder = StreamDecoder(server)
+            client.sendall('12')
+            start_time = time.time()
+            self.assertEqual(decoder.read(1), 12)
+            self.assertTrue(time.time() - start_time < 0.5)
+            self.assertEqual(server.gettimeout(), None)
+            client.sendall('3')
+            self.assertEqual(decoder.read(deadline=time.time() - 1), 3)
+            self.assertRaises(ReadTimeout, decoder.read, 0.05)
+        finally:
+            client.close()
+            server.close()
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, StreamDecoder(ChunkedSocket(['[1, 2]]'])).read)
+        self.assertRaises(ValueError, StreamDecoder(ChunkedSocket(['[1, 2 3]'])).read)
+        self.assertRaises(ValueError, StreamDecoder(ChunkedSocket(['nope '])).read)
+        self.assertRaises(ValueError, StreamDecoder(ChunkedSocket(['nope'])).read)
+
+    def test_timeout(self):
+        (server, client) = socket.socketpair()
+        try:
+            decoder = StreamDecoder(server)
+            start_time = time.time()
+            self.assertRaises(ReadTimeout, decoder.read, 0.2)
+            client.sendall('[1, 2')
+            self.assertRaises(ReadTimeout, decoder.read, 0.2)
+            self.assertTrue(time.time() - start_time < 1)
+            client.sendall(']')
+            self.assertEqual(decoder.read(0.2), [1, 2])
+            client.close()
+            self.assertEqual(decoder.read(False), "")
+        finally:
+            server.close()
+
+    def test_deadline(self):
+        (server, client) = socket.socketpair()
+        try:
+            decoder = StreamDecoder(server)
+            client.sendall('[1, 2]')
+            time.sleep(0.05)
+            self.assertEqual(decoder.read(deadline=time.time() - 1), [1, 2])
+            self.assertRaises(ReadTimeout, decoder.read, deadline=time.time() - 1)
+            self.assertRaises(ReadTimeout, decoder.read, deadline=time.time() + 0.1)
+            self.assertEqual(server.gettimeout(), None)
+        finally:
+            client.close()
+            server.close()
+
+    def test_framing(self):
+        for framing in [NEWLINE_FRAMING, LENGTH_FRAMING]:
+            encoder = StreamDecoder(False, framing=framing)
+            data = encoder.encode([1, "two\n"]) + encoder.encode("ok") + encoder.encode(3)
+            decoder = StreamDecoder(ChunkedSocket([data[:5], data[5:]]), framing=framing)
+            self.assertEqual([decoder.read(), decoder.read(), decoder.read()], [[1, "two\n"], "ok", 3])
+            self.assertEqual(decoder.read(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
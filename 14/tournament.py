@@ -0,0 +1,144 @@
+import time
+import traceback
+from multiprocessing import Pool, cpu_count
+from dealer.dealer import Dealer
+from dealer.player import Player
+from dealer.lookahead_player import LookaheadPlayer
+from dealer.globals import *
+
+STRATEGIES = {DEFAULT_STRATEGY: Player, LOOKAHEAD_STRATEGY: LookaheadPlayer}
+
+
+def play_game(game_spec):
+    """
+    Plays one complete, headless game of Evolution. Module level so that pool workers can receive it.
+    :param game_spec: (Natural, List of String) the game's seed and the strategy name of each seat
+    :return: (Natural, List of (Natural, Natural), False) the seed and the ordered (Player ID, score) tuples,
+             or (Natural, False, String) the seed and the traceback if the game could not be completed
+    """
+    seed, seat_strategies = game_spec
+    try:
+        loxp = [STRATEGIES[seat_strategies[x]](id=x + 1) for x in range(len(seat_strategies))]
+        dealer = Dealer.create_initial(loxp, seed, INCREMENTAL_VALIDATION)
+        dealer.run_game()
+        return (seed, dealer.compute_scores(), False)
+    except Exception:
+        return (seed, False, traceback.format_exc())
+
+
+class Tournament(object):
+    """
+    Plays many seeded games of Evolution across a pool of worker processes and aggregates their scores
+    """
+    def __init__(self, seat_strategies, num_games, base_seed=0, workers=False):
+        """
+        Creates a Tournament
+        :param seat_strategies: List of String naming the strategy in STRATEGIES played by each seat
+        :param num_games: Natural representing the number of games to play
+        :param base_seed: Natural seed of the first game; game i is played with seed base_seed + i
+        :param workers: Natural+ representing the number of worker processes, or False for one per core
+        :return: a Tournament object
+        """
+        self.seat_strategies = seat_strategies
+        self.num_games = num_games
+        self.base_seed = base_seed
+        self.workers = workers if workers else cpu_count()
+        self.results = []
+        self.elapsed = 0.0
+
+    def game_specs(self):
+        """
+        Gives the specification of every game in this Tournament
+        :return: List of (Natural, List of String) representing (seed, seat strategies)
+        """
+        return [(self.base_seed + i, self.seat_strategies) for i in range(self.num_games)]
+
+    def run(self):
+        """
+        Plays every game of this Tournament, sharding them over the worker pool in chunks
+        :effect: Records the result of each game and the wall-clock time taken to play them all
+        """
+        start_time = time.time()
+        if self.workers == 1:
+            self.results = [play_game(spec) for spec in self.game_specs()]
+        else:
+            pool = Pool(self.workers)
+            try:
+                chunksize = max(1, self.num_games / (self.workers * TASKS_PER_WORKER))
+                self.results = list(pool.imap_unordered(play_game, self.game_specs(), chunksize))
+            finally:
+                pool.close()
+                pool.join()
+        self.elapsed = time.time() - start_time
+
+    def completed_results(self):
+        """
+        Gives the scores of every game that was played to completion
+        :return: List of List of (Natural, Natural) representing ordered (Player ID, score) tuples
+        """
+        return [scores for (seed, scores, error) in self.results if scores is not False]
+
+    def failed_seeds(self):
+        """
+        Gives the seeds of every game that could not be completed, so they can be replayed
+        :return: List of Natural
+        """
+        return [seed for (seed, error) in self.failures()]
+
+    def failures(self):
+        """
+        Gives the seed and traceback of every game that could not be completed, so they can be replayed
+        :return: List of (Natural, String) ordered by seed
+        """
+        return sorted([(seed, error) for (seed, scores, error) in self.results if scores is False])
+
+    def win_rates(self):
+        """
+        Computes the fraction of completed games won by each seat. Tied winners split the win.
+        :return: Dictionary {Natural: Number} mapping Player ID to win-rate
+        """
+        wins = dict((x + 1, 0.0) for x in range(len(self.seat_strategies)))
+        completed = self.completed_results()
+        for scores in completed:
+            if not scores:
+                continue
+            winners = [player_id for (player_id, score) in scores if score == scores[0][1]]
+            for player_id in winners:
+                wins[player_id] += 1.0 / len(winners)
+        return dict((player_id, wins[player_id] / max(1, len(completed))) for player_id in wins)
+
+    def mean_scores(self):
+        """
+        Computes the mean score of each seat over completed games. Seats removed for cheating score 0.
+        :return: Dictionary {Natural: Number} mapping Player ID to mean score
+        """
+        totals = dict((x + 1, 0.0) for x in range(len(self.seat_strategies)))
+        completed = self.completed_results()
+        for scores in completed:
+            for (player_id, score) in scores:
+                totals[player_id] += score
+        return dict((player_id, totals[player_id] / max(1, len(completed))) for player_id in totals)
+
+    def games_per_second(self):
+        """
+        Gives the throughput of the last run of this Tournament
+        :return: Number representing games played per second
+        """
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    def render_report(self):
+        """
+        Renders the win-rate / mean-score table ordered by descending win-rate, followed by throughput and the
+        seed and traceback of each failed game
+        :return: String representation of the Tournament results
+        """
+        win_rates, mean_scores = self.win_rates(), self.mean_scores()
+        ranking = sorted(win_rates, key=lambda player_id: (-win_rates[player_id], -mean_scores[player_id],
+                                                           player_id))
+        report = [RATE_TEMPLATE % (i + 1, ranking[i], self.seat_strategies[ranking[i] - 1],
+                                   win_rates[ranking[i]], mean_scores[ranking[i]])
+                  for i in range(len(ranking))]
+        report.append(THROUGHPUT_TEMPLATE % (len(self.results), len(self.failed_seeds()), self.elapsed,
+                                             self.games_per_second(), self.workers))
+        report += [FAILURE_TEMPLATE % (seed, error) for (seed, error) in self.failures()]
+        return "\n".join(report)
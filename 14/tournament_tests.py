@@ -0,0 +1,51 @@
+import unittest
+import sys
+
+from tournament import Tournament, play_game
+from dealer.globals import *
+
+
+class TestTournament(unittest.TestCase):
+
+    def setUp(self):
+        self.seats = [DEFAULT_STRATEGY] * 4
+        self.tournament = Tournament(self.seats, 6, base_seed=10, workers=1)
+
+    def test_headless(self):
+        self.assertNotIn('Tkinter', sys.modules)
+
+    def test_play_game(self):
+        (seed, scores, error) = play_game((3, self.seats))
+        self.assertEqual(seed, 3)
+        self.assertEqual(sorted([player_id for (player_id, score) in scores]), [1, 2, 3, 4])
+        self.assertEqual(error, False)
+        self.assertEqual(play_game((3, self.seats)), (seed, scores, error))
+        (seed, scores, error) = play_game((3, ["unknown"] * 4))
+        self.assertEqual((seed, scores), (3, False))
+        self.assertIn("KeyError: 'unknown'", error)
+
+    def test_game_specs(self):
+        self.assertEqual(self.tournament.game_specs()[0], (10, self.seats))
+        self.assertEqual(self.tournament.game_specs()[-1], (15, self.seats))
+
+    def test_aggregates(self):
+        self.tournament.results = [(0, [(2, 5), (1, 3), (3, 1), (4, 0)], False),
+                                   (1, [(1, 4), (3, 4), (2, 0), (4, 0)], False),
+                                   (2, False, "Traceback")]
+        self.assertEqual(self.tournament.failed_seeds(), [2])
+        self.assertEqual(self.tournament.failures(), [(2, "Traceback")])
+        self.assertIn("Game with seed 2 failed:\nTraceback", self.tournament.render_report())
+        self.assertEqual(self.tournament.win_rates(), {1: 0.25, 2: 0.5, 3: 0.25, 4: 0.0})
+        self.assertEqual(self.tournament.mean_scores(), {1: 3.5, 2: 2.5, 3: 2.5, 4: 0.0})
+
+    def test_run_pool(self):
+        self.tournament.run()
+        pooled = Tournament(self.seats, 6, base_seed=10, workers=2)
+        pooled.run()
+        self.assertEqual(sorted(pooled.results), sorted(self.tournament.results))
+        self.assertEqual(pooled.win_rates(), self.tournament.win_rates())
+        self.assertTrue(pooled.games_per_second() > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,14 +30,86 @@ class Stack(object):
         self.total_bull = sum([card.bull for card in self.list_of_cards])
 
 
+class Deck(object):
+    """
+    Represents the Dealer's deck of Cards. Cards are drawn by advancing a cursor over a fixed list,
+    so drawing never shifts or copies the cards left in the deck.
+    """
+    def __init__(self, cards=False):
+        """
+        Creates a Deck
+        :param cards: List of Card in draw order, the first card being the top of the deck
+        :return: a Deck object
+        """
+        self.cards = cards if cards else []
+        self.top = 0
+
+    def __len__(self):
+        """
+        Gives the number of cards left to draw from this Deck
+        :return: Natural
+        """
+        return len(self.cards) - self.top
+
+    def __iter__(self):
+        """
+        Iterates over the cards left in this Deck, from the top
+        :return: iterator of Card
+        """
+        for i in xrange(self.top, len(self.cards)):
+            yield self.cards[i]
+
+    def remaining(self):
+        """
+        Gives the number of cards left to draw from this Deck
+        :return: Natural
+        """
+        return len(self)
+
+    def draw(self, amount=1):
+        """
+        Draws the given amount of cards from the top of this Deck, stopping short if it runs out
+        :param amount: Natural specifying how many cards to draw
+        :return: List of Card in draw order
+        """
+        end = min(self.top + amount, len(self.cards))
+        drawn = self.cards[self.top:end]
+        self.top = end
+        return drawn
+
+    def shuffle(self, rng):
+        """
+        Shuffles the cards left in this Deck
+        :param rng: the Random used to shuffle
+        :effect: Reorders the remaining cards and discards those already drawn
+        """
+        self.cards = self.cards[self.top:]
+        self.top = 0
+        rng.shuffle(self.cards)
+
+    def convert_to_json(self):
+        """
+        Converts the cards left in this Deck into [face value, bull] pairs
+        :return: List of [Natural, Natural]
+        """
+        return [[card.face_value, card.bull] for card in self]
+
+
 class Dealer(object):
-    def __init__(self, list_of_players, starting_player=0):
+    def __init__(self, list_of_players, starting_player=0, seed=False):
+        """
+        Creates a dealer whose deck is built and shuffled by its own random number generator, so that
+        games created with the same seed are identical
+        :param seed: the seed of the random number generator, or False to choose one at random
+        """
         self.list_of_players = list_of_players
-        self.deck = []
+        self.deck = Deck()
         self.discards = {}
         self.list_of_stacks = []
         self.bull_range = bull_range
         self.starting_player = starting_player
+        self.seed = seed if seed is not False else random.randint(0, sys.maxint)
+        self.rng = random.Random(self.seed)
 
     def make_deck(self):
         """
@@ -45,10 +117,10 @@ class Dealer(object):
         """
         deck = []
         for x in range(1, deck_size + 1):
-            bull = random.choice(self.bull_range)
+            bull = self.rng.choice(self.bull_range)
             card = Card(face_value=x, bull=bull)
             deck.append(card)
-        self.deck = deck
+        self.deck = Deck(deck)
 
     def deal(self):
         """
@@ -58,9 +130,7 @@ class Dealer(object):
             player.hand = []
         for x in range(self.starting_player, self.starting_player + len(self.list_of_players)):
             player_index = x % len(self.list_of_players)
-            cards_dealt = self.deck[0:initial_hand_size]
-            self.list_of_players[player_index].hand += cards_dealt
-            self.deck = self.deck[initial_hand_size:len(self.deck)]
+            self.list_of_players[player_index].hand += self.deck.draw(initial_hand_size)
 
     def create_stack(self, card):
         """
@@ -73,10 +143,8 @@ class Dealer(object):
         """
         Creates four initial stacks with one card each from the deck at the start of a round
         """
-        stack_cards = self.deck[0:4]
-        for stack_card in stack_cards:
+        for stack_card in self.deck.draw(4):
             self.list_of_stacks.append(self.create_stack(stack_card))
-        self.deck = self.deck[4:len(self.deck)]
 
     def collect_discards(self):
         """
@@ -179,19 +247,21 @@ class Dealer(object):
             self.collect_discards()
             self.fix_stacks()
             self.make_deck()
-            random.shuffle(self.deck)
+            self.deck.shuffle(self.rng)
 
 
 
-def main(n, starting_player=0):
+def main(n, starting_player=0, seed=False):
     """
     Creates n players and a dealer, and has the dealer run a 6 Nimmit! game
     :param n: the number of players in the game
     :param starting_player; the index of the starting player
+    :param seed: the seed of the dealer's random number generator, or False to choose one at random
     :return:
     """
     n = int(n)
     starting_player = int(starting_player)
+    seed = int(seed) if seed is not False else False
     if n > deck_size / initial_hand_size:
         raise RuntimeError("Not enough cards in deck for %d players! Select less than %d players."
                            % (n, deck_size / initial_hand_size))
@@ -201,17 +271,19 @@ def main(n, starting_player=0):
     for x in range(0, n):
         player = Player(name=x)
         players.append(player)
-    dealer = Dealer(list_of_players=players, starting_player=starting_player)
+    dealer = Dealer(list_of_players=players, starting_player=starting_player, seed=seed)
     dealer.make_deck()
     result = dealer.play_game()
     print result
+    print "seed: %d" % dealer.seed
 
 if __name__ == "__main__":
     args = sys.argv
-    if len(args) > 3:
-        raise RuntimeError("Too many args given, main only accepts number of players (n), bull point value")
+    if len(args) > 4:
+        raise RuntimeError("Too many args given, main only accepts number of players (n), the starting player "
+                           "and an optional seed")
     elif len(args) < 3:
         raise RuntimeError("Must supply number of players between 1 and %d, bull point range and the "
                            "starting player to main" % ((deck_size - 4) / initial_hand_size))
-    elif len(args) == 3:
-        main(args[1], args[2])
+    else:
+        main(*args[1:])
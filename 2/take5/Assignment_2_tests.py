@@ -1,5 +1,5 @@
 import unittest
-from Assignment_2 import Card, Stack, Dealer, Player
+from Assignment_2 import Card, Stack, Deck, Dealer, Player
 
 
 class Test_Assignment_2(unittest.TestCase):
@@ -24,6 +24,14 @@ class Test_Assignment_2(unittest.TestCase):
         self.assertEqual(self.stack_1.list_of_cards, [self.card_8, self.card_9])
         self.assertEqual(self.stack_1.total_bull, 5)
 
+    def test_deck(self):
+        deck = Deck([self.card_8, self.card_9, self.card_10])
+        self.assertEqual(deck.draw(2), [self.card_8, self.card_9])
+        self.assertEqual(deck.remaining(), 1)
+        self.assertEqual(deck.convert_to_json(), [[10, 4]])
+        self.assertEqual(deck.draw(2), [self.card_10])
+        self.assertEqual(len(deck), 0)
+
     def test_make_deck(self):
         self.dealer.make_deck()
         self.assertEqual(len(self.dealer.deck), 104)
@@ -31,6 +39,17 @@ class Test_Assignment_2(unittest.TestCase):
             self.assertIn(card.face_value, range(1, 105))
             self.assertIn(card.bull, range(2, 8))
 
+    def test_seeded_deck(self):
+        dealer_1 = Dealer([self.player_1, self.player_2], seed=5)
+        dealer_2 = Dealer([self.player_1, self.player_2], seed=5)
+        dealer_1.make_deck()
+        dealer_2.make_deck()
+        dealer_1.deck.shuffle(dealer_1.rng)
+        dealer_2.deck.shuffle(dealer_2.rng)
+        self.assertEqual([(card.face_value, card.bull) for card in dealer_1.deck],
+                         [(card.face_value, card.bull) for card in dealer_2.deck])
+        self.assertEqual(dealer_1.seed, 5)
+
     def test_deal(self):
         self.dealer.make_deck()
         self.dealer.deal()